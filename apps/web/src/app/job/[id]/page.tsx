@@ -3,8 +3,8 @@
 import { useEffect, useState, useCallback, use } from "react";
 import { useRouter } from "next/navigation";
 import { Suspense } from "react";
-import { getJob, getEvents } from "@/lib/api";
-import type { JobResponse, EventsListResponse } from "@/lib/api";
+import { getJob, getEvents, subscribeJobProgress } from "@/lib/api";
+import type { JobResponse, EventsListResponse, JobProgressEvent } from "@/lib/api";
 import { ProcessingStepper } from "@/components/ProcessingStepper";
 import { SkeletonTimeline } from "@/components/SkeletonTimeline";
 import { JobReview } from "@/components/JobReview";
@@ -14,6 +14,7 @@ export default function JobPage({ params }: { params: Promise<{ id: string }> })
   const router = useRouter();
   const [job, setJob] = useState<JobResponse | null>(null);
   const [events, setEvents] = useState<EventsListResponse | null>(null);
+  const [progress, setProgress] = useState<JobProgressEvent | null>(null);
   const [error, setError] = useState<string | null>(null);
 
   const fetchJob = useCallback(async () => {
@@ -48,12 +49,25 @@ export default function JobPage({ params }: { params: Promise<{ id: string }> })
       } else if (data?.status === "failed" && interval) clearInterval(interval);
     };
     poll();
-    interval = setInterval(poll, 2000);
+    // Live progress is pushed over server-sent events; poll only if the stream is unavailable
+    const unsubscribe = subscribeJobProgress(
+      jobId,
+      (event) => {
+        if (!mounted) return;
+        // Keep earlier details (page count) as later stages arrive
+        setProgress((prev) => (prev ? { ...prev, ...event } : event));
+        if (event.stage === "done" || event.stage === "failed") poll();
+      },
+      () => {
+        if (mounted && !interval) interval = setInterval(poll, 2000);
+      }
+    );
     return () => {
       mounted = false;
+      unsubscribe();
       if (interval) clearInterval(interval);
     };
-  }, [fetchJob, fetchEvents]);
+  }, [jobId, fetchJob, fetchEvents]);
 
   if (error) {
     return (
@@ -82,7 +96,7 @@ export default function JobPage({ params }: { params: Promise<{ id: string }> })
   if (isProcessing || job.status === "failed") {
     return (
       <div className="space-y-6">
-        <ProcessingStepper job={job} onRetry={() => router.push("/")} />
+        <ProcessingStepper job={job} progress={progress} onRetry={() => router.push("/")} />
         {isProcessing && <SkeletonTimeline />}
       </div>
     );
@@ -1,9 +1,10 @@
 "use client";
 
-import type { JobResponse } from "@/lib/api";
+import type { JobProgressEvent, JobResponse } from "@/lib/api";
 
 interface Props {
   job: JobResponse;
+  progress?: JobProgressEvent | null;
   onRetry?: () => void;
 }
 
@@ -30,8 +31,37 @@ function getActiveStep(status: JobResponse["status"]): number {
   }
 }
 
-export function ProcessingStepper({ job, onRetry }: Props) {
-  const activeStep = getActiveStep(job.status);
+/** Finer step from a live progress event, when one has arrived. */
+function getProgressStep(progress: JobProgressEvent): number | null {
+  switch (progress.stage) {
+    case "extracting":
+      return 1;
+    case "pages":
+      return 2;
+    case "candidates":
+    case "assembled":
+    case "llm":
+      return 3;
+    default:
+      return null;
+  }
+}
+
+function describeProgress(progress: JobProgressEvent): string | null {
+  const parts: string[] = [];
+  if (progress.pages != null) {
+    parts.push(`${progress.pages} page${progress.pages === 1 ? "" : "s"} extracted`);
+    if (progress.ocr_pages) parts.push(`${progress.ocr_pages} via OCR`);
+  }
+  if (progress.candidates != null) parts.push(`${progress.candidates} dates found`);
+  if (progress.events != null) parts.push(`${progress.events} events`);
+  return parts.length ? parts.join(" · ") : null;
+}
+
+export function ProcessingStepper({ job, progress, onRetry }: Props) {
+  const progressStep = progress && job.status !== "failed" ? getProgressStep(progress) : null;
+  const activeStep = progressStep ?? getActiveStep(job.status);
+  const progressDetail = progress ? describeProgress(progress) : null;
   const isFailed = job.status === "failed";
   const isDone = job.status === "needs_review" || job.status === "ready";
 
@@ -104,9 +134,11 @@ export function ProcessingStepper({ job, onRetry }: Props) {
         <div className="flex items-center gap-3">
           <div className="h-5 w-5 animate-spin rounded-full border-2 border-primary-200 border-t-primary-600" />
           <p className="text-sm text-surface-600 dark:text-surface-300">
-            {job.status === "queued"
-              ? "Your file is in the queue and will be processed shortly."
-              : "Extracting dates from your syllabus. This usually takes a few seconds..."}
+            {progressDetail
+              ? `${progressDetail}...`
+              : job.status === "queued" && progressStep == null
+                ? "Your file is in the queue and will be processed shortly."
+                : "Extracting dates from your syllabus. This usually takes a few seconds..."}
           </p>
         </div>
       )}
@@ -64,10 +64,33 @@ export interface JobResponse {
   error_message: string | null;
   event_count: number;
   needs_attention_count: number;
+  category_counts: Record<string, number>;
   created_at: string;
   updated_at: string;
 }
 
+/** Pipeline progress event from GET /api/job/{id}/progress (server-sent events). */
+export interface JobProgressEvent {
+  job_id: string;
+  stage:
+    | "queued"
+    | "processing"
+    | "extracting"
+    | "pages"
+    | "candidates"
+    | "assembled"
+    | "llm"
+    | "done"
+    | "failed";
+  status: JobResponse["status"];
+  ts: number;
+  pages?: number;
+  ocr_pages?: number;
+  candidates?: number;
+  events?: number;
+  error?: string | null;
+}
+
 export interface EventResponse {
   id: string;
   job_id: string;
@@ -95,6 +118,18 @@ export interface NeedsAttention {
 export interface EventsListResponse {
   events: EventResponse[];
   needs_attention: NeedsAttention;
+  category_counts: Record<string, number>;
+  next_cursor: string | null;
+}
+
+/** Optional paging/filtering for getEvents. Omit everything to get every event. */
+export interface EventsQuery {
+  limit?: number;
+  cursor?: string;
+  /** Return only these fields (id is always included); e.g. skip source_excerpt. */
+  fields?: (keyof EventResponse)[];
+  category?: string;
+  needs_attention?: boolean;
 }
 
 export interface EventUpdate {
@@ -119,6 +154,9 @@ export function uploadFileWithProgress(
   return new Promise((resolve, reject) => {
     const formData = new FormData();
     formData.append("file", file);
+    // When the API extracts inline (no worker), return as soon as the job exists;
+    // the job page follows progress like any queued job
+    formData.append("background", "true");
 
     const xhr = new XMLHttpRequest();
     const timeoutId = setTimeout(() => {
@@ -188,8 +226,38 @@ export async function getJob(jobId: string): Promise<JobResponse> {
   return res.json();
 }
 
-export async function getEvents(jobId: string): Promise<EventsListResponse> {
-  const res = await fetch(`${getApiBaseUrl()}/api/job/${jobId}/events`);
+/**
+ * Subscribe to a job's progress stream. Returns a function that closes it.
+ * onError is called if the stream cannot be opened (e.g. an older API), so the
+ * caller can fall back to polling getJob.
+ */
+export function subscribeJobProgress(
+  jobId: string,
+  onProgress: (event: JobProgressEvent) => void,
+  onError?: () => void
+): () => void {
+  const source = new EventSource(`${getApiBaseUrl()}/api/job/${jobId}/progress`);
+  source.onmessage = (message) => {
+    const event = JSON.parse(message.data) as JobProgressEvent;
+    onProgress(event);
+    if (event.stage === "done" || event.stage === "failed") source.close();
+  };
+  source.onerror = () => {
+    // EventSource reconnects by itself while the stream is open; give up only if it was closed
+    if (source.readyState === EventSource.CLOSED) onError?.();
+  };
+  return () => source.close();
+}
+
+export async function getEvents(jobId: string, query: EventsQuery = {}): Promise<EventsListResponse> {
+  const params = new URLSearchParams();
+  if (query.limit) params.set("limit", String(query.limit));
+  if (query.cursor) params.set("cursor", query.cursor);
+  if (query.fields?.length) params.set("fields", query.fields.join(","));
+  if (query.category) params.set("category", query.category);
+  if (query.needs_attention) params.set("needs_attention", "true");
+  const qs = params.toString();
+  const res = await fetch(`${getApiBaseUrl()}/api/job/${jobId}/events${qs ? `?${qs}` : ""}`);
   if (!res.ok) {
     throw new Error("Failed to fetch events");
   }
@@ -199,7 +267,7 @@ export async function getEvents(jobId: string): Promise<EventsListResponse> {
 export async function updateEvents(
   jobId: string,
   updates: EventUpdate[]
-): Promise<{ updated: number; deleted: number }> {
+): Promise<{ updated: number; deleted: number; not_found: string[] }> {
   const res = await fetch(`${getApiBaseUrl()}/api/job/${jobId}/events`, {
     method: "PUT",
     headers: { "Content-Type": "application/json" },
@@ -0,0 +1,84 @@
+"""Benchmark persisting a job's events: per-object session.add vs one bulk INSERT.
+
+Inserts N synthetic event drafts into a throwaway SQLite database (or
+DATABASE_URL_SYNC, if set) and commits, once through the ORM unit of work and
+once through the worker's _insert_events (session.execute(insert(Event), rows)).
+Reports the best of several runs.
+
+Run: python benchmark_event_insert.py [events] [runs]
+"""
+
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+_here = os.path.dirname(os.path.abspath(__file__))
+_root = os.path.join(_here, "..", "..", "..")
+sys.path[:0] = [os.path.join(_here, ".."), os.path.join(_root, "services", "worker")]
+os.environ.setdefault("DATABASE_URL_SYNC", f"sqlite:///{tempfile.mkdtemp()}/benchmark.db")
+os.environ.setdefault("REDIS_URL", "memory://")
+
+from shared.schemas import EventDraft  # noqa: E402
+from worker_app import tasks  # noqa: E402  (adds services/api to sys.path)
+
+from app.database import Base  # noqa: E402
+from app.models import Event, Job  # noqa: E402
+
+
+def make_drafts(n):
+    return [
+        EventDraft(
+            title=f"Homework {i} due",
+            date=date(2026, 1, 12) + timedelta(days=i % 120),
+            category="assignment",
+            confidence=0.8,
+            source_page=1 + i // 40,
+            source_excerpt=f"Week {i // 5}: Homework {i} due at the start of class" * 3,
+            source_kind="pdf_text",
+        )
+        for i in range(n)
+    ]
+
+
+def per_object(session, job_id, drafts):
+    for draft in drafts:
+        session.add(Event(
+            id=draft.id, job_id=job_id, title=draft.title, description=draft.description,
+            date=draft.date, all_day=draft.all_day, category=draft.category,
+            confidence=draft.confidence, source_page=draft.source_page,
+            source_excerpt=draft.source_excerpt, source_kind=draft.source_kind,
+            is_ambiguous=draft.is_ambiguous,
+        ))
+
+
+def timed(insert, n):
+    session = tasks._SessionLocal()
+    try:
+        job = Job(id=uuid.uuid4(), status="processing", original_filename="bench.pdf", upload_path="/bench")
+        session.add(job)
+        session.commit()
+        drafts = make_drafts(n)
+        start = time.perf_counter()
+        insert(session, job.id, drafts)
+        job.status = "ready"
+        session.commit()
+        return time.perf_counter() - start
+    finally:
+        session.close()
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    runs = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    Base.metadata.create_all(tasks._engine)
+    print(f"{n} events, best of {runs} (insert + commit)")
+    for label, insert in (("per-object session.add", per_object), ("bulk insert", tasks._insert_events)):
+        best = min(timed(insert, n) for _ in range(runs))
+        print(f"  {label:24s} {best * 1000:7.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Benchmark GET /api/job/{job_id}/events: the full list, one page, and a projection.
+
+Seeds one job with N events (400-character excerpts) in a throwaway SQLite
+database and sends requests from concurrent clients through the API in-process,
+reporting throughput, latency and response size for each variant. Uses the
+seeding and load helpers of benchmark_job_polling.py.
+
+To compare before and after a change, run it against each checkout (a tree
+without pagination ignores limit and fields, so every variant is the full list):
+    git worktree add /tmp/before <commit>^
+    API_DIR=/tmp/before/services/api python benchmark_event_listing.py
+
+Run: python benchmark_event_listing.py [events] [requests] [concurrency]
+"""
+
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+
+from benchmark_job_polling import load, seed
+
+_here = os.path.dirname(os.path.abspath(__file__))
+
+VARIANTS = (
+    ("full list", ""),
+    ("limit=50", "?limit=50"),
+    ("5 fields", "?fields=title,date,category,confidence,is_ambiguous"),
+)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else 500
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+
+    tmp = tempfile.mkdtemp()
+    os.environ.update(
+        DATABASE_URL=f"sqlite+aiosqlite:///{tmp}/benchmark.db",
+        DATABASE_URL_SYNC=f"sqlite:///{tmp}/benchmark.db",
+        UPLOAD_DIR=os.path.join(tmp, "uploads"),
+        RUN_EXTRACTION_INLINE="true",
+        INLINE_WORKERS="0",
+    )
+    api_dir = os.environ.get("API_DIR", os.path.join(_here, "..", "..", "..", "services", "api"))
+    sys.path[:0] = [os.path.abspath(api_dir), os.path.join(_here, "..")]
+
+    import httpx
+
+    from app.database import async_session, init_db
+    from app.main import app
+    from app.models import Event, Job
+
+    async def run():
+        await init_db()
+        job_id = await seed(async_session, Job, Event, n)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            print(f"GET /events, {n} events, {concurrency} clients")
+            for label, query in VARIANTS:
+                path = f"/api/job/{job_id}/events{query}"
+                size = len((await client.get(path)).content)  # also the warm-up
+                rate, latencies = await load(client, path, total, concurrency)
+                print(
+                    f"  {label:10s} {rate:5.0f} req/s, p50 {statistics.median(latencies):6.1f} ms, "
+                    f"{size / 1024:6.1f} KB"
+                )
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Benchmark bulk event edits: PUT /api/job/{job_id}/events.
+
+For each size, seeds a job with that many events in a throwaway SQLite
+database and sends one review-style edit through the API in-process (httpx
+ASGI transport): every tenth event deleted, the rest retitled and
+recategorised. Reports the request time and the SQL statements it ran.
+LATENCY_MS adds a simulated network round trip to every statement.
+
+To compare before and after a change, run it against each checkout:
+    git worktree add /tmp/before <commit>^
+    API_DIR=/tmp/before/services/api python benchmark_event_update.py
+
+Run: [LATENCY_MS=1] python benchmark_event_update.py [size ...]
+"""
+
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date
+
+_here = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10, 100, 1000]
+    rtt = float(os.environ.get("LATENCY_MS", "0")) / 1000
+
+    tmp = tempfile.mkdtemp()
+    os.environ.update(
+        DATABASE_URL=f"sqlite+aiosqlite:///{tmp}/benchmark.db",
+        DATABASE_URL_SYNC=f"sqlite:///{tmp}/benchmark.db",
+        UPLOAD_DIR=os.path.join(tmp, "uploads"),
+        RUN_EXTRACTION_INLINE="true",
+        INLINE_WORKERS="0",
+    )
+    api_dir = os.environ.get("API_DIR", os.path.join(_here, "..", "..", "..", "services", "api"))
+    sys.path[:0] = [os.path.abspath(api_dir), os.path.join(_here, "..")]
+
+    import httpx
+    from sqlalchemy import event
+
+    from app.database import async_session, engine, init_db
+    from app.main import app
+    from app.models import Event, Job
+
+    statements = 0
+
+    def before_execute(*args):
+        nonlocal statements
+        statements += 1
+        if rtt:
+            time.sleep(rtt)  # runs in the driver's thread, like waiting on the network
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_execute)
+
+    async def edit(client, n):
+        """Seed a job with n events and edit them all in one request; returns (ms, statements, body)."""
+        nonlocal statements
+        job_id = uuid.uuid4()
+        ids = [uuid.uuid4() for _ in range(n)]
+        async with async_session() as db:
+            db.add(Job(id=job_id, status="needs_review", original_filename="bench.pdf", upload_path="/bench"))
+            db.add_all(
+                Event(id=event_id, job_id=job_id, title=f"Event {i}", date=date(2026, 2, 1), confidence=0.5)
+                for i, event_id in enumerate(ids)
+            )
+            await db.commit()
+        updates = [
+            {"id": str(event_id), "delete": True} if i % 10 == 0
+            else {"id": str(event_id), "title": f"Reviewed {i}", "category": "exam"}
+            for i, event_id in enumerate(ids)
+        ]
+        statements = 0
+        start = time.perf_counter()
+        response = await client.put(f"/api/job/{job_id}/events", json={"updates": updates})
+        elapsed = (time.perf_counter() - start) * 1000
+        assert response.status_code == 200, response.text
+        return elapsed, statements, response.json()
+
+    async def run():
+        await init_db()
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            await edit(client, 10)  # warm-up
+            print(f"90% edits, 10% deletes, {rtt * 1000:g} ms per statement")
+            for n in sizes:
+                elapsed, count, body = await edit(client, n)
+                print(
+                    f"  {n:5d} edits: {elapsed:7.0f} ms, {count:5d} statements "
+                    f"(updated {body['updated']}, deleted {body['deleted']})"
+                )
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
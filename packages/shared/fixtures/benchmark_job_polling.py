@@ -0,0 +1,119 @@
+"""Benchmark polling GET /api/job/{job_id} (the job page's status poll).
+
+Seeds one job with N events in a throwaway SQLite database and sends requests
+from concurrent clients through the API in-process (httpx ASGI transport).
+LATENCY_MS adds a simulated network round trip to every SQL statement, since
+the number of statements per request is what the aggregate summary query
+changes; statements per request are reported too.
+
+To compare before and after a change, run it against each checkout:
+    git worktree add /tmp/before <commit>^
+    API_DIR=/tmp/before/services/api python benchmark_job_polling.py
+
+Run: [LATENCY_MS=1] python benchmark_job_polling.py [events] [requests] [concurrency]
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+
+_here = os.path.dirname(os.path.abspath(__file__))
+CATEGORIES = ["exam", "assignment", "reading", "holiday", "other"]
+
+
+async def seed(async_session, Job, Event, n):
+    rng = random.Random(0)
+    job_id = uuid.uuid4()
+    async with async_session() as db:
+        db.add(Job(id=job_id, status="processing", original_filename="bench.pdf", upload_path="/bench"))
+        db.add_all(
+            Event(
+                job_id=job_id, title=f"Event {i}", date=date(2026, 1, 12) + timedelta(days=i % 120),
+                category=rng.choice(CATEGORIES), confidence=rng.random(), is_ambiguous=rng.random() < 0.1,
+                source_excerpt="x" * 400,
+            )
+            for i in range(n)
+        )
+        await db.commit()
+    return job_id
+
+
+async def load(client, path, total, concurrency):
+    """Send total GETs, concurrency at a time; returns (req/s, sorted latencies in ms)."""
+    latencies = []
+    gate = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with gate:
+            start = time.perf_counter()
+            response = await client.get(path)
+            latencies.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    return total / (time.perf_counter() - start), sorted(latencies)
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    total = int(sys.argv[2]) if len(sys.argv) > 2 else 1000
+    concurrency = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    rtt = float(os.environ.get("LATENCY_MS", "0")) / 1000
+
+    tmp = tempfile.mkdtemp()
+    os.environ.update(
+        DATABASE_URL=f"sqlite+aiosqlite:///{tmp}/benchmark.db",
+        DATABASE_URL_SYNC=f"sqlite:///{tmp}/benchmark.db",
+        UPLOAD_DIR=os.path.join(tmp, "uploads"),
+        RUN_EXTRACTION_INLINE="true",
+        INLINE_WORKERS="0",
+    )
+    api_dir = os.environ.get("API_DIR", os.path.join(_here, "..", "..", "..", "services", "api"))
+    sys.path[:0] = [os.path.abspath(api_dir), os.path.join(_here, "..")]
+
+    import httpx
+    from sqlalchemy import event
+
+    from app.database import async_session, engine, init_db
+    from app.main import app
+    from app.models import Event, Job
+
+    statements = 0
+
+    def before_execute(*args):
+        nonlocal statements
+        statements += 1
+        if rtt:
+            time.sleep(rtt)  # runs in the driver's thread, like waiting on the network
+
+    event.listen(engine.sync_engine, "before_cursor_execute", before_execute)
+
+    async def run():
+        nonlocal statements
+        await init_db()
+        job_id = await seed(async_session, Job, Event, n)
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+            path = f"/api/job/{job_id}"
+            await client.get(path)  # warm-up
+            statements = 0
+            rate, latencies = await load(client, path, total, concurrency)
+        p99 = latencies[max(0, int(len(latencies) * 0.99) - 1)]
+        print(
+            f"GET /job, {n} events, {concurrency} clients, {rtt * 1000:g} ms per statement: "
+            f"{rate:.0f} req/s, p50 {statistics.median(latencies):.1f} ms, p99 {p99:.1f} ms, "
+            f"{statements / total:.1f} statements/request"
+        )
+
+    asyncio.run(run())
+
+
+if __name__ == "__main__":
+    main()
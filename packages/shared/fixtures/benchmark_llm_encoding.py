@@ -0,0 +1,87 @@
+"""Benchmark LLM request encoding on the fixture syllabi.
+
+Compares the compact encoding (shared contexts sent once, minified JSON) with the
+previous per-candidate indent=2 encoding: estimated prompt tokens and encode time
+per document. With LLM_API_KEY set, also times live classification requests
+using the compact encoding (LLM_BASE_URL may point at a stub or proxy).
+
+Run: python benchmark_llm_encoding.py [syllabus.pdf ...]
+"""
+
+import glob
+import json
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from shared.extraction.date_finder import find_date_candidates  # noqa: E402
+from shared.extraction.llm_classifier import (  # noqa: E402
+    CONTEXT_LIMIT,
+    SYSTEM_PROMPT,
+    chunk_candidates,
+    classify_with_llm_sync,
+    encode_candidates,
+    estimate_tokens,
+    llm_options_from_env,
+)
+from shared.extraction.text_extractor import extract_text  # noqa: E402
+
+REPEAT = 200
+
+
+def encode_per_candidate(candidates):
+    """The previous encoding: one indented object per candidate, context repeated."""
+    return json.dumps([
+        {
+            "index": i,
+            "date": c.date.isoformat(),
+            "raw_match": c.raw_match,
+            "context": c.context[:CONTEXT_LIMIT],
+            "page": c.page,
+        }
+        for i, c in enumerate(candidates)
+    ], indent=2)
+
+
+def measure(encode, chunks):
+    """(estimated prompt tokens summed over chunks, mean encode time in ms)."""
+    tokens = sum(estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(encode(chunk)) for chunk in chunks)
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        for chunk in chunks:
+            encode(chunk)
+    elapsed_ms = (time.perf_counter() - start) * 1000 / REPEAT
+    return tokens, elapsed_ms
+
+
+def benchmark(path):
+    candidates = find_date_candidates(extract_text(path), filename=os.path.basename(path))
+    chunks = [chunk for _, chunk in chunk_candidates(candidates)]
+    contexts = len({c.context[:CONTEXT_LIMIT] for c in candidates})
+
+    old_tokens, old_ms = measure(encode_per_candidate, chunks)
+    new_tokens, new_ms = measure(encode_candidates, chunks)
+    reduction = 100 * (1 - new_tokens / old_tokens) if old_tokens else 0.0
+
+    print(f"{os.path.basename(path)}: {len(candidates)} candidates, {contexts} unique contexts, {len(chunks)} chunk(s)")
+    print(f"  per-candidate: ~{old_tokens} prompt tokens, {old_ms:.3f} ms to encode")
+    print(f"  compact:       ~{new_tokens} prompt tokens, {new_ms:.3f} ms to encode ({reduction:.1f}% fewer tokens)")
+
+    api_key = os.environ.get("LLM_API_KEY", "")
+    if api_key:
+        start = time.perf_counter()
+        results = classify_with_llm_sync(
+            candidates,
+            provider=os.environ.get("LLM_PROVIDER", "openai"),
+            api_key=api_key,
+            **{**llm_options_from_env(), "cache": None},
+        )
+        print(f"  live request:  {len(results)} classifications in {time.perf_counter() - start:.2f} s")
+
+
+if __name__ == "__main__":
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "*.pdf")))
+    for path in paths:
+        benchmark(path)
@@ -0,0 +1,53 @@
+"""Benchmark the LLM stage offline with the local provider.
+
+Times classify_with_llm_sync on the fixture syllabi with injected provider
+latency, across concurrency levels and with a cold and warm cache. Fault
+injection is read from the environment (LLM_LOCAL_ERROR_RATE,
+LLM_LOCAL_TRUNCATE_RATE, LLM_LOCAL_SEED); see shared/extraction/llm_local.py.
+
+Run: LLM_LOCAL_LATENCY_MS=200 python benchmark_llm_stage.py [syllabus.pdf ...]
+"""
+
+import glob
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+from shared.extraction.date_finder import find_date_candidates  # noqa: E402
+from shared.extraction.llm_cache import SQLiteLLMCache  # noqa: E402
+from shared.extraction.llm_classifier import classify_with_llm_sync  # noqa: E402
+from shared.extraction.text_extractor import extract_text  # noqa: E402
+
+CHUNK_SIZE = 5
+CONCURRENCY_LEVELS = (1, 2, 4, 8)
+
+
+def timed(candidates, **options):
+    start = time.perf_counter()
+    results = classify_with_llm_sync(candidates, provider="local", api_key="", chunk_size=CHUNK_SIZE, **options)
+    return time.perf_counter() - start, len(results)
+
+
+def benchmark(path):
+    candidates = find_date_candidates(extract_text(path), filename=os.path.basename(path))
+    print(f"{os.path.basename(path)}: {len(candidates)} candidates, chunk size {CHUNK_SIZE}")
+
+    for concurrency in CONCURRENCY_LEVELS:
+        elapsed, classified = timed(candidates, max_concurrency=concurrency)
+        print(f"  concurrency {concurrency}: {elapsed:.3f} s, {classified} classified")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = SQLiteLLMCache(os.path.join(tmp, "llm_cache.db"))
+        cold, _ = timed(candidates, cache=cache)
+        warm, classified = timed(candidates, cache=cache)
+        print(f"  cache: cold {cold:.3f} s, warm {warm:.3f} s, {classified} classified")
+
+
+if __name__ == "__main__":
+    os.environ.setdefault("LLM_LOCAL_LATENCY_MS", "200")
+    paths = sys.argv[1:] or sorted(glob.glob(os.path.join(os.path.dirname(os.path.abspath(__file__)), "*.pdf")))
+    for path in paths:
+        benchmark(path)
@@ -0,0 +1,88 @@
+"""Benchmark POST /api/upload latency when the Celery broker is unreachable.
+
+Starts the API in-process (TestClient) against a throwaway SQLite database,
+with REDIS_URL pointing at a broker that is either hung (a TCP listener that
+accepts connections and never answers) or refused (nothing listening), and
+times sequential uploads of the synthetic syllabus. Uploads fall back to
+inline extraction either way; the difference is what the broker costs first.
+
+To compare before and after a change, run it against each checkout:
+    git worktree add /tmp/before <commit>^
+    API_DIR=/tmp/before/services/api python benchmark_upload_latency.py hung
+
+Run: python benchmark_upload_latency.py [hung|refused] [uploads]
+"""
+
+import os
+import socket
+import statistics
+import sys
+import tempfile
+import threading
+import time
+
+_here = os.path.dirname(os.path.abspath(__file__))
+FIXTURE = os.path.join(_here, "synthetic_syllabus.pdf")
+
+
+def hung_broker() -> int:
+    """Listen on a free port, accept connections and never answer; returns the port."""
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(128)
+    held = []
+
+    def accept():
+        while True:
+            conn, _ = server.accept()
+            held.append(conn)
+
+    threading.Thread(target=accept, daemon=True).start()
+    return server.getsockname()[1]
+
+
+def refused_port() -> int:
+    """A port with nothing listening on it."""
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def main():
+    mode = sys.argv[1] if len(sys.argv) > 1 else "hung"
+    uploads = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+    port = hung_broker() if mode == "hung" else refused_port()
+
+    tmp = tempfile.mkdtemp()
+    os.environ.update(
+        DATABASE_URL=f"sqlite+aiosqlite:///{tmp}/benchmark.db",
+        DATABASE_URL_SYNC=f"sqlite:///{tmp}/benchmark.db",
+        UPLOAD_DIR=os.path.join(tmp, "uploads"),
+        REDIS_URL=f"redis://127.0.0.1:{port}/0",
+    )
+    # Extract in a thread so the timings are the broker's cost plus extraction, not pool start-up
+    os.environ.setdefault("INLINE_WORKERS", "0")
+    api_dir = os.environ.get("API_DIR", os.path.join(_here, "..", "..", "..", "services", "api"))
+    sys.path[:0] = [os.path.abspath(api_dir), os.path.join(_here, "..")]
+
+    from fastapi.testclient import TestClient
+
+    from app.main import app
+
+    with open(FIXTURE, "rb") as f:
+        pdf = f.read()
+    times = []
+    with TestClient(app) as client:
+        client.post("/api/upload", files={"file": ("s.pdf", pdf, "application/pdf")})  # warm-up
+        for _ in range(uploads):
+            start = time.perf_counter()
+            response = client.post("/api/upload", files={"file": ("s.pdf", pdf, "application/pdf")})
+            times.append((time.perf_counter() - start) * 1000)
+            assert response.status_code == 200, response.text
+    times.sort()
+    p99 = times[max(0, int(len(times) * 0.99) - 1)]
+    print(f"{mode} broker, {uploads} uploads: p50 {statistics.median(times):.0f} ms, p99 {p99:.0f} ms, max {times[-1]:.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -14,6 +14,7 @@ setup(
         "icalendar>=5.0",
         "Pillow>=10.0",
         "pydantic>=2.5",
+        "numpy>=1.24",
     ],
     python_requires=">=3.11",
 )
@@ -0,0 +1,127 @@
+"""Cheap job cost estimates from the raw upload, used to pick a scheduling lane.
+
+Only the raw bytes are inspected (no parsing library, no rendering):
+
+- PDF: page count from the trailer's /Root -> /Pages /Count, and a likely-scanned
+  flag when the file has image XObjects but no fonts (OCR is the expensive path).
+  Fonts may be hidden in compressed object streams, so such files are never
+  flagged as scanned.
+- DOCX: a single section, scaled by size
+- Images: always OCR
+
+The per-page weights are rough seconds on one worker process. Jobs record the
+estimate next to the measured pipeline time so the weights can be recalibrated.
+"""
+
+from __future__ import annotations
+
+import mmap
+import os
+import re
+from dataclasses import dataclass
+from typing import Optional
+
+# Seconds per unit of work (calibrate against jobs.estimated_seconds / jobs.actual_seconds)
+BASE_SECONDS = 0.2
+TEXT_PAGE_SECONDS = 0.05
+OCR_PAGE_SECONDS = 3.0
+DOCX_SECONDS_PER_MB = 1.0
+# PDFs whose page tree cannot be read (e.g. compressed object streams)
+FALLBACK_BYTES_PER_PAGE = 100_000
+
+DEFAULT_FAST_LANE_MAX_SECONDS = 10.0
+
+FAST_LANE = "fast"
+SLOW_LANE = "slow"
+
+_TRAILER_ROOT_RE = re.compile(rb"/Root\s+(\d+)\s+\d+\s+R")
+_PAGES_REF_RE = re.compile(rb"/Pages\s+(\d+)\s+\d+\s+R")
+_COUNT_RE = re.compile(rb"/Count\s+(\d+)")
+_PAGES_DICT_COUNT_RE = re.compile(rb"/Type\s*/Pages\b[^>]*?/Count\s+(\d+)", re.DOTALL)
+_PAGE_RE = re.compile(rb"/Type\s*/Page\b")
+_IMAGE_RE = re.compile(rb"/Subtype\s*/Image\b")
+_FONT_RE = re.compile(rb"/Type\s*/Font\b")
+_OBJSTM_RE = re.compile(rb"/Type\s*/ObjStm\b")
+
+
+@dataclass(frozen=True)
+class CostEstimate:
+    file_type: str
+    size_bytes: int
+    pages: int
+    likely_scanned: bool
+    seconds: float
+
+    def lane(self, fast_lane_max_seconds: float = DEFAULT_FAST_LANE_MAX_SECONDS) -> str:
+        return FAST_LANE if self.seconds <= fast_lane_max_seconds else SLOW_LANE
+
+
+def estimate_cost(filename: str, data: bytes) -> CostEstimate:
+    """Estimate processing time for an upload from its name and bytes (or an mmap)."""
+    file_type = os.path.splitext(filename)[1].lower().lstrip(".")
+    size = len(data)
+
+    if file_type == "pdf":
+        pages = pdf_page_count(data) or max(1, size // FALLBACK_BYTES_PER_PAGE)
+        scanned = pdf_likely_scanned(data)
+        per_page = OCR_PAGE_SECONDS if scanned else TEXT_PAGE_SECONDS
+        seconds = BASE_SECONDS + pages * per_page
+    elif file_type == "docx":
+        pages, scanned = 1, False
+        seconds = BASE_SECONDS + size / 1_000_000 * DOCX_SECONDS_PER_MB
+    else:
+        pages, scanned = 1, True
+        seconds = BASE_SECONDS + OCR_PAGE_SECONDS
+
+    return CostEstimate(
+        file_type=file_type or "unknown",
+        size_bytes=size,
+        pages=pages,
+        likely_scanned=scanned,
+        seconds=round(seconds, 2),
+    )
+
+
+def estimate_file_cost(filename: str, path: str) -> CostEstimate:
+    """estimate_cost() for a file on disk, memory-mapped rather than read into memory."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return estimate_cost(filename, b"")
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            return estimate_cost(filename, data)
+
+
+def pdf_page_count(data: bytes) -> Optional[int]:
+    """Page count from the document catalog, or None if the page tree isn't readable."""
+    roots = _TRAILER_ROOT_RE.findall(data[-4096:]) or _TRAILER_ROOT_RE.findall(data)
+    if roots:
+        catalog = _object_body(data, int(roots[-1]))
+        pages_ref = _PAGES_REF_RE.search(catalog) if catalog else None
+        if pages_ref:
+            page_tree = _object_body(data, int(pages_ref.group(1)))
+            count = _COUNT_RE.search(page_tree) if page_tree else None
+            if count:
+                return int(count.group(1))
+
+    # No usable trailer (e.g. incremental updates): the largest page tree node is the root
+    counts = [int(c) for c in _PAGES_DICT_COUNT_RE.findall(data)]
+    if counts:
+        return max(counts)
+    return len(_PAGE_RE.findall(data)) or None
+
+
+def pdf_likely_scanned(data: bytes) -> bool:
+    """True if the PDF embeds images but no fonts, i.e. text must come from OCR.
+
+    With compressed object streams (PDF 1.5+) the font dictionaries can't be
+    seen in the raw bytes while image stream dictionaries still can; that is
+    treated as unknown, i.e. not scanned.
+    """
+    if _OBJSTM_RE.search(data):
+        return False
+    return bool(_IMAGE_RE.search(data)) and not _FONT_RE.search(data)
+
+
+def _object_body(data: bytes, number: int) -> Optional[bytes]:
+    match = re.search(rb"(?<!\d)%d\s+\d+\s+obj(.*?)endobj" % number, data, re.DOTALL)
+    return match.group(1) if match else None
@@ -6,10 +6,11 @@ captures surrounding context, and handles year inference.
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import re
 from datetime import date, datetime
-from typing import Optional
+from typing import Callable, Optional
 
 import dateparser
 
@@ -95,6 +96,7 @@ def find_date_candidates(
             page=page.page,
             source_kind=page.source_kind,
             inferred_year=inferred_year,
+            row_lookup=_table_row_lookup(page),
         )
         candidates.extend(page_candidates)
 
@@ -149,16 +151,46 @@ def _scan_for_term_year(pages: list[PageText]) -> Optional[int]:
     return None
 
 
+def _table_row_lookup(page: PageText) -> Optional[Callable[[int], dict]]:
+    """Build an offset -> structured-row lookup for table pages with a detected header.
+
+    Table text has one line per TableRow, so the row for a match is found by
+    bisecting line start offsets. Returns None when there is nothing to attach.
+    """
+    if not page.rows or not any(t.columns for t in page.tables):
+        return None
+
+    line_starts = [0]
+    for i, ch in enumerate(page.text):
+        if ch == "\n":
+            line_starts.append(i + 1)
+    if len(line_starts) != len(page.rows):
+        return None  # text and rows out of sync; fall back to string heuristics
+
+    def lookup(offset: int) -> dict:
+        row = page.rows[bisect.bisect_right(line_starts, offset) - 1]
+        columns = page.tables[row.table].columns
+        if row.is_header or not columns:
+            return {}
+        return {"table_row": row.cells, "table_columns": columns}
+
+    return lookup
+
+
 def _find_dates_in_text(
     text: str,
     page: int,
     source_kind: str,
     inferred_year: Optional[int],
+    row_lookup: Optional[Callable[[int], dict]] = None,
 ) -> list[Candidate]:
     """Find date candidates in a single page of text."""
     candidates: list[Candidate] = []
     current_year = inferred_year or datetime.now().year
 
+    def table_fields(offset: int) -> dict:
+        return row_lookup(offset) if row_lookup else {}
+
     # ── Month name dates ─────────────────────────────────────────────────
     for match in MONTH_NAME_DATE_RE.finditer(text):
         raw = match.group(0)
@@ -186,6 +218,7 @@ def _find_dates_in_text(
             source_kind=source_kind,
             year_inferred=not has_year,
             is_ambiguous=not has_year and inferred_year is None,
+            **table_fields(match.start()),
         ))
 
     # ── Numeric dates ────────────────────────────────────────────────────
@@ -230,6 +263,7 @@ def _find_dates_in_text(
             source_kind=source_kind,
             year_inferred=year_inferred,
             is_ambiguous=(year_inferred and inferred_year is None) or format_ambiguous,
+            **table_fields(match.start()),
         ))
 
     # ── ISO dates ────────────────────────────────────────────────────────
@@ -252,6 +286,7 @@ def _find_dates_in_text(
             source_kind=source_kind,
             year_inferred=False,
             is_ambiguous=False,
+            **table_fields(match.start()),
         ))
 
     return candidates
@@ -1,51 +1,146 @@
 """Deterministic event assembly from date candidates.
 
 Classifies candidates using keyword heuristics, extracts titles,
-assigns confidence scores, and flags ambiguity.
+assigns confidence scores, and flags ambiguity. Rows from tables with a
+detected header are titled and classified by column lookup instead.
 """
 
 from __future__ import annotations
 
+import hashlib
 import re
-from typing import Optional
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Callable, Optional
 
-from ..schemas import Candidate, EventDraft
-
-# ── Category keyword sets ────────────────────────────────────────────────────
-
-CATEGORY_KEYWORDS: dict[str, set[str]] = {
-    "exam": {"midterm", "final", "exam", "quiz", "test"},
-    "assignment": {
-        "due", "submit", "assignment", "homework", "hw", "paper",
-        "essay", "project", "lab report", "problem set", "pset",
-    },
-    "reading": {"read", "reading", "chapter", "ch."},
-    "holiday": {"no class", "holiday", "break", "recess", "thanksgiving", "labor day"},
-    "office_hours": {"office hours", "office hour"},
-}
-
-# Words/phrases that strongly indicate an event is actionable
-STRONG_KEYWORDS = {
-    "exam": {"midterm", "final", "exam", "quiz"},
-    "assignment": {"due", "submit", "assignment", "homework"},
-}
+import numpy as np
 
+from ..schemas import Candidate, EventDraft
+from .rules import (
+    CATEGORY_KEYWORDS,  # noqa: F401 — built-in defaults, re-exported
+    STRONG_KEYWORDS,  # noqa: F401
+    CompiledRules,
+    RuleSource,
+    ScoreWeights,
+    compile_rules,
+    default_rules,
+)
+
+# Keyword sets, schedule patterns and scoring weights come from a rule pack
+# (see rules.py); every function here defaults to the built-in pack.
+
+# Default bound on memoized entries per document
+MEMO_MAX_ENTRIES = 1024
+
+
+class AssemblyMemo:
+    """Bounded per-document memo for context-derived assembly results.
+
+    Candidates that share a context window (several dates on one schedule row,
+    or the same line seen by both the pdf_text and table sources) classify and
+    score identically, so results are keyed on a context fingerprint and reused.
+    Least recently used entries are evicted once max_entries is reached.
+    """
 
-def assemble_events(candidates: list[Candidate]) -> list[EventDraft]:
+    def __init__(self, max_entries: int = MEMO_MAX_ENTRIES):
+        self.max_entries = max(1, max_entries)
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple, Any] = OrderedDict()
+
+    def get_or_compute(self, key: tuple, compute: Callable[[], Any]) -> Any:
+        """Return the memoized value for key, computing and storing it on a miss."""
+        if key in self._entries:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return self._entries[key]
+
+        self.misses += 1
+        value = compute()
+        self._entries[key] = value
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return value
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def stats(self) -> dict[str, float]:
+        """Hit/miss counters for logging and task results."""
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "entries": len(self._entries),
+            "hit_rate": round(self.hit_rate, 3),
+        }
+
+
+def context_fingerprint(context: str) -> str:
+    """Stable fingerprint of a candidate context, used as the memo key."""
+    return hashlib.md5(context.encode()).hexdigest()
+
+
+def assemble_events(
+    candidates: list[Candidate],
+    memo: Optional[AssemblyMemo] = None,
+    rules: Optional[RuleSource] = None,
+) -> list[EventDraft]:
     """Convert date candidates into event drafts with classification and confidence.
 
     Args:
         candidates: List of Candidate objects from date_finder.
+        memo: Optional AssemblyMemo to reuse results across candidates that share
+            a context; pass one in to inspect hit-rate stats afterwards. A fresh
+            memo is used per call when omitted. A memo is per document and rule pack.
+        rules: Rule pack (compiled, RulePack, or dict) to classify and score with;
+            defaults to the built-in rules. Compilation is cached by content hash.
 
     Returns:
         List of EventDraft objects ready for DB insertion.
     """
+    if memo is None:
+        memo = AssemblyMemo()
+    compiled = compile_rules(rules) if rules is not None else default_rules()
+
     events: list[EventDraft] = []
+    categories: list[str] = []
+    titles: list[str] = []
     for candidate in candidates:
-        category = _classify_category(candidate.context)
-        title = _extract_title(candidate.context, candidate.raw_match, category)
-        confidence = _score_confidence(candidate.context, category, candidate)
-
+        fp = context_fingerprint(candidate.context)
+        by_column = None
+        if candidate.table_row is not None and candidate.table_columns:
+            # Header-aware path: title and category by column lookup
+            by_column = memo.get_or_compute(
+                (
+                    "row",
+                    tuple(candidate.table_row),
+                    tuple(sorted(candidate.table_columns.items())),
+                    candidate.raw_match,
+                ),
+                lambda: _assemble_from_columns(
+                    candidate.table_row, candidate.table_columns, candidate.raw_match, compiled
+                ),
+            )
+
+        if by_column is not None:
+            category, title = by_column
+        else:
+            category = memo.get_or_compute(
+                ("category", fp),
+                lambda: _classify_category(candidate.context, compiled),
+            )
+            title = memo.get_or_compute(
+                ("title", fp, candidate.raw_match, category),
+                lambda: _extract_title(candidate.context, candidate.raw_match, category),
+            )
+        categories.append(category)
+        titles.append(title)
+
+    confidences = score_confidence_batch(candidates, categories, rules=compiled, memo=memo)
+
+    for candidate, category, title, confidence in zip(candidates, categories, titles, confidences):
         events.append(EventDraft(
             title=title,
             description=None,
@@ -62,25 +157,13 @@ def assemble_events(candidates: list[Candidate]) -> list[EventDraft]:
     return events
 
 
-def _classify_category(context: str) -> str:
-    """Classify an event's category using keyword matching on the context."""
-    ctx_lower = context.lower()
+def _classify_category(context: str, rules: Optional[CompiledRules] = None) -> str:
+    """Classify an event's category using keyword matching on the context.
 
-    # Check multi-word keywords first (e.g., "no class", "office hours")
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        for keyword in keywords:
-            if " " in keyword and keyword in ctx_lower:
-                return category
-
-    # Check single-word keywords
-    # Tokenize context into words for more precise matching
-    words = set(re.findall(r"\b\w+\b", ctx_lower))
-    for category, keywords in CATEGORY_KEYWORDS.items():
-        single_word_keywords = {k for k in keywords if " " not in k}
-        if words & single_word_keywords:
-            return category
-
-    return "other"
+    Multi-word keywords (e.g., "no class", "office hours") are checked first,
+    then single words; ties go to the earlier category in the rule pack.
+    """
+    return (rules or default_rules()).classify(context)
 
 
 def _extract_title(context: str, raw_match: str, category: str) -> str:
@@ -108,12 +191,26 @@ def _extract_title(context: str, raw_match: str, category: str) -> str:
     else:
         title = _extract_title_from_plain_line(target_line, raw_match)
 
-    # ── Final cleanup ────────────────────────────────────────────────────
+    return _clean_title(title, raw_match, category)
+
+
+def _clean_title(
+    title: str,
+    raw_match: str,
+    category: str,
+    strip_bare_numbers: bool = True,
+) -> str:
+    """Final title cleanup shared by the heuristic and column-lookup paths.
+
+    Column lookup already excludes Class#/HW# cells, so it keeps bare numbers
+    that belong to the title (e.g. "Problem Set 2").
+    """
     # Strip bullet prefixes
     title = re.sub(r"^[\s*•·\-–—]+\s*", "", title)
     # Remove leading/trailing bare numbers (class numbers, HW numbers)
-    title = re.sub(r"^\d+\s+", "", title)
-    title = re.sub(r"\s+\d+$", "", title)
+    if strip_bare_numbers:
+        title = re.sub(r"^\d+\s+", "", title)
+        title = re.sub(r"\s+\d+$", "", title)
     # Clean up leftover delimiters and whitespace
     title = re.sub(r"^[\s\-–—:,.|]+", "", title)
     title = re.sub(r"[\s\-–—:,.|]+$", "", title)
@@ -131,6 +228,42 @@ def _extract_title(context: str, raw_match: str, category: str) -> str:
     return title
 
 
+def _assemble_from_columns(
+    cells: list[str],
+    columns: dict[str, int],
+    raw_match: str,
+    rules: Optional[CompiledRules] = None,
+) -> Optional[tuple[str, str]]:
+    """Build (category, title) for a table row from its header-mapped columns.
+
+    The title is the Topic cell, joined with the Due cell when both are filled,
+    falling back to the Reading cell. The category is classified from those
+    cells only; an otherwise uncategorized row with a Due or Reading entry is an
+    assignment or reading. Returns None when none of the columns have text, so
+    the caller falls back to the string heuristics.
+    """
+    def cell(role: str) -> str:
+        index = columns.get(role)
+        if index is None or index >= len(cells):
+            return ""
+        text = cells[index].replace(raw_match, "").strip()
+        return re.sub(r"^[\s\-–—:,]+", "", text).strip()
+
+    topic, due, reading = cell("topic"), cell("due"), cell("reading")
+    if not (topic or due or reading):
+        return None
+
+    category = _classify_category(" ".join(c for c in (topic, due, reading) if c), rules)
+    if category == "other":
+        if due:
+            category = "assignment"
+        elif reading:
+            category = "reading"
+
+    title = "; ".join(c for c in (topic, due) if c) or reading
+    return category, _clean_title(title, raw_match, category, strip_bare_numbers=False)
+
+
 def _extract_title_from_table_row(line: str, raw_match: str) -> str:
     """Extract the topic/title from a pipe-delimited table row.
 
@@ -201,56 +334,165 @@ def _extract_title_from_plain_line(line: str, raw_match: str) -> str:
     return title
 
 
-def _score_confidence(context: str, category: str, candidate: Candidate) -> float:
+def _score_confidence(
+    context: str,
+    category: str,
+    candidate: Candidate,
+    rules: Optional[CompiledRules] = None,
+) -> float:
     """Assign a confidence score based on keyword strength and context quality.
 
     Scoring:
     - Strong keyword + date in same sentence: 0.85–0.95
     - Moderate keyword nearby: 0.65–0.80
     - Date with weak/no context: 0.40–0.60
+
+    Per-candidate reference implementation; assemble_events scores a whole
+    document at once with score_confidence_batch, which must agree with it.
     """
+    rules = rules or default_rules()
+    weights = rules.weights
     ctx_lower = context.lower()
-    base_score = 0.50
+    base_score = weights.strong_none
 
     # Check for strong keywords
-    if category in STRONG_KEYWORDS:
+    if category in rules.strong_keywords:
         strong_matches = sum(
-            1 for kw in STRONG_KEYWORDS[category] if kw in ctx_lower
+            1 for kw in rules.strong_keywords[category] if kw in ctx_lower
         )
         if strong_matches >= 2:
-            base_score = 0.92
+            base_score = weights.strong_two
         elif strong_matches == 1:
-            base_score = 0.87
-    elif category in CATEGORY_KEYWORDS:
+            base_score = weights.strong_one
+    elif rules.is_categorized(category):
         # Non-strong but categorized
-        base_score = 0.72
+        base_score = weights.categorized
     else:
         # "other" category — weak context
-        base_score = 0.45
+        base_score = weights.uncategorized
 
     # Adjustments
     # Penalize if context is very short (less signal)
-    if len(context.strip()) < 30:
-        base_score -= 0.10
+    if len(context.strip()) < weights.short_context_chars:
+        base_score -= weights.short_context_penalty
 
     # Penalize if year was inferred
     if candidate.year_inferred:
-        base_score -= 0.05
+        base_score -= weights.year_inferred_penalty
 
     # Penalize if ambiguous
     if candidate.is_ambiguous:
-        base_score -= 0.10
+        base_score -= weights.ambiguous_penalty
 
     # Boost if context looks like a schedule entry (common patterns)
-    schedule_patterns = [
-        r"week\s+\d+",
-        r"(mon|tue|wed|thu|fri|sat|sun)\w*day",
-        r"lecture\s+\d+",
-        r"class\s+\d+",
-    ]
-    for pattern in schedule_patterns:
-        if re.search(pattern, ctx_lower):
-            base_score += 0.03
+    for pattern in rules.schedule_patterns:
+        if pattern.search(ctx_lower):
+            base_score += weights.schedule_boost
 
     # Clamp to valid range
-    return round(max(0.10, min(0.99, base_score)), 2)
+    return round(max(weights.min_score, min(weights.max_score, base_score)), 2)
+
+
+# ── Batch scoring ────────────────────────────────────────────────────────────
+
+@dataclass
+class ScoreFeatures:
+    """Per-candidate scoring features for one document, as parallel arrays."""
+    strong_hits: np.ndarray  # int: strong keywords found (0 if category has none)
+    is_strong: np.ndarray  # bool: category has a strong keyword set
+    is_categorized: np.ndarray  # bool: category is a known keyword category
+    context_length: np.ndarray  # int: length of the stripped context
+    year_inferred: np.ndarray  # bool
+    is_ambiguous: np.ndarray  # bool
+    schedule_hits: np.ndarray  # bool, shape (n, number of schedule patterns)
+
+    def __len__(self) -> int:
+        return len(self.strong_hits)
+
+
+def extract_score_features(
+    candidates: list[Candidate],
+    categories: list[str],
+    rules: Optional[CompiledRules] = None,
+    memo: Optional[AssemblyMemo] = None,
+) -> ScoreFeatures:
+    """Extract scoring features for all candidates into arrays.
+
+    Context-derived features (keyword and schedule-pattern hits) are memoized per
+    context fingerprint and category, so shared contexts are scanned once.
+    """
+    rules = rules or default_rules()
+    if memo is None:
+        memo = AssemblyMemo()
+
+    def context_features(context: str, category: str) -> tuple:
+        ctx_lower = context.lower()
+        strong = sum(1 for kw in rules.strong_keywords.get(category, ()) if kw in ctx_lower)
+        schedule = tuple(bool(p.search(ctx_lower)) for p in rules.schedule_patterns)
+        return strong, len(context.strip()), schedule
+
+    rows = [
+        memo.get_or_compute(
+            ("features", context_fingerprint(c.context), category),
+            lambda: context_features(c.context, category),
+        )
+        for c, category in zip(candidates, categories)
+    ]
+
+    n = len(candidates)
+    return ScoreFeatures(
+        strong_hits=np.fromiter((r[0] for r in rows), dtype=np.int64, count=n),
+        is_strong=np.fromiter((cat in rules.strong_keywords for cat in categories), dtype=bool, count=n),
+        is_categorized=np.fromiter((rules.is_categorized(cat) for cat in categories), dtype=bool, count=n),
+        context_length=np.fromiter((r[1] for r in rows), dtype=np.int64, count=n),
+        year_inferred=np.fromiter((c.year_inferred for c in candidates), dtype=bool, count=n),
+        is_ambiguous=np.fromiter((c.is_ambiguous for c in candidates), dtype=bool, count=n),
+        schedule_hits=np.array([r[2] for r in rows], dtype=bool).reshape(n, len(rules.schedule_patterns)),
+    )
+
+
+def score_features(
+    features: ScoreFeatures,
+    weights: Optional[ScoreWeights] = None,
+) -> np.ndarray:
+    """Compute clamped, rounded confidence scores for a batch of features.
+
+    Applies the same operations in the same order as _score_confidence so the
+    float results match exactly.
+    """
+    weights = weights or default_rules().weights
+    base = np.select(
+        [
+            features.is_strong & (features.strong_hits >= 2),
+            features.is_strong & (features.strong_hits == 1),
+            features.is_strong,
+            features.is_categorized,
+        ],
+        [weights.strong_two, weights.strong_one, weights.strong_none, weights.categorized],
+        default=weights.uncategorized,
+    ).astype(np.float64)
+
+    score = np.where(
+        features.context_length < weights.short_context_chars,
+        base - weights.short_context_penalty, base,
+    )
+    score = np.where(features.year_inferred, score - weights.year_inferred_penalty, score)
+    score = np.where(features.is_ambiguous, score - weights.ambiguous_penalty, score)
+    for j in range(features.schedule_hits.shape[1]):
+        score = np.where(features.schedule_hits[:, j], score + weights.schedule_boost, score)
+
+    return np.round(np.maximum(weights.min_score, np.minimum(weights.max_score, score)), 2)
+
+
+def score_confidence_batch(
+    candidates: list[Candidate],
+    categories: list[str],
+    rules: Optional[CompiledRules] = None,
+    memo: Optional[AssemblyMemo] = None,
+) -> list[float]:
+    """Score all candidates of a document in one vectorized pass."""
+    if not candidates:
+        return []
+    rules = rules or default_rules()
+    features = extract_score_features(candidates, categories, rules=rules, memo=memo)
+    return [float(x) for x in score_features(features, rules.weights)]
@@ -0,0 +1,295 @@
+"""Persistent cache for LLM classifications.
+
+The same syllabus contexts ("Midterm Exam – Mar 4", standard holidays) reach the
+LLM across uploads and retries. Classifications are cached under a hash of the
+normalized context, the matched date text, the model and the prompt version, so
+only cache misses are sent to the provider.
+
+Backends:
+- SQLite (``sqlite:///path/to/cache.db``): local file, TTL plus least-recently-used
+  eviction beyond max_entries.
+- Redis (``redis://...``): per-key TTL, plus a sorted-set index used to evict the
+  least recently written keys beyond max_entries.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Protocol
+
+from ..schemas import Candidate, LLMClassification
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+DEFAULT_MAX_ENTRIES = 100_000
+
+# Fields of LLMClassification stored in the cache (candidate_index is per document)
+_CACHED_FIELDS = ("title", "category", "description", "confidence_adjustment")
+
+
+def normalize_context(context: str) -> str:
+    """Normalize a context for cache keying: lowercase, collapse pipes and whitespace."""
+    return re.sub(r"[|\s]+", " ", context.strip().lower())
+
+
+def cache_key(candidate: Candidate, model: str, prompt_version: str, context_limit: int) -> str:
+    """Cache key for a candidate's classification under a given model and prompt version."""
+    payload = json.dumps(
+        [prompt_version, model, candidate.raw_match, normalize_context(candidate.context[:context_limit])],
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class LLMCache(Protocol):
+    """Backend interface: batch get/set of cached classification fields by key."""
+
+    def get_many(self, keys: list[str]) -> dict[str, dict]: ...
+
+    def set_many(self, items: dict[str, dict]) -> None: ...
+
+
+# ── SQLite backend ───────────────────────────────────────────────────────────
+
+class SQLiteLLMCache:
+    """SQLite-backed cache with TTL and least-recently-used size eviction."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+        self._clock = clock
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._transaction() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " created_at REAL NOT NULL, last_used REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS ix_llm_cache_last_used ON llm_cache (last_used)")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        # One short-lived connection per operation keeps the cache safe to share
+        # across threads and forked worker processes
+        conn = sqlite3.connect(self.path, timeout=5.0)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get_many(self, keys: list[str]) -> dict[str, dict]:
+        if not keys:
+            return {}
+        now = self._clock()
+        found: dict[str, dict] = {}
+        with self._lock, self._transaction() as conn:
+            for start in range(0, len(keys), 500):
+                batch = keys[start:start + 500]
+                placeholders = ",".join("?" * len(batch))
+                rows = conn.execute(
+                    f"SELECT key, value FROM llm_cache WHERE key IN ({placeholders}) AND created_at >= ?",
+                    [*batch, now - self.ttl_seconds],
+                ).fetchall()
+                for key, value in rows:
+                    found[key] = json.loads(value)
+            if found:
+                conn.executemany(
+                    "UPDATE llm_cache SET last_used = ? WHERE key = ?",
+                    [(now, key) for key in found],
+                )
+        return found
+
+    def set_many(self, items: dict[str, dict]) -> None:
+        if not items:
+            return
+        now = self._clock()
+        with self._lock, self._transaction() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO llm_cache (key, value, created_at, last_used) VALUES (?, ?, ?, ?)",
+                [(key, json.dumps(value), now, now) for key, value in items.items()],
+            )
+            conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+            (count,) = conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()
+            if count > self.max_entries:
+                conn.execute(
+                    "DELETE FROM llm_cache WHERE key IN ("
+                    " SELECT key FROM llm_cache ORDER BY last_used ASC LIMIT ?)",
+                    (count - self.max_entries,),
+                )
+
+    def __len__(self) -> int:
+        with self._transaction() as conn:
+            return conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+
+# ── Redis backend ────────────────────────────────────────────────────────────
+
+class RedisLLMCache:
+    """Redis-backed cache: values expire by TTL; an index bounds the key count."""
+
+    PREFIX = "syllascribe:llm-cache:"
+    INDEX_KEY = "syllascribe:llm-cache-index"
+
+    def __init__(
+        self,
+        url: str,
+        ttl_seconds: int = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        try:
+            import redis
+        except ImportError:
+            raise ImportError(
+                "redis package is required for the Redis LLM cache. "
+                "Install with: pip install redis"
+            )
+        self._redis = redis.Redis.from_url(url, socket_connect_timeout=1, socket_timeout=2)
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max(1, max_entries)
+
+    def get_many(self, keys: list[str]) -> dict[str, dict]:
+        if not keys:
+            return {}
+        values = self._redis.mget([self.PREFIX + k for k in keys])
+        return {k: json.loads(v) for k, v in zip(keys, values) if v is not None}
+
+    def set_many(self, items: dict[str, dict]) -> None:
+        if not items:
+            return
+        now = time.time()
+        pipe = self._redis.pipeline()
+        for key, value in items.items():
+            pipe.set(self.PREFIX + key, json.dumps(value), ex=self.ttl_seconds)
+        pipe.zadd(self.INDEX_KEY, {key: now for key in items})
+        # Drop index entries whose values have already expired
+        pipe.zremrangebyscore(self.INDEX_KEY, "-inf", now - self.ttl_seconds)
+        pipe.zcard(self.INDEX_KEY)
+        count = pipe.execute()[-1]
+
+        excess = count - self.max_entries
+        if excess > 0:
+            evicted = [
+                k.decode() if isinstance(k, bytes) else k
+                for k, _ in self._redis.zpopmin(self.INDEX_KEY, excess)
+            ]
+            if evicted:
+                self._redis.delete(*[self.PREFIX + k for k in evicted])
+
+
+# ── Factory ──────────────────────────────────────────────────────────────────
+
+def open_llm_cache(
+    url: str,
+    ttl_seconds: int = DEFAULT_TTL_SECONDS,
+    max_entries: int = DEFAULT_MAX_ENTRIES,
+) -> Optional[LLMCache]:
+    """Open a cache backend from a URL; returns None for an empty URL.
+
+    Raises:
+        ValueError: for an unsupported URL scheme.
+    """
+    if not url:
+        return None
+    if url.startswith("sqlite:///"):
+        return SQLiteLLMCache(url[len("sqlite:///"):], ttl_seconds, max_entries)
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisLLMCache(url, ttl_seconds, max_entries)
+    raise ValueError(f"Unsupported LLM cache URL: {url}. Use sqlite:///path or redis://...")
+
+
+_env_caches: dict[tuple, Optional[LLMCache]] = {}
+_env_lock = threading.Lock()
+
+
+def llm_cache_from_env() -> Optional[LLMCache]:
+    """The process-wide cache configured by LLM_CACHE_URL, LLM_CACHE_TTL_SECONDS, LLM_CACHE_MAX_ENTRIES.
+
+    Returns None when LLM_CACHE_URL is unset or the backend cannot be opened
+    (caching is an optimization; classification proceeds without it).
+    """
+    config = (
+        os.environ.get("LLM_CACHE_URL", ""),
+        int(os.environ.get("LLM_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS)),
+        int(os.environ.get("LLM_CACHE_MAX_ENTRIES", DEFAULT_MAX_ENTRIES)),
+    )
+    with _env_lock:
+        if config not in _env_caches:
+            try:
+                _env_caches[config] = open_llm_cache(*config)
+            except Exception as exc:
+                logger.warning("LLM cache unavailable (%s); continuing without it", exc)
+                _env_caches[config] = None
+        return _env_caches[config]
+
+
+# ── Cached classification ────────────────────────────────────────────────────
+
+def classify_cached(
+    candidates: list[Candidate],
+    classify: Callable[[list[Candidate]], list[LLMClassification]],
+    cache: Optional[LLMCache],
+    model: str,
+    prompt_version: str,
+    context_limit: int,
+) -> list[LLMClassification]:
+    """Serve classifications from the cache and send only misses to classify.
+
+    classify receives the uncached candidates and returns classifications indexed
+    into that list; results are re-indexed to the full list and written back.
+    Cache backend errors are logged and treated as misses.
+    """
+    if cache is None or not candidates:
+        return classify(candidates)
+
+    keys = [cache_key(c, model, prompt_version, context_limit) for c in candidates]
+    try:
+        cached = cache.get_many(list(set(keys)))
+    except Exception as exc:
+        logger.warning("LLM cache read failed (%s); classifying all candidates", exc)
+        cached = {}
+
+    results: list[LLMClassification] = []
+    miss_indices: list[int] = []
+    for i, key in enumerate(keys):
+        if key in cached:
+            results.append(LLMClassification(candidate_index=i, **cached[key]))
+        else:
+            miss_indices.append(i)
+
+    if miss_indices:
+        fresh = classify([candidates[i] for i in miss_indices])
+        to_store: dict[str, dict] = {}
+        for r in fresh:
+            if not 0 <= r.candidate_index < len(miss_indices):
+                continue
+            global_index = miss_indices[r.candidate_index]
+            results.append(r.model_copy(update={"candidate_index": global_index}))
+            to_store[keys[global_index]] = r.model_dump(include=set(_CACHED_FIELDS))
+        try:
+            cache.set_many(to_store)
+        except Exception as exc:
+            logger.warning("LLM cache write failed (%s)", exc)
+
+    results.sort(key=lambda r: r.candidate_index)
+    return results
@@ -7,20 +7,68 @@ Hard constraints enforced in code:
 - The LLM cannot invent events beyond the candidates provided.
 - The LLM only classifies/labels and normalizes events from existing candidates.
 
-Provider abstraction: initially supports OpenAI, structured for easy swapping.
+Provider abstraction: supports OpenAI, plus a deterministic "local" provider
+(llm_local) for offline benchmarks and CI.
+Provider clients are pooled per process and guarded by a circuit breaker (see
+llm_providers).
+
+Large documents are split into size-bounded chunks that are classified
+concurrently (bounded by max_concurrency), each with its own timeout and
+retries; results are merged back by global candidate_index.
+
+With stream=True each response is parsed element by element as it arrives
+(StreamingArrayParser); validated classifications are handed to an on_result
+callback immediately, and a stream that dies midway keeps its valid prefix.
+
+Only candidates the deterministic assembler is unsure about are routed to the
+LLM: drafts below the routing threshold, ambiguous drafts, and "other"-category
+drafts. Everything else keeps its deterministic result.
 """
 
 from __future__ import annotations
 
 import json
-from typing import Optional
-
-from ..schemas import Candidate, LLMClassification
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional
+
+from ..metrics import LLM_REQUESTS
+from ..schemas import Candidate, EventDraft, LLMClassification
+from .llm_cache import LLMCache, classify_cached, llm_cache_from_env
+from .llm_local import LOCAL_MODEL, LocalProvider, LocalProviderConfig
+from .llm_providers import (
+    DEFAULT_CONNECT_TIMEOUT,
+    CircuitOpenError,
+    get_circuit_breaker,
+    get_openai_client,
+)
+
+logger = logging.getLogger(__name__)
+
+# ── Chunking defaults ────────────────────────────────────────────────────────
+
+DEFAULT_CHUNK_SIZE = 25  # max candidates per request
+DEFAULT_CHUNK_CHARS = 8000  # max total context characters per request
+DEFAULT_MAX_CONCURRENCY = 4  # max requests in flight per document
+DEFAULT_TIMEOUT = 60.0  # seconds, read timeout per chunk request
+DEFAULT_MAX_RETRIES = 2  # retries per chunk after the first attempt
+CONTEXT_LIMIT = 300  # context characters sent per candidate
+
+DEFAULT_ROUTING_THRESHOLD = 0.80  # drafts at or above this confidence skip the LLM
+
+OPENAI_MODEL = "gpt-4o-mini"
+# Bump when SYSTEM_PROMPT or the request encoding changes, to invalidate cached results
+PROMPT_VERSION = "2"
 
 
 # ── System prompt ────────────────────────────────────────────────────────────
 
-SYSTEM_PROMPT = """You are a precise academic calendar event classifier. You will receive a list of date candidates extracted from a course syllabus, each with a date and surrounding context text.
+SYSTEM_PROMPT = """You are a precise academic calendar event classifier. You will receive date candidates extracted from a course syllabus, each with a date and surrounding context text.
+
+Input is compact JSON: {"contexts": [<context text>, ...], "candidates": [[candidate_index, date, matched_text, context_id, page], ...]}. context_id indexes into "contexts"; several candidates may share one context.
 
 For each candidate, return:
 1. A short, normalized title (e.g., "Midterm Exam", "Problem Set 3 Due", "Spring Break - No Class")
@@ -50,59 +98,330 @@ def classify_with_llm_sync(
     candidates: list[Candidate],
     provider: str,
     api_key: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+    cache: Optional[LLMCache] = None,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    base_url: Optional[str] = None,
+    stream: bool = False,
+    on_result: Optional[ResultCallback] = None,
 ) -> list[LLMClassification]:
     """Synchronous wrapper for LLM classification (used by Celery worker).
 
     Args:
         candidates: List of date candidates to classify.
-        provider: LLM provider name (e.g., "openai").
+        provider: LLM provider name ("openai", or "local" for the offline stub).
         api_key: API key for the provider.
+        chunk_size: Max candidates per provider request.
+        max_concurrency: Max chunk requests in flight at once.
+        timeout: Per-chunk read timeout in seconds.
+        max_retries: Retries per chunk before its candidates are left unclassified.
+        cache: Optional persistent cache; only cache misses are sent to the provider.
+        connect_timeout: Connect timeout in seconds.
+        base_url: Optional provider endpoint override (proxies, local stub servers).
+        stream: Parse provider responses incrementally; a truncated stream keeps
+            its valid prefix instead of losing the whole chunk.
+        on_result: Called as (candidate, classification) for each streamed
+            classification as soon as it is validated, from chunk worker threads.
+            Its candidate_index is chunk-local; match on the candidate. Cached
+            results are only returned, not passed to on_result.
 
     Returns:
-        List of LLMClassification objects.
+        List of LLMClassification objects, indexed into the full candidate list.
     """
     if provider == "openai":
-        return _classify_openai(candidates, api_key)
+        model = OPENAI_MODEL
+        client = get_openai_client(
+            api_key, base_url=base_url, connect_timeout=connect_timeout, read_timeout=timeout,
+        )
+
+        def send(chunk: list[Candidate]) -> list[LLMClassification]:
+            if stream:
+                emit = (lambda r: on_result(chunk[r.candidate_index], r)) if on_result else None
+                return _classify_openai_stream(client, chunk, emit)
+            return _classify_openai(client, chunk)
+    elif provider == "local":
+        model = LOCAL_MODEL
+        local = LocalProvider(LocalProviderConfig.from_env(), timeout=timeout)
+
+        def send(chunk: list[Candidate]) -> list[LLMClassification]:
+            emit = (lambda r: on_result(chunk[r.candidate_index], r)) if stream and on_result else None
+            return local.classify(chunk, emit)
     else:
-        raise ValueError(f"Unsupported LLM provider: {provider}. Supported: openai")
+        raise ValueError(f"Unsupported LLM provider: {provider}. Supported: openai, local")
+
+    breaker = get_circuit_breaker(provider)
+
+    def classify_chunk(chunk: list[Candidate]) -> list[LLMClassification]:
+        try:
+            results = breaker.call(send, chunk)
+        except CircuitOpenError:
+            LLM_REQUESTS.inc(provider=provider, outcome="circuit_open")
+            raise
+        except Exception:
+            LLM_REQUESTS.inc(provider=provider, outcome="error")
+            raise
+        LLM_REQUESTS.inc(provider=provider, outcome="ok")
+        return results
+
+    def classify_uncached(uncached: list[Candidate]) -> list[LLMClassification]:
+        if breaker.state == "open":
+            logger.warning("LLM circuit for %s is open; skipping %d candidates", provider, len(uncached))
+            return []
+        return classify_in_chunks(
+            uncached,
+            classify_chunk,
+            chunk_size=chunk_size,
+            max_concurrency=max_concurrency,
+            max_retries=max_retries,
+        )
+
+    return classify_cached(
+        candidates,
+        classify_uncached,
+        cache,
+        model=model,
+        prompt_version=PROMPT_VERSION,
+        context_limit=CONTEXT_LIMIT,
+    )
 
 
-def _classify_openai(
+def llm_options_from_env() -> dict:
+    """Keyword arguments for classify_with_llm_sync from env vars.
+
+    LLM_CHUNK_SIZE, LLM_MAX_CONCURRENCY, LLM_TIMEOUT_SECONDS,
+    LLM_CONNECT_TIMEOUT_SECONDS, LLM_MAX_RETRIES, LLM_BASE_URL, LLM_STREAM, and the
+    process-wide cache from LLM_CACHE_URL (see llm_cache.llm_cache_from_env).
+    """
+    return {
+        "cache": llm_cache_from_env(),
+        "chunk_size": int(os.environ.get("LLM_CHUNK_SIZE", DEFAULT_CHUNK_SIZE)),
+        "max_concurrency": int(os.environ.get("LLM_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+        "timeout": float(os.environ.get("LLM_TIMEOUT_SECONDS", DEFAULT_TIMEOUT)),
+        "max_retries": int(os.environ.get("LLM_MAX_RETRIES", DEFAULT_MAX_RETRIES)),
+        "connect_timeout": float(os.environ.get("LLM_CONNECT_TIMEOUT_SECONDS", DEFAULT_CONNECT_TIMEOUT)),
+        "base_url": os.environ.get("LLM_BASE_URL") or None,
+        "stream": os.environ.get("LLM_STREAM", "false").lower() == "true",
+    }
+
+
+def llm_routing_threshold_from_env() -> float:
+    """Routing threshold from LLM_ROUTING_THRESHOLD (default DEFAULT_ROUTING_THRESHOLD)."""
+    return float(os.environ.get("LLM_ROUTING_THRESHOLD", DEFAULT_ROUTING_THRESHOLD))
+
+
+# ── Confidence-gated routing ─────────────────────────────────────────────────
+
+def route_for_llm(drafts: list[EventDraft], threshold: float = DEFAULT_ROUTING_THRESHOLD) -> list[int]:
+    """Indices of drafts that need LLM review.
+
+    A draft is routed when its confidence is below threshold, it is ambiguous,
+    or the assembler could not categorize it ("other").
+    """
+    return [
+        i for i, draft in enumerate(drafts)
+        if draft.confidence < threshold or draft.is_ambiguous or draft.category == "other"
+    ]
+
+
+def classify_routed(
     candidates: list[Candidate],
+    drafts: list[EventDraft],
+    provider: str,
     api_key: str,
-) -> list[LLMClassification]:
-    """Classify candidates using OpenAI API."""
-    try:
-        from openai import OpenAI
-    except ImportError:
-        raise ImportError(
-            "openai package is required for LLM classification. "
-            "Install with: pip install openai"
-        )
+    threshold: float = DEFAULT_ROUTING_THRESHOLD,
+    **options,
+) -> dict:
+    """Classify only the routed candidates and merge the results into drafts in place.
+
+    candidates and drafts are aligned 1:1 (as returned by assemble_events).
+    options are passed through to classify_with_llm_sync.
+
+    Returns:
+        Counts: {"routed": ..., "skipped": ..., "classified": ...}.
+    """
+    routed = route_for_llm(drafts, threshold)
+    stats = {"routed": len(routed), "skipped": len(drafts) - len(routed), "classified": 0}
+    if not routed:
+        return stats
+
+    # Streamed classifications are applied as they arrive; the rest (cache hits,
+    # non-streaming responses) once classification finishes
+    draft_for = {id(candidates[i]): i for i in routed}
+    applied: set[int] = set()
+    lock = threading.Lock()
+
+    def apply_one(index: int, cls: LLMClassification) -> None:
+        with lock:
+            if index in applied:
+                return
+            applied.add(index)
+        _apply_classification(drafts[index], cls)
+
+    classifications = classify_with_llm_sync(
+        candidates=[candidates[i] for i in routed],
+        provider=provider,
+        api_key=api_key,
+        on_result=lambda candidate, cls: apply_one(draft_for[id(candidate)], cls),
+        **options,
+    )
+    # Streaming has finished; merge whatever was not applied on arrival
+    remaining = [
+        cls for cls in classifications
+        if 0 <= cls.candidate_index < len(routed) and routed[cls.candidate_index] not in applied
+    ]
+    applied.update(routed[cls.candidate_index] for cls in remaining)
+    apply_llm_classifications([drafts[i] for i in routed], remaining)
+    stats["classified"] = len(applied)
+    return stats
+
+
+def apply_llm_classifications(
+    drafts: list[EventDraft],
+    classifications: list[LLMClassification],
+) -> list[EventDraft]:
+    """Merge LLM classifications into event drafts (by candidate_index, an index into drafts).
+
+    Hard constraints:
+    - Cannot change date
+    - Cannot add new events
+    """
+    cls_map = {c.candidate_index: c for c in classifications}
+    for i, draft in enumerate(drafts):
+        cls = cls_map.get(i)
+        if cls is not None:
+            _apply_classification(draft, cls)
+    return drafts
+
+
+def _apply_classification(draft: EventDraft, cls: LLMClassification) -> None:
+    if cls.title:
+        draft.title = cls.title
+    if cls.category:
+        draft.category = cls.category
+    if cls.description:
+        draft.description = cls.description
+    draft.confidence = round(max(0.10, min(0.99, draft.confidence + cls.confidence_adjustment)), 2)
 
-    client = OpenAI(api_key=api_key)
 
-    # Build the user message with candidate data
-    candidate_data = []
+# ── Chunked, concurrent classification ───────────────────────────────────────
+
+ChunkClassifier = Callable[[list[Candidate]], list[LLMClassification]]
+ResultCallback = Callable[[Candidate, LLMClassification], None]
+
+
+def chunk_candidates(
+    candidates: list[Candidate],
+    max_items: int = DEFAULT_CHUNK_SIZE,
+    max_chars: int = DEFAULT_CHUNK_CHARS,
+) -> list[tuple[int, list[Candidate]]]:
+    """Split candidates into contiguous (offset, chunk) pairs bounded by count and context size."""
+    max_items = max(1, max_items)
+    chunks: list[tuple[int, list[Candidate]]] = []
+    current: list[Candidate] = []
+    current_chars = 0
+    offset = 0
+
     for i, c in enumerate(candidates):
-        candidate_data.append({
-            "index": i,
-            "date": c.date.isoformat(),
-            "raw_match": c.raw_match,
-            "context": c.context[:300],  # Limit context length
-            "page": c.page,
-        })
+        chars = min(len(c.context), CONTEXT_LIMIT)
+        if current and (len(current) >= max_items or current_chars + chars > max_chars):
+            chunks.append((offset, current))
+            current, current_chars, offset = [], 0, i
+        current.append(c)
+        current_chars += chars
+
+    if current:
+        chunks.append((offset, current))
+    return chunks
+
+
+def classify_in_chunks(
+    candidates: list[Candidate],
+    classify_chunk: ChunkClassifier,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    max_retries: int = DEFAULT_MAX_RETRIES,
+) -> list[LLMClassification]:
+    """Classify candidates chunk by chunk on a bounded thread pool.
+
+    classify_chunk receives one chunk and returns classifications with
+    chunk-local indices; they are shifted to global candidate_index here. A chunk
+    that still fails after its retries is logged and skipped, so one bad request
+    only loses its own candidates.
+    """
+    chunks = chunk_candidates(candidates, max_items=chunk_size)
+    if not chunks:
+        return []
+
+    def run(offset: int, chunk: list[Candidate]) -> list[LLMClassification]:
+        local = _call_with_retries(classify_chunk, chunk, max_retries)
+        return [
+            r.model_copy(update={"candidate_index": r.candidate_index + offset})
+            for r in local
+            if 0 <= r.candidate_index < len(chunk)
+        ]
+
+    workers = max(1, min(max_concurrency, len(chunks)))
+    if workers == 1:
+        results = [run(offset, chunk) for offset, chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="llm-chunk") as pool:
+            futures = [pool.submit(run, offset, chunk) for offset, chunk in chunks]
+            results = [f.result() for f in futures]
+
+    merged = {r.candidate_index: r for chunk_results in results for r in chunk_results}
+    return [merged[i] for i in sorted(merged)]
+
+
+def _call_with_retries(
+    classify_chunk: ChunkClassifier,
+    chunk: list[Candidate],
+    max_retries: int,
+) -> list[LLMClassification]:
+    """Call classify_chunk, retrying with exponential backoff; [] if every attempt fails.
+
+    An open circuit breaker is not retried.
+    """
+    for attempt in range(max_retries + 1):
+        try:
+            return classify_chunk(chunk)
+        except CircuitOpenError:
+            return []
+        except Exception as exc:
+            if attempt >= max_retries:
+                logger.warning(
+                    "LLM chunk of %d candidates failed after %d attempts: %s",
+                    len(chunk), attempt + 1, exc,
+                )
+                return []
+            _backoff(attempt)
+    return []
+
+
+def _backoff(attempt: int) -> None:
+    time.sleep(min(0.5 * (2 ** attempt), 4.0))
+
+
+# ── OpenAI ───────────────────────────────────────────────────────────────────
 
-    user_message = json.dumps(candidate_data, indent=2)
+def _classify_openai(client, candidates: list[Candidate]) -> list[LLMClassification]:
+    """Classify one chunk of candidates using the OpenAI API (indices local to the chunk)."""
+    user_message = encode_candidates(candidates)
+    logger.debug(
+        "LLM request: %d candidates, ~%d prompt tokens",
+        len(candidates), estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(user_message),
+    )
 
     response = client.chat.completions.create(
-        model="gpt-4o-mini",
+        model=OPENAI_MODEL,
         messages=[
             {"role": "system", "content": SYSTEM_PROMPT},
             {"role": "user", "content": user_message},
         ],
         temperature=0.1,
-        max_tokens=2000,
+        max_tokens=_max_tokens_for(len(candidates)),
         response_format={"type": "json_object"},
     )
 
@@ -114,6 +433,93 @@ def _classify_openai(
     return _parse_llm_response(content, len(candidates))
 
 
+def _classify_openai_stream(
+    client,
+    candidates: list[Candidate],
+    emit: Optional[Callable[[LLMClassification], None]] = None,
+) -> list[LLMClassification]:
+    """Streaming variant of _classify_openai: results are validated and emitted as they arrive.
+
+    If the stream fails after some results arrived, the valid prefix is returned
+    (only the tail is lost); a stream that fails before any result raises so the
+    chunk can be retried.
+    """
+    response = client.chat.completions.create(
+        model=OPENAI_MODEL,
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {"role": "user", "content": encode_candidates(candidates)},
+        ],
+        temperature=0.1,
+        max_tokens=_max_tokens_for(len(candidates)),
+        response_format={"type": "json_object"},
+        stream=True,
+    )
+
+    parser = StreamingArrayParser()
+    results: list[LLMClassification] = []
+    seen: set[int] = set()
+    try:
+        for event in response:
+            if not event.choices:
+                continue
+            delta = event.choices[0].delta.content
+            if not delta:
+                continue
+            for item in parser.feed(delta):
+                result = _validate_item(item, len(candidates))
+                if result is None or result.candidate_index in seen:
+                    continue
+                seen.add(result.candidate_index)
+                results.append(result)
+                if emit is not None:
+                    emit(result)
+            if parser.done:
+                break
+    except Exception as exc:
+        if not results:
+            raise
+        logger.warning(
+            "LLM stream failed after %d of %d results; keeping the valid prefix: %s",
+            len(results), len(candidates), exc,
+        )
+    return results
+
+
+def encode_candidates(candidates: list[Candidate]) -> str:
+    """Compact user message for a chunk.
+
+    Each distinct context (truncated to CONTEXT_LIMIT) is sent once in
+    "contexts"; candidates are [index, date, raw_match, context_id, page] rows
+    referencing it. Dates sharing a table row or paragraph share one context.
+    """
+    contexts: list[str] = []
+    context_ids: dict[str, int] = {}
+    rows = []
+    for i, c in enumerate(candidates):
+        context = c.context[:CONTEXT_LIMIT]
+        context_id = context_ids.get(context)
+        if context_id is None:
+            context_id = context_ids[context] = len(contexts)
+            contexts.append(context)
+        rows.append([i, c.date.isoformat(), c.raw_match, context_id, c.page])
+    return json.dumps(
+        {"contexts": contexts, "candidates": rows},
+        separators=(",", ":"),
+        ensure_ascii=False,
+    )
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough prompt token count (~4 characters per token for English/JSON)."""
+    return (len(text) + 3) // 4
+
+
+def _max_tokens_for(num_candidates: int) -> int:
+    """Response token budget for a chunk (~80 tokens per classification)."""
+    return min(4096, 200 + 80 * num_candidates)
+
+
 def _parse_llm_response(
     content: str,
     num_candidates: int,
@@ -125,8 +531,6 @@ def _parse_llm_response(
     - confidence_adjustment clamped to [-0.2, 0.2]
     - category must be valid
     """
-    valid_categories = {"assignment", "exam", "reading", "holiday", "office_hours", "other"}
-
     try:
         data = json.loads(content)
     except json.JSONDecodeError:
@@ -147,38 +551,115 @@ def _parse_llm_response(
 
     results: list[LLMClassification] = []
     for item in data:
-        if not isinstance(item, dict):
-            continue
+        result = _validate_item(item, num_candidates)
+        if result is not None:
+            results.append(result)
 
-        idx = item.get("candidate_index")
-        if not isinstance(idx, int) or idx < 0 or idx >= num_candidates:
-            continue
+    return results
 
-        title = str(item.get("title", "")).strip()
-        if not title:
-            continue
 
-        category = str(item.get("category", "other")).strip().lower()
-        if category not in valid_categories:
-            category = "other"
+_VALID_CATEGORIES = {"assignment", "exam", "reading", "holiday", "office_hours", "other"}
 
-        description = item.get("description")
-        if description is not None:
-            description = str(description).strip() or None
 
-        adj = item.get("confidence_adjustment", 0.0)
-        try:
-            adj = float(adj)
-        except (TypeError, ValueError):
-            adj = 0.0
-        adj = max(-0.2, min(0.2, adj))
-
-        results.append(LLMClassification(
-            candidate_index=idx,
-            title=title,
-            category=category,
-            description=description,
-            confidence_adjustment=adj,
-        ))
+def _validate_item(item, num_candidates: int) -> Optional[LLMClassification]:
+    """Validate one response element against the hard constraints; None if unusable."""
+    if not isinstance(item, dict):
+        return None
 
-    return results
+    idx = item.get("candidate_index")
+    if not isinstance(idx, int) or idx < 0 or idx >= num_candidates:
+        return None
+
+    title = str(item.get("title", "")).strip()
+    if not title:
+        return None
+
+    category = str(item.get("category", "other")).strip().lower()
+    if category not in _VALID_CATEGORIES:
+        category = "other"
+
+    description = item.get("description")
+    if description is not None:
+        description = str(description).strip() or None
+
+    adj = item.get("confidence_adjustment", 0.0)
+    try:
+        adj = float(adj)
+    except (TypeError, ValueError):
+        adj = 0.0
+    adj = max(-0.2, min(0.2, adj))
+
+    return LLMClassification(
+        candidate_index=idx,
+        title=title,
+        category=category,
+        description=description,
+        confidence_adjustment=adj,
+    )
+
+
+class StreamingArrayParser:
+    """Incrementally extract completed elements of the first JSON array in a stream.
+
+    Accepts both a bare array and an object wrapping one ({"results": [...]}).
+    feed() returns the objects completed by each new piece of text, so a stream
+    cut off midway still yields every element before the break.
+    """
+
+    def __init__(self):
+        self._text = ""
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._escape = False
+        self._array_depth: Optional[int] = None
+        self._item_start: Optional[int] = None
+        self.done = False
+
+    def feed(self, text: str) -> list[dict]:
+        if self.done:
+            return []
+        self._text += text
+        items: list[dict] = []
+
+        for i in range(self._pos, len(self._text)):
+            ch = self._text[i]
+            if self._in_string:
+                if self._escape:
+                    self._escape = False
+                elif ch == "\\":
+                    self._escape = True
+                elif ch == '"':
+                    self._in_string = False
+                continue
+
+            if ch == '"':
+                self._in_string = True
+            elif ch in "[{":
+                self._depth += 1
+                if self._array_depth is None:
+                    if ch == "[":
+                        self._array_depth = self._depth
+                elif ch == "{" and self._depth == self._array_depth + 1:
+                    self._item_start = i
+            elif ch in "]}":
+                if self._array_depth is not None:
+                    if ch == "}" and self._item_start is not None and self._depth == self._array_depth + 1:
+                        try:
+                            items.append(json.loads(self._text[self._item_start:i + 1]))
+                        except json.JSONDecodeError:
+                            pass
+                        self._item_start = None
+                    elif ch == "]" and self._depth == self._array_depth:
+                        self.done = True
+                        break
+                self._depth -= 1
+
+        # Keep only the text of the element still being received
+        if self._item_start is None or self.done:
+            self._text, self._pos = "", 0
+        else:
+            self._text = self._text[self._item_start:]
+            self._pos = len(self._text)
+            self._item_start = 0
+        return items
@@ -0,0 +1,132 @@
+"""Deterministic local LLM provider for offline benchmarks and CI.
+
+provider="local" classifies candidates in-process with the built-in assembler
+rules instead of calling a remote model, so the LLM stage (chunking,
+concurrency, caching, timeouts, retries, streaming) can be exercised without a
+key or network. Provider behavior is injectable:
+
+- latency_ms: simulated response time per request (plus per-candidate latency)
+- error_rate: fraction of requests that fail
+- truncate_rate: fraction of responses cut off partway through
+
+Injected faults are decided from a hash of the seed, the request contents and
+how many times this provider has already been sent that request. The same run
+produces the same failures every time, and a retried request rolls again, so
+error_rate models transient failures that retries can recover from.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from ..schemas import Candidate, LLMClassification
+from .rules import default_rules
+
+LOCAL_MODEL = "local-stub"
+
+
+class LocalProviderError(RuntimeError):
+    """Injected request failure from the local provider."""
+
+
+@dataclass(frozen=True)
+class LocalProviderConfig:
+    latency_ms: float = 0.0  # per request
+    per_candidate_ms: float = 0.0  # added per candidate in the request
+    error_rate: float = 0.0
+    truncate_rate: float = 0.0
+    seed: int = 0
+
+    @classmethod
+    def from_env(cls) -> "LocalProviderConfig":
+        """LLM_LOCAL_LATENCY_MS, LLM_LOCAL_PER_CANDIDATE_MS, LLM_LOCAL_ERROR_RATE,
+        LLM_LOCAL_TRUNCATE_RATE, LLM_LOCAL_SEED."""
+        return cls(
+            latency_ms=float(os.environ.get("LLM_LOCAL_LATENCY_MS", 0)),
+            per_candidate_ms=float(os.environ.get("LLM_LOCAL_PER_CANDIDATE_MS", 0)),
+            error_rate=float(os.environ.get("LLM_LOCAL_ERROR_RATE", 0)),
+            truncate_rate=float(os.environ.get("LLM_LOCAL_TRUNCATE_RATE", 0)),
+            seed=int(os.environ.get("LLM_LOCAL_SEED", 0)),
+        )
+
+
+class LocalProvider:
+    """In-process stand-in for a chat-completion classifier."""
+
+    def __init__(
+        self,
+        config: Optional[LocalProviderConfig] = None,
+        timeout: Optional[float] = None,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.config = config or LocalProviderConfig()
+        self.timeout = timeout
+        self._sleep = sleep
+        self.requests = 0
+        self._attempts: dict[bytes, int] = {}  # request contents digest -> times sent
+        self._lock = threading.Lock()  # classify runs on classify_in_chunks' thread pool
+
+    def classify(
+        self,
+        candidates: list[Candidate],
+        emit: Optional[Callable[[LLMClassification], None]] = None,
+    ) -> list[LLMClassification]:
+        """Classify one chunk (indices local to the chunk), simulating latency and faults.
+
+        Raises:
+            TimeoutError: if the simulated latency exceeds the read timeout.
+            LocalProviderError: for an injected request failure.
+        """
+        with self._lock:
+            self.requests += 1
+        config = self.config
+        latency = (config.latency_ms + config.per_candidate_ms * len(candidates)) / 1000
+        if self.timeout is not None and latency > self.timeout:
+            self._sleep(self.timeout)
+            raise TimeoutError(f"Local provider did not respond within {self.timeout}s")
+        if latency:
+            self._sleep(latency)
+
+        roll = self._roll(candidates)
+        if roll < config.error_rate:
+            raise LocalProviderError("Injected local provider failure")
+
+        results = [_classify_candidate(i, c) for i, c in enumerate(candidates)]
+        truncated = roll < config.error_rate + config.truncate_rate
+        if truncated:
+            results = results[:len(results) // 2]
+        if emit is not None:
+            for result in results:
+                emit(result)
+        return results
+
+    def _roll(self, candidates: list[Candidate]) -> float:
+        """Deterministic value in [0, 1) for this request and attempt."""
+        content = hashlib.sha256()
+        for c in candidates:
+            content.update(f"{c.date.isoformat()}|{c.raw_match}|{c.context}".encode())
+        key = content.digest()
+        with self._lock:
+            attempt = self._attempts.get(key, 0)
+            self._attempts[key] = attempt + 1
+        digest = hashlib.sha256(f"{self.config.seed}|{attempt}|".encode() + key)
+        return int.from_bytes(digest.digest()[:8], "big") / 2 ** 64
+
+
+def _classify_candidate(index: int, candidate: Candidate) -> LLMClassification:
+    category = default_rules().classify(candidate.context)
+    title = candidate.context.replace(candidate.raw_match, " ")
+    title = re.sub(r"[|\s]+", " ", title).strip(" -:;,*") or category.replace("_", " ").title()
+    return LLMClassification(
+        candidate_index=index,
+        title=title[:80],
+        category=category,
+        description=None,
+        confidence_adjustment=0.0,
+    )
@@ -0,0 +1,196 @@
+"""Long-lived LLM provider clients and circuit breakers.
+
+Each worker process keeps one pooled HTTP client per provider configuration, so
+jobs reuse open connections instead of paying a fresh TLS handshake each time.
+Clients enforce connect and read timeouts, and a per-provider circuit breaker
+trips after repeated failures so jobs skip the LLM quickly while the provider
+is down.
+
+Clients are keyed by process id: a forked worker never reuses its parent's
+sockets.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONNECT_TIMEOUT = 5.0  # seconds
+DEFAULT_READ_TIMEOUT = 60.0  # seconds
+DEFAULT_MAX_CONNECTIONS = 10
+DEFAULT_FAILURE_THRESHOLD = 5  # consecutive failures before the circuit opens
+DEFAULT_RESET_TIMEOUT = 30.0  # seconds the circuit stays open before a trial request
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised instead of calling a provider whose circuit breaker is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker.
+
+    closed: requests pass; failure_threshold consecutive failures open the circuit.
+    open: requests are rejected until reset_timeout has elapsed.
+    half_open: one trial request passes; success closes the circuit, failure reopens it.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_TIMEOUT,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            return self._state()
+
+    def _state(self) -> str:
+        if self._opened_at is None:
+            return "closed"
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return "half_open"
+        return "open"
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now."""
+        with self._lock:
+            state = self._state()
+            if state == "closed":
+                return True
+            if state == "half_open" and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            if self._trial_in_flight:
+                self._trial_in_flight = False
+                self._opened_at = self._clock()
+                logger.warning("LLM circuit trial request failed; circuit reopened")
+            elif self._opened_at is None and self._failures >= self.failure_threshold:
+                self._opened_at = self._clock()
+                logger.warning("LLM circuit opened after %d consecutive failures", self._failures)
+
+    def call(self, fn: Callable, *args, **kwargs):
+        """Call fn through the breaker, recording its outcome.
+
+        Raises:
+            CircuitOpenError: if the circuit is open.
+        """
+        if not self.allow():
+            raise CircuitOpenError("LLM provider circuit is open; skipping request")
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            self.record_failure()
+            raise
+        self.record_success()
+        return result
+
+
+# ── Registry ─────────────────────────────────────────────────────────────────
+
+_clients: dict[tuple, object] = {}
+_breakers: dict[str, CircuitBreaker] = {}
+_registry_lock = threading.Lock()
+
+
+def get_openai_client(
+    api_key: str,
+    base_url: Optional[str] = None,
+    connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+    read_timeout: float = DEFAULT_READ_TIMEOUT,
+    max_connections: int = DEFAULT_MAX_CONNECTIONS,
+):
+    """The process-wide pooled OpenAI client for this configuration."""
+    key = ("openai", os.getpid(), api_key, base_url, connect_timeout, read_timeout, max_connections)
+    with _registry_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _build_openai_client(api_key, base_url, connect_timeout, read_timeout, max_connections)
+            _clients[key] = client
+        return client
+
+
+def _build_openai_client(
+    api_key: str,
+    base_url: Optional[str],
+    connect_timeout: float,
+    read_timeout: float,
+    max_connections: int,
+):
+    try:
+        import httpx
+        from openai import OpenAI
+    except ImportError:
+        raise ImportError(
+            "openai package is required for LLM classification. "
+            "Install with: pip install openai"
+        )
+
+    timeout = httpx.Timeout(read_timeout, connect=connect_timeout)
+    http_client = httpx.Client(
+        timeout=timeout,
+        limits=httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_connections,
+        ),
+    )
+    # Retries are handled per chunk by llm_classifier.classify_in_chunks
+    return OpenAI(
+        api_key=api_key,
+        base_url=base_url or None,
+        timeout=timeout,
+        max_retries=0,
+        http_client=http_client,
+    )
+
+
+def get_circuit_breaker(provider: str) -> CircuitBreaker:
+    """The process-wide circuit breaker for a provider.
+
+    Configured on first use from LLM_CIRCUIT_FAILURES and LLM_CIRCUIT_RESET_SECONDS.
+    """
+    with _registry_lock:
+        breaker = _breakers.get(provider)
+        if breaker is None:
+            breaker = CircuitBreaker(
+                failure_threshold=int(os.environ.get("LLM_CIRCUIT_FAILURES", DEFAULT_FAILURE_THRESHOLD)),
+                reset_timeout=float(os.environ.get("LLM_CIRCUIT_RESET_SECONDS", DEFAULT_RESET_TIMEOUT)),
+            )
+            _breakers[provider] = breaker
+        return breaker
+
+
+def reset_registry() -> None:
+    """Close pooled clients and forget circuit state (tests, worker shutdown)."""
+    with _registry_lock:
+        for client in _clients.values():
+            try:
+                client.close()
+            except Exception:
+                pass
+        _clients.clear()
+        _breakers.clear()
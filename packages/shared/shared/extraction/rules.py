@@ -0,0 +1,292 @@
+"""Declarative rule packs for the event assembler.
+
+A rule pack holds the category keywords, strong keywords, schedule patterns and
+scoring weights used by event_assembler. Packs are JSON documents, loaded from a
+file or passed in as a dict, and any field left out falls back to the built-in
+defaults:
+
+    {
+      "name": "state-u",
+      "category_keywords": {"exam": ["midterm", "final", "exam"], ...},
+      "strong_keywords": {"exam": ["midterm", "final"], ...},
+      "schedule_patterns": ["week\\\\s+\\\\d+", ...],
+      "scoring": {"categorized": 0.70, "schedule_boost": 0.04}
+    }
+
+Category order in category_keywords is classification priority. Each pack is
+compiled once into matchers (one phrase regex per category and a word -> category
+index) and cached by content hash; pack files are also cached by path, mtime and
+size, so selecting a pack per job is cheap.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Optional, Union
+
+from pydantic import BaseModel, Field, field_validator
+
+# ── Built-in defaults ────────────────────────────────────────────────────────
+
+CATEGORY_KEYWORDS: dict[str, set[str]] = {
+    "exam": {"midterm", "final", "exam", "quiz", "test"},
+    "assignment": {
+        "due", "submit", "assignment", "homework", "hw", "paper",
+        "essay", "project", "lab report", "problem set", "pset",
+    },
+    "reading": {"read", "reading", "chapter", "ch."},
+    "holiday": {"no class", "holiday", "break", "recess", "thanksgiving", "labor day"},
+    "office_hours": {"office hours", "office hour"},
+}
+
+# Words/phrases that strongly indicate an event is actionable
+STRONG_KEYWORDS = {
+    "exam": {"midterm", "final", "exam", "quiz"},
+    "assignment": {"due", "submit", "assignment", "homework"},
+}
+
+# Context patterns that look like schedule entries; each hit boosts confidence
+SCHEDULE_PATTERNS = [
+    r"week\s+\d+",
+    r"(mon|tue|wed|thu|fri|sat|sun)\w*day",
+    r"lecture\s+\d+",
+    r"class\s+\d+",
+]
+
+
+@dataclass(frozen=True)
+class ScoreWeights:
+    """Confidence scoring constants (see _score_confidence for how they combine)."""
+    strong_two: float = 0.92  # strong category, 2+ strong keywords
+    strong_one: float = 0.87  # strong category, 1 strong keyword
+    strong_none: float = 0.50  # strong category, no strong keyword
+    categorized: float = 0.72  # non-strong but categorized
+    uncategorized: float = 0.45  # "other"
+    short_context_chars: int = 30
+    short_context_penalty: float = 0.10
+    year_inferred_penalty: float = 0.05
+    ambiguous_penalty: float = 0.10
+    schedule_boost: float = 0.03  # per matching schedule pattern
+    min_score: float = 0.10
+    max_score: float = 0.99
+
+
+_WEIGHT_NAMES = {f.name for f in fields(ScoreWeights)}
+
+
+# ── Rule pack format ─────────────────────────────────────────────────────────
+
+class RulePack(BaseModel):
+    """Declarative assembler rules; omitted fields use the built-in defaults."""
+    name: str = "default"
+    category_keywords: dict[str, list[str]] = Field(
+        default_factory=lambda: {k: sorted(v) for k, v in CATEGORY_KEYWORDS.items()}
+    )
+    strong_keywords: dict[str, list[str]] = Field(
+        default_factory=lambda: {k: sorted(v) for k, v in STRONG_KEYWORDS.items()}
+    )
+    schedule_patterns: list[str] = Field(default_factory=lambda: list(SCHEDULE_PATTERNS))
+    scoring: dict[str, float] = Field(default_factory=dict)  # overrides for ScoreWeights fields
+
+    @field_validator("scoring")
+    @classmethod
+    def _known_weights(cls, value: dict[str, float]) -> dict[str, float]:
+        unknown = set(value) - _WEIGHT_NAMES
+        if unknown:
+            raise ValueError(f"Unknown scoring weights: {', '.join(sorted(unknown))}")
+        return value
+
+    @field_validator("schedule_patterns")
+    @classmethod
+    def _valid_patterns(cls, value: list[str]) -> list[str]:
+        for pattern in value:
+            try:
+                re.compile(pattern)
+            except re.error as exc:
+                raise ValueError(f"Invalid schedule pattern {pattern!r}: {exc}") from exc
+        return value
+
+    def content_hash(self) -> str:
+        """Hash of the pack's canonical JSON, used as the compile cache key."""
+        canonical = json.dumps(
+            {
+                "name": self.name,
+                "category_keywords": {k: sorted(set(v)) for k, v in self.category_keywords.items()},
+                "strong_keywords": {k: sorted(set(v)) for k, v in sorted(self.strong_keywords.items())},
+                "schedule_patterns": self.schedule_patterns,
+                "scoring": dict(sorted(self.scoring.items())),
+            },
+            separators=(",", ":"),
+        )
+        return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+# ── Compiled matchers ────────────────────────────────────────────────────────
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """A rule pack compiled into matchers; immutable and shared across jobs."""
+    name: str
+    content_hash: str
+    categories: tuple[str, ...]  # in priority order
+    phrase_patterns: tuple[tuple[str, re.Pattern], ...]  # (category, alternation of multi-word keywords)
+    word_rank: dict[str, int]  # single-word keyword -> index of first category containing it
+    strong_keywords: dict[str, tuple[str, ...]]
+    schedule_patterns: tuple[re.Pattern, ...]
+    weights: ScoreWeights
+
+    def classify(self, context: str) -> str:
+        """Classify a context: multi-word phrases first, then single words, by category priority."""
+        ctx_lower = context.lower()
+
+        for category, pattern in self.phrase_patterns:
+            if pattern.search(ctx_lower):
+                return category
+
+        best: Optional[int] = None
+        for word in set(re.findall(r"\b\w+\b", ctx_lower)):
+            rank = self.word_rank.get(word)
+            if rank is not None and (best is None or rank < best):
+                best = rank
+        return self.categories[best] if best is not None else "other"
+
+    def is_categorized(self, category: str) -> bool:
+        return category in self.categories
+
+
+def _compile(pack: RulePack, content_hash: str) -> CompiledRules:
+    phrase_patterns: list[tuple[str, re.Pattern]] = []
+    word_rank: dict[str, int] = {}
+    categories = tuple(pack.category_keywords)
+
+    for rank, (category, keywords) in enumerate(pack.category_keywords.items()):
+        phrases = sorted({k.lower() for k in keywords if " " in k}, key=len, reverse=True)
+        if phrases:
+            phrase_patterns.append(
+                (category, re.compile("|".join(re.escape(p) for p in phrases)))
+            )
+        for word in {k.lower() for k in keywords if " " not in k}:
+            word_rank.setdefault(word, rank)
+
+    return CompiledRules(
+        name=pack.name,
+        content_hash=content_hash,
+        categories=categories,
+        phrase_patterns=tuple(phrase_patterns),
+        word_rank=word_rank,
+        strong_keywords={
+            k: tuple(sorted({kw.lower() for kw in v})) for k, v in pack.strong_keywords.items()
+        },
+        schedule_patterns=tuple(re.compile(p) for p in pack.schedule_patterns),
+        weights=ScoreWeights(**pack.scoring),
+    )
+
+
+# Compiled packs by content hash, and resolved pack files by (path, mtime, size).
+# Both are LRU-bounded: a long-lived worker sees a new entry per pack revision.
+COMPILED_CACHE_SIZE = 64
+RESOLVED_CACHE_SIZE = 64
+
+_compiled_cache: OrderedDict[str, CompiledRules] = OrderedDict()
+_resolved_cache: OrderedDict[tuple[str, int, int], CompiledRules] = OrderedDict()
+_compiled_lock = threading.Lock()
+_default_rules: Optional[CompiledRules] = None
+
+
+RuleSource = Union[CompiledRules, RulePack, dict]
+
+
+def compile_rules(pack: RuleSource) -> CompiledRules:
+    """Compile a rule pack, reusing an earlier compilation with the same content hash."""
+    if isinstance(pack, CompiledRules):
+        return pack
+    if isinstance(pack, dict):
+        pack = RulePack.model_validate(pack)
+
+    key = pack.content_hash()
+    with _compiled_lock:
+        compiled = _lru_get(_compiled_cache, key)
+    if compiled is None:
+        compiled = _compile(pack, key)
+        with _compiled_lock:
+            compiled = _lru_put(_compiled_cache, key, compiled, COMPILED_CACHE_SIZE)
+    return compiled
+
+
+def _lru_get(cache: OrderedDict, key):
+    value = cache.get(key)
+    if value is not None:
+        cache.move_to_end(key)
+    return value
+
+
+def _lru_put(cache: OrderedDict, key, value, max_entries: int):
+    """Store value unless another thread got there first; returns the cached value."""
+    existing = cache.get(key)
+    if existing is not None:
+        cache.move_to_end(key)
+        return existing
+    cache[key] = value
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+    return value
+
+
+def load_rule_pack(path: str) -> RulePack:
+    """Load a rule pack from a JSON file."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    data.setdefault("name", os.path.splitext(os.path.basename(path))[0])
+    return RulePack.model_validate(data)
+
+
+_RULE_PACK_NAME_RE = re.compile(r"^[A-Za-z0-9_\-]+$")
+
+
+def resolve_rule_pack(name: Optional[str], rule_pack_dir: Optional[str]) -> CompiledRules:
+    """Resolve a per-job rule pack name to compiled rules.
+
+    None (or "default") selects the built-in rules. Other names load
+    <rule_pack_dir>/<name>.json, cached until the file's mtime or size changes.
+
+    Raises:
+        ValueError: if the name is invalid or the pack cannot be found.
+    """
+    if not name or name == "default":
+        return default_rules()
+    if not _RULE_PACK_NAME_RE.match(name):
+        raise ValueError(f"Invalid rule pack name: {name!r}")
+    if not rule_pack_dir:
+        raise ValueError(f"Rule pack '{name}' requested but RULE_PACK_DIR is not set")
+
+    path = os.path.join(rule_pack_dir, f"{name}.json")
+    try:
+        stat = os.stat(path)
+    except OSError:
+        stat = None
+    if stat is None or not os.path.isfile(path):
+        raise ValueError(f"Rule pack '{name}' not found in {rule_pack_dir}")
+
+    # An unchanged file is not re-read, re-validated or re-hashed
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    with _compiled_lock:
+        compiled = _lru_get(_resolved_cache, key)
+    if compiled is None:
+        compiled = compile_rules(load_rule_pack(path))
+        with _compiled_lock:
+            compiled = _lru_put(_resolved_cache, key, compiled, RESOLVED_CACHE_SIZE)
+    return compiled
+
+
+def default_rules() -> CompiledRules:
+    """The built-in rules, compiled once (never evicted)."""
+    global _default_rules
+    if _default_rules is None:
+        _default_rules = compile_rules(RulePack())
+    return _default_rules
@@ -2,7 +2,7 @@
 
 Supports:
 - PDF text extraction via pdfplumber (page-by-page)
-- Table detection in PDFs
+- Table detection in PDFs, with header-aware column layouts
 - DOCX paragraph extraction via python-docx
 - Image OCR via pytesseract (used as fallback for scanned PDFs and direct image uploads)
 """
@@ -10,9 +10,21 @@ Supports:
 from __future__ import annotations
 
 import os
+import re
 from typing import Optional
 
-from ..schemas import PageText
+from ..schemas import PageText, TableLayout, TableRow
+
+# ── Table header detection ───────────────────────────────────────────────────
+
+# Header words that identify a column's role in a schedule table.
+# Checked in order; each role is assigned to the first matching column.
+TABLE_COLUMN_ROLES: dict[str, set[str]] = {
+    "date": {"date", "day", "when"},
+    "topic": {"topic", "subject", "lecture", "content", "description", "agenda"},
+    "due": {"due", "assignment", "deliverable", "homework", "hw"},
+    "reading": {"reading", "read", "chapter", "preparation"},
+}
 
 
 def extract_text(file_path: str) -> list[PageText]:
@@ -37,6 +49,9 @@ def _extract_pdf(file_path: str) -> list[PageText]:
     import pdfplumber
 
     pages: list[PageText] = []
+    # Layout of the most recent headed table; continuation tables on later
+    # pages (no header row, same column count) inherit it
+    last_layout: Optional[TableLayout] = None
 
     with pdfplumber.open(file_path) as pdf:
         for i, page in enumerate(pdf.pages):
@@ -46,14 +61,29 @@ def _extract_pdf(file_path: str) -> list[PageText]:
             # Attempt table extraction
             tables = page.extract_tables()
             table_text_parts: list[str] = []
-            if tables:
-                for table in tables:
-                    for row in table:
-                        if row:
-                            # Clean cells: strip whitespace, drop None/empty
-                            cells = [str(c).strip() for c in row if c and str(c).strip()]
-                            if cells:
-                                table_text_parts.append(" | ".join(cells))
+            layouts: list[TableLayout] = []
+            rows: list[TableRow] = []
+            for table in tables or []:
+                table_rows = [_clean_row(row) for row in table if row]
+                table_rows = [cells for cells in table_rows if any(cells)]
+                if not table_rows:
+                    continue
+
+                layout, has_header = _detect_table_layout(table_rows, last_layout)
+                if layout.columns:
+                    last_layout = layout
+                table_index = len(layouts)
+                layouts.append(layout)
+
+                for row_num, cells in enumerate(table_rows):
+                    # Pipe-joined text keeps non-empty cells only (used for date finding);
+                    # the structured row keeps column positions
+                    table_text_parts.append(" | ".join(c for c in cells if c))
+                    rows.append(TableRow(
+                        cells=cells,
+                        table=table_index,
+                        is_header=has_header and row_num == 0,
+                    ))
 
             if text.strip():
                 pages.append(PageText(page=i + 1, text=text, source_kind="pdf_text"))
@@ -64,6 +94,8 @@ def _extract_pdf(file_path: str) -> list[PageText]:
                         page=i + 1,
                         text="\n".join(table_text_parts),
                         source_kind="table",
+                        tables=layouts,
+                        rows=rows,
                     )
                 )
 
@@ -83,6 +115,51 @@ def _extract_pdf(file_path: str) -> list[PageText]:
     return pages
 
 
+def _clean_row(row: list) -> list[str]:
+    """Normalize table cells: None -> "", collapse internal whitespace/newlines."""
+    return [" ".join(str(c).split()) if c is not None else "" for c in row]
+
+
+def detect_table_columns(cells: list[str]) -> dict[str, int]:
+    """Map column roles (date/topic/due/reading) to indices if cells look like a header row.
+
+    Returns an empty dict when the row is not a schedule header: a header needs a
+    date column plus at least one other role, and no digits (which indicate data).
+    """
+    if any(re.search(r"\d", c) for c in cells):
+        return {}
+
+    columns: dict[str, int] = {}
+    for index, cell in enumerate(cells):
+        words = {w.rstrip("s") if len(w) > 3 else w for w in re.findall(r"[a-z]+", cell.lower())}
+        for role, keywords in TABLE_COLUMN_ROLES.items():
+            if role not in columns and words & keywords:
+                columns[role] = index
+                break
+
+    if "date" not in columns or len(columns) < 2:
+        return {}
+    return columns
+
+
+def _detect_table_layout(
+    table_rows: list[list[str]],
+    previous: Optional[TableLayout],
+) -> tuple[TableLayout, bool]:
+    """Detect a table's column layout from its first row.
+
+    Returns (layout, has_header). Tables without a header row inherit the previous
+    headed table's layout when the column count matches (tables split across pages).
+    """
+    first = table_rows[0]
+    columns = detect_table_columns(first)
+    if columns:
+        return TableLayout(header=first, columns=columns), True
+    if previous is not None and len(previous.header) == len(first):
+        return previous, False
+    return TableLayout(), False
+
+
 def _extract_docx(file_path: str) -> list[PageText]:
     """Extract text from DOCX using python-docx."""
     from docx import Document
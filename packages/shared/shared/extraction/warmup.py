@@ -0,0 +1,65 @@
+"""Preload extraction modules so the first real job in a process is not the slow one.
+
+The extractors import pdfplumber, python-docx and the OCR stack lazily, dateparser
+loads its language data on first use, and rule packs are compiled on first
+resolve. warm_up() pays those costs up front (e.g. in a worker process right
+after fork) by importing the libraries and running the pipeline on a tiny
+synthetic page.
+"""
+
+from __future__ import annotations
+
+import importlib
+import time
+
+from ..schemas import PageText
+
+# Third-party modules the extractors import inside functions. OCR modules are optional.
+_LAZY_IMPORTS = ("pdfplumber", "docx", "pytesseract", "PIL.Image")
+
+_SAMPLE_PAGE = PageText(
+    page=1,
+    text=(
+        "Spring 2026 Schedule\n"
+        "Feb 13 | Homework 1 due\n"
+        "2/20 Quiz 1\n"
+        "2026-03-06 Midterm exam\n"
+    ),
+    source_kind="pdf_text",
+)
+
+
+def warm_up() -> dict[str, float]:
+    """Import and exercise the extraction pipeline; returns seconds spent per step.
+
+    Missing optional libraries are skipped.
+    """
+    timings: dict[str, float] = {}
+
+    start = time.perf_counter()
+    for name in _LAZY_IMPORTS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            continue
+    timings["imports"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from .rules import default_rules
+
+    rules = default_rules()
+    timings["rules"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from .date_finder import find_date_candidates
+
+    candidates = find_date_candidates([_SAMPLE_PAGE], filename="warmup.pdf")
+    timings["find"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    from .event_assembler import assemble_events
+
+    assemble_events(candidates, rules=rules)
+    timings["assemble"] = time.perf_counter() - start
+
+    return timings
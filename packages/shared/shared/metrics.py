@@ -0,0 +1,321 @@
+"""Pipeline instrumentation: per-stage timers and counters in Prometheus text format.
+
+Both the API (inline extraction) and the worker wrap each pipeline stage in
+PipelineRun.stage(), which records into a process-wide registry:
+
+    syllascribe_stage_duration_seconds{stage, file_type, source_kind}   histogram
+    syllascribe_pipeline_items_total{item, file_type, source_kind}      counter
+        item: pages | ocr_pages | candidates | events | llm_routed
+    syllascribe_llm_requests_total{provider, outcome}                  counter
+    syllascribe_warmup_duration_seconds{step}                           histogram
+    syllascribe_first_task_duration_seconds{task, warm}                 histogram
+    syllascribe_job_cost_seconds{lane, kind}                            histogram
+        kind: estimated (at upload) | actual (measured pipeline time)
+
+render() produces the Prometheus text exposition format. The API serves it at
+/api/metrics. Worker processes each write a file (node_exporter textfile /
+pushgateway compatible); serve_textfiles() merges them behind one HTTP port.
+"""
+
+from __future__ import annotations
+
+import bisect
+import glob
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+DEFAULT_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0)
+
+
+def _format_labels(names: tuple[str, ...], values: tuple[str, ...], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_value(value: float) -> str:
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+class Counter:
+    def __init__(self, name: str, documentation: str, labelnames: tuple[str, ...]):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self._values: dict[tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(tuple(str(labels.get(n, "")) for n in self.labelnames), 0.0)
+
+    def render(self, extra: str = "") -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            for key, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, key, extra)} {_format_value(value)}")
+        return lines
+
+
+class Histogram:
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: tuple[str, ...],
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = labelnames
+        self.buckets = tuple(sorted(buckets))
+        # label values -> [per-bucket counts..., +Inf count], sum
+        self._series: dict[tuple[str, ...], tuple[list[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        key = tuple(str(labels.get(n, "")) for n in self.labelnames)
+        index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            counts, total = self._series.get(key, ([0] * (len(self.buckets) + 1), 0.0))
+            counts[index] += 1
+            self._series[key] = (counts, total + value)
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(tuple(str(labels.get(n, "")) for n in self.labelnames))
+        return sum(series[0]) if series else 0
+
+    def render(self, extra: str = "") -> list[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            for key, (counts, total) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, count in zip(self.buckets + (float("inf"),), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == float("inf") else _format_value(bound)
+                    labels = _format_labels(self.labelnames + ("le",), key + (le,), extra)
+                    lines.append(f"{self.name}_bucket{labels} {cumulative}")
+                labels = _format_labels(self.labelnames, key, extra)
+                lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+                lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: list = []
+
+    def counter(self, name: str, documentation: str, labelnames: tuple[str, ...]) -> Counter:
+        metric = Counter(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(self, name: str, documentation: str, labelnames: tuple[str, ...]) -> Histogram:
+        metric = Histogram(name, documentation, labelnames)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self, extra_labels: Optional[dict[str, str]] = None) -> str:
+        """Prometheus text exposition; extra_labels are added to every sample."""
+        extra = ",".join(f'{k}="{_escape(v)}"' for k, v in (extra_labels or {}).items())
+        lines: list[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render(extra))
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_DURATION = REGISTRY.histogram(
+    "syllascribe_stage_duration_seconds",
+    "Time spent in each extraction pipeline stage.",
+    ("stage", "file_type", "source_kind"),
+)
+PIPELINE_ITEMS = REGISTRY.counter(
+    "syllascribe_pipeline_items_total",
+    "Items processed by the extraction pipeline.",
+    ("item", "file_type", "source_kind"),
+)
+LLM_REQUESTS = REGISTRY.counter(
+    "syllascribe_llm_requests_total",
+    "LLM provider requests by outcome.",
+    ("provider", "outcome"),
+)
+WARMUP_DURATION = REGISTRY.histogram(
+    "syllascribe_warmup_duration_seconds",
+    "Time spent preloading extraction modules when a worker process starts.",
+    ("step",),
+)
+FIRST_TASK_DURATION = REGISTRY.histogram(
+    "syllascribe_first_task_duration_seconds",
+    "Duration of the first task run by each worker process, by whether it was warmed up.",
+    ("task", "warm"),
+)
+JOB_COST = REGISTRY.histogram(
+    "syllascribe_job_cost_seconds",
+    "Estimated and measured processing time per job, by scheduling lane.",
+    ("lane", "kind"),
+)
+
+
+def primary_source_kind(pages) -> str:
+    """Label value for a document's pages: ocr > docx > pdf_text (tables come from PDFs)."""
+    kinds = {p.source_kind for p in pages}
+    for kind in ("ocr", "docx"):
+        if kind in kinds:
+            return kind
+    return "pdf_text" if kinds else "unknown"
+
+
+class PipelineRun:
+    """Stage timers and counters for one job, labelled by file type and source kind.
+
+    A deferred run buffers its observations instead of recording them, so a run
+    made in another process (e.g. the API's extraction pool) can be pickled back
+    and recorded with flush() in the process that exports the metrics.
+    """
+
+    def __init__(self, filename: str = "", deferred: bool = False):
+        self.file_type = os.path.splitext(filename)[1].lower().lstrip(".") or "unknown"
+        self.source_kind = "unknown"
+        self.durations: dict[str, float] = {}
+        self._pending: Optional[list[tuple[str, float, dict[str, str]]]] = [] if deferred else None
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[None]:
+        """Time a stage (recorded even if it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.durations[name] = self.durations.get(name, 0.0) + elapsed
+            self._record("stage", elapsed, stage=name, file_type=self.file_type, source_kind=self.source_kind)
+
+    def set_pages(self, pages) -> None:
+        """Record page counts and take the source_kind label from the extracted pages."""
+        self.source_kind = primary_source_kind(pages)
+        self.count("pages", len(pages))
+        self.count("ocr_pages", sum(1 for p in pages if p.source_kind == "ocr"))
+
+    def count(self, item: str, amount: int) -> None:
+        if amount:
+            self._record("items", amount, item=item, file_type=self.file_type, source_kind=self.source_kind)
+
+    def flush(self) -> None:
+        """Record a deferred run's buffered observations in this process (and stop deferring)."""
+        pending, self._pending = self._pending or [], None
+        for kind, value, labels in pending:
+            self._record(kind, value, **labels)
+
+    def _record(self, kind: str, value: float, **labels: str) -> None:
+        if self._pending is not None:
+            self._pending.append((kind, value, labels))
+        elif kind == "stage":
+            STAGE_DURATION.observe(value, **labels)
+        else:
+            PIPELINE_ITEMS.inc(value, **labels)
+
+    def summary(self) -> dict[str, float]:
+        """Stage durations in milliseconds (for task results and logs)."""
+        return {name: round(seconds * 1000, 1) for name, seconds in self.durations.items()}
+
+
+# ── Multi-process export ─────────────────────────────────────────────────────
+
+def write_textfile(directory: str, extra_labels: Optional[dict[str, str]] = None) -> str:
+    """Atomically write this process's metrics to <directory>/worker-<pid>.prom."""
+    os.makedirs(directory, exist_ok=True)
+    path = os.path.join(directory, f"worker-{os.getpid()}.prom")
+    fd, tmp = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    with os.fdopen(fd, "w") as f:
+        f.write(REGISTRY.render(extra_labels))
+    os.replace(tmp, path)
+    return path
+
+
+def merge_expositions(texts: list[str]) -> str:
+    """Combine text expositions (one per process), keeping each family's HELP/TYPE once.
+
+    Samples from different processes must already differ by a label (e.g. worker pid).
+    """
+    families: "OrderedDict[str, tuple[list[str], list[str]]]" = OrderedDict()
+    for text in texts:
+        current: Optional[str] = None
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            if line.startswith("# HELP ") or line.startswith("# TYPE "):
+                current = line.split()[2]
+                meta, _ = families.setdefault(current, ([], []))
+                if line not in meta:
+                    meta.append(line)
+            elif current is not None:
+                families[current][1].append(line)
+    lines: list[str] = []
+    for meta, samples in families.values():
+        lines.extend(meta)
+        lines.extend(samples)
+    return "\n".join(lines) + "\n"
+
+
+def read_textfiles(directory: str) -> str:
+    """Merged exposition of every *.prom file in directory."""
+    texts = []
+    if os.path.isdir(directory):
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(".prom"):
+                try:
+                    with open(os.path.join(directory, name), encoding="utf-8") as f:
+                        texts.append(f.read())
+                except OSError:
+                    continue
+    return merge_expositions(texts)
+
+
+def clear_textfiles(directory: str) -> None:
+    """Remove metrics files left by earlier worker processes."""
+    for path in glob.glob(os.path.join(directory, "*.prom")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def serve_textfiles(directory: str, port: int, host: str = "0.0.0.0"):
+    """Serve the merged metrics files of directory at http://host:port/metrics (daemon thread)."""
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?")[0] not in ("/", "/metrics"):
+                self.send_response(404)
+                self.end_headers()
+                return
+            body = read_textfiles(directory).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="metrics-http", daemon=True).start()
+    return server
@@ -0,0 +1,104 @@
+"""Per-job progress events over Redis pub/sub.
+
+The worker publishes an event as each pipeline step completes; the API streams
+them to clients as server-sent events (GET /api/job/{job_id}/progress) instead
+of clients polling the job row. Each event is a small JSON object:
+
+    {"job_id": ..., "stage": ..., "status": ..., "ts": ..., <detail>}
+
+    stage      status      detail
+    queued     queued      (API only: first event of a stream, from the job row;
+    processing processing   stage and status are both the row's status)
+    extracting processing
+    pages      processing  pages, ocr_pages
+    candidates processing  candidates
+    assembled  processing  events
+    llm        processing  routed, skipped
+    done       ready | needs_review  events
+    failed     failed      error
+
+Events go to the channel syllascribe:progress:<job_id>, and the latest one is
+also stored under syllascribe:progress:<job_id>:last so a client that connects
+mid-job starts from the current step. Publishing is best effort: without a
+reachable Redis the pipeline runs unchanged.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from typing import Any, Optional
+
+CHANNEL_PREFIX = "syllascribe:progress:"
+LAST_EVENT_TTL_SECONDS = 3600
+TERMINAL_STAGES = frozenset({"done", "failed"})
+# After a connection failure, skip publishing for this long instead of timing out on every event
+RECONNECT_BACKOFF_SECONDS = 30.0
+
+
+def channel(job_id: str) -> str:
+    return f"{CHANNEL_PREFIX}{job_id}"
+
+
+def last_event_key(job_id: str) -> str:
+    return f"{CHANNEL_PREFIX}{job_id}:last"
+
+
+def make_event(job_id: str, stage: str, status: str = "processing", **detail: Any) -> dict:
+    return {"job_id": str(job_id), "stage": stage, "status": status, "ts": round(time.time(), 3), **detail}
+
+
+def is_terminal(event: dict) -> bool:
+    return event.get("stage") in TERMINAL_STAGES
+
+
+class ProgressPublisher:
+    """Publishes progress events; connects lazily and never raises."""
+
+    def __init__(self, redis_url: str = "", client=None):
+        self.redis_url = redis_url
+        self._client = client
+        self._pid = os.getpid()
+        self._retry_at = 0.0
+
+    @property
+    def enabled(self) -> bool:
+        return self._client is not None or self.redis_url.startswith(("redis://", "rediss://", "unix://"))
+
+    def _get_client(self):
+        # A client inherited across fork shares the parent's socket; reconnect per process
+        if self._client is None or os.getpid() != self._pid:
+            import redis
+
+            self._client = redis.Redis.from_url(self.redis_url, socket_connect_timeout=1, socket_timeout=2)
+            self._pid = os.getpid()
+        return self._client
+
+    def publish(self, job_id: str, stage: str, status: str = "processing", **detail: Any) -> Optional[dict]:
+        """Publish an event and store it as the job's latest; returns it, or None if not sent."""
+        if not self.enabled or time.monotonic() < self._retry_at:
+            return None
+        event = make_event(job_id, stage, status, **detail)
+        payload = json.dumps(event, separators=(",", ":"))
+        try:
+            client = self._get_client()
+            pipe = client.pipeline(transaction=False)
+            pipe.set(last_event_key(job_id), payload, ex=LAST_EVENT_TTL_SECONDS)
+            pipe.publish(channel(job_id), payload)
+            pipe.execute()
+        except Exception:
+            self._retry_at = time.monotonic() + RECONNECT_BACKOFF_SECONDS
+            return None
+        return event
+
+
+_publisher: Optional[ProgressPublisher] = None
+
+
+def get_publisher() -> ProgressPublisher:
+    """Process-wide publisher for REDIS_URL."""
+    global _publisher
+    if _publisher is None:
+        _publisher = ProgressPublisher(os.environ.get("REDIS_URL", ""))
+    return _publisher
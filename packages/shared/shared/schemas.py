@@ -9,11 +9,26 @@ from typing import Optional
 from pydantic import BaseModel, Field
 
 
+class TableLayout(BaseModel):
+    """Column layout of a table, detected once from its header row."""
+    header: list[str] = Field(default_factory=list)
+    columns: dict[str, int] = Field(default_factory=dict)  # role -> column index: date | topic | due | reading
+
+
+class TableRow(BaseModel):
+    """A structured table row, aligned 1:1 with the lines of a table PageText."""
+    cells: list[str]  # cell text by column position ("" for empty cells)
+    table: int = 0  # index into PageText.tables
+    is_header: bool = False
+
+
 class PageText(BaseModel):
     """Extracted text from a single page or document section."""
     page: int
     text: str
     source_kind: str = "pdf_text"  # pdf_text | table | ocr | docx
+    tables: list[TableLayout] = Field(default_factory=list)  # only for source_kind == "table"
+    rows: list[TableRow] = Field(default_factory=list)  # one per line of text
 
 
 class Candidate(BaseModel):
@@ -25,6 +40,8 @@ class Candidate(BaseModel):
     source_kind: str = "pdf_text"
     year_inferred: bool = False
     is_ambiguous: bool = False
+    table_row: Optional[list[str]] = None  # row cells, set when the table has a detected header
+    table_columns: Optional[dict[str, int]] = None  # role -> column index for table_row
 
 
 class EventDraft(BaseModel):
@@ -0,0 +1,115 @@
+"""Tests for upload-time job cost estimates."""
+
+import os
+import zlib
+
+from shared.extraction.cost_estimator import (
+    FAST_LANE,
+    SLOW_LANE,
+    estimate_cost,
+    estimate_file_cost,
+    pdf_likely_scanned,
+    pdf_page_count,
+)
+
+FIXTURE = os.path.join(os.path.dirname(__file__), "..", "fixtures", "synthetic_syllabus.pdf")
+
+
+def _pdf(pages: int, page_resources: bytes) -> bytes:
+    """Minimal PDF: catalog, page tree and `pages` leaf pages sharing one resources dict."""
+    kids = b" ".join(b"%d 0 R" % (3 + i) for i in range(pages))
+    objects = [
+        b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n",
+        b"2 0 obj\n<< /Type /Pages /Kids [%s] /Count %d >>\nendobj\n" % (kids, pages),
+    ]
+    for i in range(pages):
+        objects.append(
+            b"%d 0 obj\n<< /Type /Page /Parent 2 0 R /Resources << %s >> >>\nendobj\n" % (3 + i, page_resources)
+        )
+    body = b"%PDF-1.4\n" + b"".join(objects)
+    return body + b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n0\n%%%%EOF\n" % (len(objects) + 1)
+
+
+def _object_stream_pdf() -> bytes:
+    """PDF 1.5 text page with a logo: the page and font dicts are compressed in an /ObjStm,
+    while the image XObject (a stream, so never in an object stream) stays readable."""
+    compressed = [
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792]"
+        b" /Resources << /Font << /F1 4 0 R >> /XObject << /Im0 5 0 R >> >> >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    offsets, body = [], b""
+    for obj in compressed:
+        offsets.append(len(body))
+        body += obj + b" "
+    header = b"3 %d 4 %d " % tuple(offsets)
+    stream = zlib.compress(header + body)
+    objects = [
+        b"1 0 obj\n<< /Type /Catalog /Pages 2 0 R >>\nendobj\n",
+        b"2 0 obj\n<< /Type /Pages /Kids [3 0 R] /Count 1 >>\nendobj\n",
+        b"5 0 obj\n<< /Type /XObject /Subtype /Image /Width 10 /Height 10 /Length 3 >>\nstream\nxyz\nendstream\nendobj\n",
+        b"6 0 obj\n<< /Type /ObjStm /N 2 /First %d /Filter /FlateDecode /Length %d >>\nstream\n%s\nendstream\nendobj\n"
+        % (len(header), len(stream), stream),
+    ]
+    return b"%PDF-1.5\n" + b"".join(objects) + b"trailer\n<< /Size 7 /Root 1 0 R >>\nstartxref\n0\n%%EOF\n"
+
+
+TEXT_RESOURCES = b"/Font << /F1 << /Type /Font /Subtype /Type1 /BaseFont /Helvetica >> >>"
+SCANNED_RESOURCES = b"/XObject << /Im0 << /Type /XObject /Subtype /Image /Width 10 /Height 10 >> >>"
+
+
+class TestPdfInspection:
+    def test_page_count_from_catalog(self):
+        assert pdf_page_count(_pdf(7, TEXT_RESOURCES)) == 7
+        with open(FIXTURE, "rb") as f:
+            assert pdf_page_count(f.read()) == 2
+
+    def test_page_count_without_trailer(self):
+        data = _pdf(3, TEXT_RESOURCES).split(b"trailer")[0]
+        assert pdf_page_count(data) == 3
+
+    def test_unreadable_page_tree(self):
+        assert pdf_page_count(b"%PDF-1.5\n" + b"\0" * 100) is None
+
+    def test_scanned_detection(self):
+        assert pdf_likely_scanned(_pdf(1, SCANNED_RESOURCES))
+        assert not pdf_likely_scanned(_pdf(1, TEXT_RESOURCES))
+        assert not pdf_likely_scanned(_pdf(1, TEXT_RESOURCES + b" " + SCANNED_RESOURCES))
+
+    def test_compressed_object_streams_are_not_scanned(self):
+        data = _object_stream_pdf()
+        # Only the image is visible in the raw bytes
+        assert b"/Subtype /Image" in data and b"/Type /Font" not in data
+        assert not pdf_likely_scanned(data)
+        estimate = estimate_cost("syllabus.pdf", data)
+        assert estimate.pages == 1
+        assert estimate.lane() == FAST_LANE
+
+
+class TestLanes:
+    def test_small_documents_are_fast(self):
+        assert estimate_cost("notes.docx", b"x" * 20_000).lane() == FAST_LANE
+        assert estimate_cost("syllabus.pdf", _pdf(20, TEXT_RESOURCES)).lane() == FAST_LANE
+
+    def test_scanned_pdfs_are_slow(self):
+        estimate = estimate_cost("scan.pdf", _pdf(20, SCANNED_RESOURCES))
+        assert estimate.pages == 20
+        assert estimate.likely_scanned
+        assert estimate.lane() == SLOW_LANE
+
+    def test_threshold(self):
+        estimate = estimate_cost("photo.png", b"\x89PNG")
+        assert estimate.likely_scanned
+        assert estimate.lane(fast_lane_max_seconds=1.0) == SLOW_LANE
+        assert estimate.lane(fast_lane_max_seconds=60.0) == FAST_LANE
+
+
+def test_file_estimate_matches_bytes(tmp_path):
+    data = _pdf(12, SCANNED_RESOURCES)
+    path = tmp_path / "scan.pdf"
+    path.write_bytes(data)
+    assert estimate_file_cost("scan.pdf", str(path)) == estimate_cost("scan.pdf", data)
+
+    empty = tmp_path / "empty.pdf"
+    empty.write_bytes(b"")
+    assert estimate_file_cost("empty.pdf", str(empty)).size_bytes == 0
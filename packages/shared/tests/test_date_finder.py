@@ -16,7 +16,7 @@ from shared.extraction.date_finder import (
     _deduplicate,
     _infer_year_from_filename,
 )
-from shared.schemas import PageText, Candidate
+from shared.schemas import PageText, Candidate, TableLayout, TableRow
 
 
 # ── Regex pattern tests ──────────────────────────────────────────────────────
@@ -276,3 +276,32 @@ class TestFindDateCandidates:
         pages = [PageText(page=1, text="Spring 2026\nDue 02/13/26")]
         candidates = find_date_candidates(pages)
         assert any(c.date == date(2026, 2, 13) for c in candidates)
+
+
+# ── Structured table rows ────────────────────────────────────────────────────
+
+class TestTableRows:
+    def _table_page(self) -> PageText:
+        return PageText(
+            page=1,
+            text="Date | Topic | Due\nJan 12 | Intro\nJan 14 | Loops | HW 1",
+            source_kind="table",
+            tables=[TableLayout(header=["Date", "Topic", "Due"], columns={"date": 0, "topic": 1, "due": 2})],
+            rows=[
+                TableRow(cells=["Date", "Topic", "Due"], is_header=True),
+                TableRow(cells=["Jan 12", "Intro", ""]),
+                TableRow(cells=["Jan 14", "Loops", "HW 1"]),
+            ],
+        )
+
+    def test_candidates_carry_their_row(self):
+        candidates = find_date_candidates([self._table_page()], term_hint="Spring 2026")
+        by_date = {c.date: c for c in candidates}
+        assert by_date[date(2026, 1, 12)].table_row == ["Jan 12", "Intro", ""]
+        assert by_date[date(2026, 1, 14)].table_row == ["Jan 14", "Loops", "HW 1"]
+        assert by_date[date(2026, 1, 14)].table_columns == {"date": 0, "topic": 1, "due": 2}
+
+    def test_plain_text_has_no_row(self):
+        pages = [PageText(page=1, text="Midterm on Jan 12", source_kind="pdf_text")]
+        candidates = find_date_candidates(pages, term_hint="Spring 2026")
+        assert candidates[0].table_row is None
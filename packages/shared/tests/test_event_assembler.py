@@ -5,10 +5,15 @@ from datetime import date
 import pytest
 
 from shared.extraction.event_assembler import (
+    AssemblyMemo,
     assemble_events,
     _classify_category,
+    _assemble_from_columns,
     _extract_title,
     _score_confidence,
+    extract_score_features,
+    score_confidence_batch,
+    score_features,
 )
 from shared.schemas import Candidate
 
@@ -128,6 +133,44 @@ class TestExtractTitle:
         assert title == "Mid-term exam"
 
 
+# ── Column-mapped table rows ─────────────────────────────────────────────────
+
+class TestAssembleFromColumns:
+    COLUMNS = {"date": 1, "topic": 2, "due": 3, "reading": 4}
+
+    def test_topic_column_is_title_with_reading_category(self):
+        cells = ["3", "Jan 26", "Control Flow", "", "Ch. 3"]
+        assert _assemble_from_columns(cells, self.COLUMNS, "Jan 26") == ("reading", "Control Flow")
+
+    def test_topic_and_due_joined(self):
+        cells = ["4", "Feb 2", "Functions", "Problem Set 2", ""]
+        category, title = _assemble_from_columns(cells, self.COLUMNS, "Feb 2")
+        assert category == "assignment"
+        assert title == "Functions; Problem Set 2"
+
+    def test_due_column_implies_assignment(self):
+        cells = ["5", "Feb 9", "", "Lab write-up", ""]
+        assert _assemble_from_columns(cells, self.COLUMNS, "Feb 9") == ("assignment", "Lab write-up")
+
+    def test_reading_only_row(self):
+        cells = ["6", "Feb 16", "", "", "Smith pp. 10-40"]
+        assert _assemble_from_columns(cells, self.COLUMNS, "Feb 16") == ("reading", "Smith pp. 10-40")
+
+    def test_empty_columns_fall_back(self):
+        assert _assemble_from_columns(["7", "Feb 23", "", "", ""], self.COLUMNS, "Feb 23") is None
+
+    def test_assemble_events_uses_columns(self):
+        candidate = Candidate(
+            date=date(2026, 1, 30), raw_match="Jan 30",
+            context="Jan 30 | Midterm Review | Essay 1", page=1, source_kind="table",
+            table_row=["", "Jan 30", "Midterm Review", "Essay 1", ""],
+            table_columns=self.COLUMNS,
+        )
+        event = assemble_events([candidate])[0]
+        assert event.title == "Midterm Review; Essay 1"
+        assert event.category == "exam"
+
+
 # ── Confidence scoring ───────────────────────────────────────────────────────
 
 class TestScoreConfidence:
@@ -178,6 +221,53 @@ class TestScoreConfidence:
         assert 0.10 <= score <= 0.99
 
 
+# ── Batch scoring ────────────────────────────────────────────────────────────
+
+class TestBatchScoring:
+    def _combinations(self):
+        """Candidates covering every branch of _score_confidence."""
+        keyword_sets = ["", "midterm", "midterm exam", "reading", "due submit homework"]
+        schedule_sets = ["", "week 1", "week 1 monday", "week 1 monday lecture 2 class 3"]
+        padding = ["", " with enough surrounding text to not be short"]
+        combos = []
+        for kw in keyword_sets:
+            for sched in schedule_sets:
+                for pad in padding:
+                    for category in ("exam", "assignment", "reading", "holiday", "other"):
+                        for year_inferred in (False, True):
+                            for is_ambiguous in (False, True):
+                                context = f"{kw} {sched}{pad}".strip() or "x"
+                                combos.append((Candidate(
+                                    date=date(2026, 1, 1), raw_match="Jan 1", context=context,
+                                    page=1, year_inferred=year_inferred, is_ambiguous=is_ambiguous,
+                                ), category))
+        return combos
+
+    def test_matches_scalar_scores_exactly(self):
+        combos = self._combinations()
+        candidates = [c for c, _ in combos]
+        categories = [cat for _, cat in combos]
+        batch = score_confidence_batch(candidates, categories)
+        scalar = [_score_confidence(c.context, cat, c) for c, cat in combos]
+        assert batch == scalar
+
+    def test_features_are_arrays(self):
+        candidates = [
+            Candidate(date=date(2026, 3, 4), raw_match="March 4",
+                      context="Week 7 midterm exam March 4", page=1, year_inferred=True),
+        ]
+        features = extract_score_features(candidates, ["exam"])
+        assert len(features) == 1
+        assert features.strong_hits.tolist() == [2]
+        assert features.schedule_hits.shape == (1, 4)
+        assert score_features(features).tolist() == [
+            _score_confidence(candidates[0].context, "exam", candidates[0])
+        ]
+
+    def test_empty_batch(self):
+        assert score_confidence_batch([], []) == []
+
+
 # ── Integration: assemble_events ─────────────────────────────────────────────
 
 class TestAssembleEvents:
@@ -224,3 +314,44 @@ class TestAssembleEvents:
         ]
         events = assemble_events(candidates)
         assert all(e.all_day for e in events)
+
+
+# ── Memoization ──────────────────────────────────────────────────────────────
+
+class TestAssemblyMemo:
+    def test_shared_context_reuses_results(self):
+        context = "Week 3 | Jan 26 | Control Flow | Feb 2 | Quiz 1"
+        candidates = [
+            Candidate(date=date(2026, 1, 26), raw_match="Jan 26", context=context, page=1),
+            Candidate(date=date(2026, 2, 2), raw_match="Feb 2", context=context, page=1),
+        ]
+        memo = AssemblyMemo()
+        events = assemble_events(candidates, memo=memo)
+        assert len(events) == 2
+        assert events[0].category == events[1].category
+        assert events[0].confidence == events[1].confidence
+        # Category and score features hit on the second candidate; title is per raw_match
+        assert memo.hits == 2
+        assert memo.misses == 4
+        assert memo.stats()["hit_rate"] == round(2 / 6, 3)
+
+    def test_memoized_matches_unmemoized(self):
+        candidates = [
+            Candidate(date=date(2026, 3, 4), raw_match="March 4",
+                      context="MIDTERM EXAM — March 4", page=1),
+            Candidate(date=date(2026, 3, 4), raw_match="March 4",
+                      context="MIDTERM EXAM — March 4", page=2, is_ambiguous=True),
+        ]
+        events = assemble_events(candidates, memo=AssemblyMemo())
+        expected = [
+            _score_confidence(c.context, "exam", c) for c in candidates
+        ]
+        assert [e.confidence for e in events] == expected
+
+    def test_bounded_size(self):
+        memo = AssemblyMemo(max_entries=2)
+        for i in range(5):
+            memo.get_or_compute(("k", i), lambda: i)
+        assert memo.stats()["entries"] == 2
+        assert memo.get_or_compute(("k", 4), lambda: -1) == 4
+        assert memo.get_or_compute(("k", 0), lambda: -1) == -1
@@ -0,0 +1,117 @@
+"""Tests for llm_cache: keying, SQLite backend TTL/eviction, cache-aware classification."""
+
+from datetime import date
+
+import pytest
+
+from shared.extraction.llm_cache import (
+    SQLiteLLMCache,
+    cache_key,
+    classify_cached,
+    open_llm_cache,
+)
+from shared.schemas import Candidate, LLMClassification
+
+
+def _candidate(context: str, raw_match: str = "Mar 4") -> Candidate:
+    return Candidate(date=date(2026, 3, 4), raw_match=raw_match, context=context, page=1)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCacheKey:
+    def test_normalizes_context(self):
+        a = cache_key(_candidate("Midterm  Exam | Mar 4"), "m", "1", 300)
+        b = cache_key(_candidate("midterm exam mar 4"), "m", "1", 300)
+        assert a == b
+
+    def test_varies_by_model_and_prompt_version(self):
+        c = _candidate("Midterm Exam Mar 4")
+        assert cache_key(c, "m1", "1", 300) != cache_key(c, "m2", "1", 300)
+        assert cache_key(c, "m1", "1", 300) != cache_key(c, "m1", "2", 300)
+
+
+class TestSQLiteCache:
+    def test_round_trip(self, tmp_path):
+        cache = SQLiteLLMCache(str(tmp_path / "c.db"))
+        cache.set_many({"k": {"title": "Midterm"}})
+        assert cache.get_many(["k", "missing"]) == {"k": {"title": "Midterm"}}
+
+    def test_ttl_expiry(self, tmp_path):
+        clock = Clock()
+        cache = SQLiteLLMCache(str(tmp_path / "c.db"), ttl_seconds=60, clock=clock)
+        cache.set_many({"k": {"title": "Midterm"}})
+        clock.now += 61
+        assert cache.get_many(["k"]) == {}
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        clock = Clock()
+        cache = SQLiteLLMCache(str(tmp_path / "c.db"), max_entries=2, clock=clock)
+        cache.set_many({"a": {"title": "A"}})
+        clock.now += 1
+        cache.set_many({"b": {"title": "B"}})
+        clock.now += 1
+        cache.get_many(["a"])  # touch a, so b is least recently used
+        clock.now += 1
+        cache.set_many({"c": {"title": "C"}})
+        assert len(cache) == 2
+        assert set(cache.get_many(["a", "b", "c"])) == {"a", "c"}
+
+    def test_open_from_url(self, tmp_path):
+        assert isinstance(open_llm_cache(f"sqlite:///{tmp_path}/c.db"), SQLiteLLMCache)
+        assert open_llm_cache("") is None
+        with pytest.raises(ValueError):
+            open_llm_cache("memcached://localhost")
+
+
+class TestClassifyCached:
+    def test_only_misses_reach_provider(self, tmp_path):
+        cache = SQLiteLLMCache(str(tmp_path / "c.db"))
+        sent: list[list[str]] = []
+
+        def provider(chunk):
+            sent.append([c.context for c in chunk])
+            return [
+                LLMClassification(candidate_index=i, title=c.context.title(), category="exam")
+                for i, c in enumerate(chunk)
+            ]
+
+        first = [_candidate("midterm exam"), _candidate("final exam")]
+        classify_cached(first, provider, cache, "m", "1", 300)
+
+        second = [_candidate("quiz 1"), _candidate("Midterm Exam"), _candidate("final exam")]
+        results = classify_cached(second, provider, cache, "m", "1", 300)
+
+        assert sent[-1] == ["quiz 1"]
+        assert [r.candidate_index for r in results] == [0, 1, 2]
+        assert [r.title for r in results] == ["Quiz 1", "Midterm Exam", "Final Exam"]
+
+    def test_no_cache_passes_through(self):
+        candidates = [_candidate("midterm")]
+        results = classify_cached(
+            candidates,
+            lambda chunk: [LLMClassification(candidate_index=0, title="Midterm")],
+            None, "m", "1", 300,
+        )
+        assert results[0].title == "Midterm"
+
+    def test_backend_errors_are_misses(self):
+        class BrokenCache:
+            def get_many(self, keys):
+                raise ConnectionError("down")
+
+            def set_many(self, items):
+                raise ConnectionError("down")
+
+        results = classify_cached(
+            [_candidate("midterm")],
+            lambda chunk: [LLMClassification(candidate_index=0, title="Midterm")],
+            BrokenCache(), "m", "1", 300,
+        )
+        assert results[0].title == "Midterm"
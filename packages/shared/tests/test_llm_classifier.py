@@ -0,0 +1,298 @@
+"""Tests for llm_classifier: response parsing, chunking, concurrent classification, routing."""
+
+import json
+import threading
+import time
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+
+from shared.extraction import llm_classifier
+from shared.extraction.llm_classifier import (
+    _parse_llm_response,
+    chunk_candidates,
+    classify_in_chunks,
+    StreamingArrayParser,
+    _classify_openai_stream,
+    classify_routed,
+    encode_candidates,
+    estimate_tokens,
+    route_for_llm,
+)
+from shared.schemas import Candidate, EventDraft, LLMClassification
+
+
+def _candidates(n: int, context: str = "Homework due") -> list[Candidate]:
+    return [
+        Candidate(date=date(2026, 1, 1 + i % 28), raw_match=f"1/{1 + i % 28}",
+                  context=f"{context} {i}", page=1)
+        for i in range(n)
+    ]
+
+
+def _echo_chunk(chunk: list[Candidate]) -> list[LLMClassification]:
+    """Fake provider: titles each candidate with its own context."""
+    return [
+        LLMClassification(candidate_index=i, title=c.context, category="assignment")
+        for i, c in enumerate(chunk)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def no_backoff(monkeypatch):
+    monkeypatch.setattr(llm_classifier, "_backoff", lambda attempt: None)
+
+
+class TestParseResponse:
+    def test_wrapped_results(self):
+        content = '{"results": [{"candidate_index": 0, "title": "Midterm", "category": "exam"}]}'
+        results = _parse_llm_response(content, 1)
+        assert results[0].title == "Midterm"
+
+    def test_out_of_range_and_invalid_dropped(self):
+        content = (
+            '[{"candidate_index": 5, "title": "x"}, {"candidate_index": 0, "title": ""},'
+            ' {"candidate_index": 1, "title": "Quiz", "category": "bogus", "confidence_adjustment": 9}]'
+        )
+        results = _parse_llm_response(content, 2)
+        assert len(results) == 1
+        assert results[0].category == "other"
+        assert results[0].confidence_adjustment == 0.2
+
+    def test_malformed_json(self):
+        assert _parse_llm_response("[{", 1) == []
+
+
+class TestEncoding:
+    def test_shared_contexts_sent_once(self):
+        row = "Week 8 | Mar 2 | Mar 4 | Midterm review; MIDTERM EXAM"
+        candidates = [
+            Candidate(date=date(2026, 3, 2), raw_match="Mar 2", context=row, page=2),
+            Candidate(date=date(2026, 3, 4), raw_match="Mar 4", context=row, page=2),
+            Candidate(date=date(2026, 3, 9), raw_match="Mar 9", context="Problem Set 5 due", page=3),
+        ]
+        payload = json.loads(encode_candidates(candidates))
+        assert payload["contexts"] == [row, "Problem Set 5 due"]
+        assert payload["candidates"] == [
+            [0, "2026-03-02", "Mar 2", 0, 2],
+            [1, "2026-03-04", "Mar 4", 0, 2],
+            [2, "2026-03-09", "Mar 9", 1, 3],
+        ]
+
+    def test_minified_and_smaller_than_per_candidate_encoding(self):
+        candidates = _candidates(10, context="Week 3 | Lecture 5 | Homework 2 due") * 3
+        message = encode_candidates(candidates)
+        assert "\n" not in message and ", " not in message
+        verbose = json.dumps([
+            {"index": i, "date": c.date.isoformat(), "raw_match": c.raw_match,
+             "context": c.context, "page": c.page}
+            for i, c in enumerate(candidates)
+        ], indent=2)
+        assert estimate_tokens(message) < estimate_tokens(verbose) / 2
+
+    def test_context_truncated(self):
+        candidates = _candidates(1, context="x" * 1000)
+        payload = json.loads(encode_candidates(candidates))
+        assert len(payload["contexts"][0]) == llm_classifier.CONTEXT_LIMIT
+
+
+class TestChunking:
+    def test_bounded_by_count(self):
+        chunks = chunk_candidates(_candidates(10), max_items=4)
+        assert [offset for offset, _ in chunks] == [0, 4, 8]
+        assert [len(c) for _, c in chunks] == [4, 4, 2]
+
+    def test_bounded_by_context_size(self):
+        chunks = chunk_candidates(_candidates(4, context="x" * 290), max_items=10, max_chars=600)
+        assert [len(c) for _, c in chunks] == [2, 2]
+
+    def test_empty(self):
+        assert chunk_candidates([]) == []
+
+
+class TestClassifyInChunks:
+    def test_merges_by_global_index(self):
+        candidates = _candidates(150)
+        results = classify_in_chunks(candidates, _echo_chunk, chunk_size=20, max_concurrency=4)
+        assert [r.candidate_index for r in results] == list(range(150))
+        assert all(r.title == candidates[r.candidate_index].context for r in results)
+
+    def test_concurrency_is_bounded(self):
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_chunk(chunk):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return _echo_chunk(chunk)
+
+        classify_in_chunks(_candidates(60), slow_chunk, chunk_size=5, max_concurrency=3)
+        assert 1 < peak <= 3
+
+    def test_retries_failed_chunk(self):
+        calls = {"n": 0}
+
+        def flaky_chunk(chunk):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                raise TimeoutError("provider timed out")
+            return _echo_chunk(chunk)
+
+        results = classify_in_chunks(_candidates(5), flaky_chunk, chunk_size=5, max_retries=1)
+        assert len(results) == 5
+        assert calls["n"] == 2
+
+    def test_failed_chunk_only_loses_its_candidates(self):
+        def failing_second_chunk(chunk):
+            if chunk[0].context.endswith(" 10"):
+                raise RuntimeError("boom")
+            return _echo_chunk(chunk)
+
+        results = classify_in_chunks(
+            _candidates(30), failing_second_chunk, chunk_size=10, max_retries=1,
+        )
+        indices = {r.candidate_index for r in results}
+        assert indices == set(range(10)) | set(range(20, 30))
+
+
+def _draft(confidence: float, category: str = "exam", is_ambiguous: bool = False) -> EventDraft:
+    return EventDraft(title="Event", date=date(2026, 1, 1), category=category,
+                      confidence=confidence, is_ambiguous=is_ambiguous)
+
+
+class TestRouting:
+    def test_routes_low_confidence_ambiguous_and_other(self):
+        drafts = [
+            _draft(0.92),
+            _draft(0.50),
+            _draft(0.92, is_ambiguous=True),
+            _draft(0.92, category="other"),
+            _draft(0.80),
+        ]
+        assert route_for_llm(drafts, threshold=0.80) == [1, 2, 3]
+
+    def test_only_routed_candidates_are_classified(self, monkeypatch):
+        sent = []
+
+        def fake_classify(candidates, provider, api_key, **options):
+            sent.extend(candidates)
+            return [
+                LLMClassification(candidate_index=i, title=f"LLM {c.context}",
+                                  category="assignment", confidence_adjustment=0.1)
+                for i, c in enumerate(candidates)
+            ]
+
+        monkeypatch.setattr(llm_classifier, "classify_with_llm_sync", fake_classify)
+        candidates = _candidates(4)
+        drafts = [_draft(0.92), _draft(0.50), _draft(0.92), _draft(0.60, category="other")]
+
+        stats = classify_routed(candidates, drafts, provider="openai", api_key="k", threshold=0.80)
+
+        assert stats == {"routed": 2, "skipped": 2, "classified": 2}
+        assert sent == [candidates[1], candidates[3]]
+        assert [d.title for d in drafts] == ["Event", "LLM Homework due 1", "Event", "LLM Homework due 3"]
+        assert drafts[1].confidence == 0.6
+        assert drafts[0].category == "exam"
+
+    def test_nothing_routed_skips_provider(self, monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("provider should not be called")
+
+        monkeypatch.setattr(llm_classifier, "classify_with_llm_sync", fail)
+        stats = classify_routed(_candidates(2), [_draft(0.92), _draft(0.87)], provider="openai", api_key="k")
+        assert stats == {"routed": 0, "skipped": 2, "classified": 0}
+
+
+def _response_text(n: int) -> str:
+    return json.dumps({"results": [
+        {"candidate_index": i, "title": f"Event {{{i}}} \\\"[x]\\\"", "category": "exam",
+         "confidence_adjustment": 0.1}
+        for i in range(n)
+    ]})
+
+
+class _FakeStreamingClient:
+    """OpenAI-shaped client streaming a response in small deltas, optionally dying midway."""
+
+    def __init__(self, text: str, piece: int = 7, fail_after: int = None):
+        self.text, self.piece, self.fail_after = text, piece, fail_after
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, **kwargs):
+        assert kwargs["stream"] is True
+        return self._events()
+
+    def _events(self):
+        for start in range(0, len(self.text), self.piece):
+            if self.fail_after is not None and start >= self.fail_after:
+                raise ConnectionError("stream reset")
+            delta = SimpleNamespace(content=self.text[start:start + self.piece])
+            yield SimpleNamespace(choices=[SimpleNamespace(delta=delta)])
+
+
+class TestStreamingParser:
+    def test_yields_elements_across_arbitrary_splits(self):
+        text = _response_text(4)
+        for piece in (1, 3, 16, len(text)):
+            parser = StreamingArrayParser()
+            items = []
+            for start in range(0, len(text), piece):
+                items.extend(parser.feed(text[start:start + piece]))
+            assert [item["candidate_index"] for item in items] == [0, 1, 2, 3]
+            assert items[0]["title"] == 'Event {0} \\"[x]\\"'
+            assert parser.done
+
+    def test_bare_array(self):
+        parser = StreamingArrayParser()
+        assert parser.feed('[{"a": 1}, {"a": [2]}]') == [{"a": 1}, {"a": [2]}]
+
+    def test_truncated_tail_keeps_prefix(self):
+        text = _response_text(3)
+        cut = text.index('{"candidate_index": 2') + 10
+        assert [i["candidate_index"] for i in StreamingArrayParser().feed(text[:cut])] == [0, 1]
+
+
+class TestStreamingClassification:
+    def test_emits_each_result_as_it_arrives(self):
+        emitted = []
+        results = _classify_openai_stream(
+            _FakeStreamingClient(_response_text(3)), _candidates(3), emit=emitted.append,
+        )
+        assert [r.candidate_index for r in results] == [0, 1, 2]
+        assert emitted == results
+
+    def test_stream_failure_keeps_valid_prefix(self):
+        text = _response_text(3)
+        fail_after = text.index('{"candidate_index": 2')
+        results = _classify_openai_stream(
+            _FakeStreamingClient(text, fail_after=fail_after), _candidates(3),
+        )
+        assert [r.candidate_index for r in results] == [0, 1]
+
+    def test_stream_failure_before_any_result_raises(self):
+        with pytest.raises(ConnectionError):
+            _classify_openai_stream(_FakeStreamingClient(_response_text(3), fail_after=0), _candidates(3))
+
+    def test_routed_drafts_updated_once(self, monkeypatch):
+        monkeypatch.setattr(
+            llm_classifier, "get_openai_client",
+            lambda *args, **kwargs: _FakeStreamingClient(_response_text(2)),
+        )
+        candidates = _candidates(3)
+        drafts = [_draft(0.50), _draft(0.92), _draft(0.50)]
+
+        stats = classify_routed(
+            candidates, drafts, provider="openai", api_key="k", threshold=0.80, stream=True,
+        )
+        assert stats == {"routed": 2, "skipped": 1, "classified": 2}
+        assert drafts[0].title.startswith("Event {0}")
+        assert drafts[2].title.startswith("Event {1}")
+        assert drafts[1].title == "Event"
+        assert [d.confidence for d in drafts] == [0.6, 0.92, 0.6]
@@ -0,0 +1,150 @@
+"""Tests for the local LLM provider: deterministic output and injected latency/faults."""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import pytest
+
+from shared.extraction import llm_classifier, llm_providers
+from shared.extraction.llm_cache import SQLiteLLMCache
+from shared.extraction.llm_classifier import classify_with_llm_sync
+from shared.extraction.llm_local import LocalProvider, LocalProviderConfig, LocalProviderError
+from shared.schemas import Candidate
+
+
+@pytest.fixture(autouse=True)
+def fresh_state(monkeypatch):
+    monkeypatch.setattr(llm_classifier, "_backoff", lambda attempt: None)
+    for name in ("LATENCY_MS", "PER_CANDIDATE_MS", "ERROR_RATE", "TRUNCATE_RATE", "SEED"):
+        monkeypatch.delenv(f"LLM_LOCAL_{name}", raising=False)
+    llm_providers.reset_registry()
+    yield
+    llm_providers.reset_registry()
+
+
+def _candidates(n: int) -> list[Candidate]:
+    return [
+        Candidate(date=date(2026, 2, 1 + i % 28), raw_match=f"Feb {1 + i % 28}",
+                  context=f"Feb {1 + i % 28} | Homework {i} due", page=1)
+        for i in range(n)
+    ]
+
+
+class TestLocalProvider:
+    def test_deterministic_classification(self):
+        results = LocalProvider().classify(_candidates(2))
+        assert [(r.candidate_index, r.title, r.category) for r in results] == [
+            (0, "Homework 0 due", "assignment"),
+            (1, "Homework 1 due", "assignment"),
+        ]
+
+    def test_injected_error(self):
+        with pytest.raises(LocalProviderError):
+            LocalProvider(LocalProviderConfig(error_rate=1.0)).classify(_candidates(2))
+
+    def test_injected_truncation(self):
+        emitted = []
+        results = LocalProvider(LocalProviderConfig(truncate_rate=1.0)).classify(_candidates(6), emitted.append)
+        assert [r.candidate_index for r in results] == [0, 1, 2]
+        assert emitted == results
+
+    def test_faults_are_reproducible(self):
+        config = LocalProviderConfig(error_rate=0.5, seed=7)
+        outcomes = []
+        for _ in range(2):
+            provider = LocalProvider(config)
+            run = []
+            for n in range(1, 11):
+                try:
+                    provider.classify(_candidates(n))
+                    run.append(True)
+                except LocalProviderError:
+                    run.append(False)
+            outcomes.append(run)
+        assert outcomes[0] == outcomes[1]
+        assert True in outcomes[0] and False in outcomes[0]
+
+    def test_retried_request_rolls_again(self):
+        config = LocalProviderConfig(error_rate=0.5, seed=3)
+        runs = []
+        for _ in range(2):
+            provider = LocalProvider(config)
+            run = []
+            for _ in range(12):
+                try:
+                    provider.classify(_candidates(3))
+                    run.append(True)
+                except LocalProviderError:
+                    run.append(False)
+            runs.append(run)
+        # The same request fails on some attempts and succeeds on others, identically per seed
+        assert runs[0] == runs[1]
+        assert True in runs[0] and False in runs[0]
+
+    def test_request_count_is_exact_across_threads(self):
+        provider = LocalProvider()
+        candidates = _candidates(1)
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            list(pool.map(lambda _: provider.classify(candidates), range(2000)))
+        assert provider.requests == 2000
+
+    def test_latency_beyond_timeout(self):
+        slept = []
+        provider = LocalProvider(LocalProviderConfig(latency_ms=5000), timeout=1.0, sleep=slept.append)
+        with pytest.raises(TimeoutError):
+            provider.classify(_candidates(1))
+        assert slept == [1.0]
+
+
+class TestLLMStageOffline:
+    def test_no_key_needed(self):
+        results = classify_with_llm_sync(_candidates(30), provider="local", api_key="", chunk_size=10)
+        assert [r.candidate_index for r in results] == list(range(30))
+
+    def test_concurrency_overlaps_latency(self, monkeypatch):
+        monkeypatch.setenv("LLM_LOCAL_LATENCY_MS", "50")
+        options = dict(provider="local", api_key="", chunk_size=5)
+
+        start = time.perf_counter()
+        classify_with_llm_sync(_candidates(40), max_concurrency=1, **options)
+        sequential = time.perf_counter() - start
+
+        start = time.perf_counter()
+        classify_with_llm_sync(_candidates(40), max_concurrency=8, **options)
+        concurrent = time.perf_counter() - start
+
+        assert sequential >= 0.4
+        assert concurrent < sequential / 2
+
+    def test_cache_skips_latency(self, monkeypatch, tmp_path):
+        monkeypatch.setenv("LLM_LOCAL_LATENCY_MS", "100")
+        cache = SQLiteLLMCache(str(tmp_path / "cache.db"))
+        classify_with_llm_sync(_candidates(5), provider="local", api_key="", cache=cache)
+
+        start = time.perf_counter()
+        results = classify_with_llm_sync(_candidates(5), provider="local", api_key="", cache=cache)
+        assert len(results) == 5
+        assert time.perf_counter() - start < 0.1
+
+    def test_retries_recover_injected_errors(self, monkeypatch):
+        monkeypatch.setenv("LLM_LOCAL_ERROR_RATE", "0.5")
+        options = dict(provider="local", api_key="", chunk_size=5, max_concurrency=4)
+        without_retries = classify_with_llm_sync(_candidates(40), max_retries=0, **options)
+        llm_providers.reset_registry()
+        with_retries = classify_with_llm_sync(_candidates(40), max_retries=4, **options)
+        assert len(without_retries) < 40
+        assert [r.candidate_index for r in with_retries] == list(range(40))
+
+    def test_timeout_leaves_chunk_unclassified(self, monkeypatch):
+        monkeypatch.setenv("LLM_LOCAL_PER_CANDIDATE_MS", "40")
+        candidates = _candidates(6)
+        # A 2-candidate chunk (80 ms) fits the timeout; a 4-candidate chunk (160 ms) does not
+        results = classify_with_llm_sync(
+            candidates[:2], provider="local", api_key="", timeout=0.1, max_retries=0,
+        )
+        assert len(results) == 2
+        results = classify_with_llm_sync(
+            candidates[2:], provider="local", api_key="", timeout=0.1, max_retries=0,
+        )
+        assert results == []
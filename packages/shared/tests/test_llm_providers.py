@@ -0,0 +1,174 @@
+"""Tests for llm_providers: pooled clients, timeouts, circuit breaker (against a local stub server)."""
+
+import json
+import threading
+import time
+from datetime import date
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from shared.extraction import llm_classifier, llm_providers
+from shared.extraction.llm_classifier import classify_with_llm_sync
+from shared.extraction.llm_providers import (
+    CircuitBreaker,
+    CircuitOpenError,
+    get_circuit_breaker,
+    get_openai_client,
+)
+from shared.schemas import Candidate
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Minimal OpenAI-compatible chat completions endpoint."""
+
+    def do_POST(self):
+        server = self.server
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        server.requests.append(body)
+        if server.delay:
+            time.sleep(server.delay)
+        if server.fail:
+            self.send_response(500)
+            self.end_headers()
+            return
+
+        num = len(json.loads(body["messages"][1]["content"])["candidates"])
+        content = json.dumps({"results": [
+            {"candidate_index": i, "title": f"Stub {i}", "category": "exam", "confidence_adjustment": 0.0}
+            for i in range(num)
+        ]})
+        payload = json.dumps({
+            "id": "stub", "object": "chat.completion", "created": 0, "model": body["model"],
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": content}}],
+        }).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.requests = []
+    server.delay = 0.0
+    server.fail = False
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def fresh_registry(monkeypatch):
+    monkeypatch.setattr(llm_classifier, "_backoff", lambda attempt: None)
+    llm_providers.reset_registry()
+    yield
+    llm_providers.reset_registry()
+
+
+def _candidates(n: int) -> list[Candidate]:
+    return [
+        Candidate(date=date(2026, 3, 1 + i), raw_match=f"3/{1 + i}", context=f"Exam {i}", page=1)
+        for i in range(n)
+    ]
+
+
+def _base_url(server) -> str:
+    return f"http://127.0.0.1:{server.server_address[1]}/v1"
+
+
+class TestCircuitBreaker:
+    def test_opens_after_threshold_and_recovers(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=2, reset_timeout=10, clock=clock)
+
+        breaker.record_failure()
+        assert breaker.state == "closed"
+        breaker.record_failure()
+        assert breaker.state == "open"
+        assert not breaker.allow()
+
+        clock.now = 10
+        assert breaker.state == "half_open"
+        assert breaker.allow()
+        assert not breaker.allow()  # one trial request at a time
+        breaker.record_success()
+        assert breaker.state == "closed"
+
+    def test_failed_trial_reopens(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=5, clock=clock)
+        breaker.record_failure()
+        clock.now = 5
+        assert breaker.allow()
+        breaker.record_failure()
+        assert breaker.state == "open"
+
+    def test_call_rejects_when_open(self):
+        breaker = CircuitBreaker(failure_threshold=1, clock=FakeClock())
+        with pytest.raises(ValueError):
+            breaker.call(lambda: (_ for _ in ()).throw(ValueError("boom")))
+        with pytest.raises(CircuitOpenError):
+            breaker.call(lambda: "never")
+
+
+class TestRegistry:
+    def test_client_is_reused(self):
+        a = get_openai_client("key", base_url="http://127.0.0.1:9/v1")
+        b = get_openai_client("key", base_url="http://127.0.0.1:9/v1")
+        c = get_openai_client("other", base_url="http://127.0.0.1:9/v1")
+        assert a is b
+        assert a is not c
+
+    def test_client_timeouts(self):
+        client = get_openai_client("key", connect_timeout=1.5, read_timeout=7.0)
+        assert client.timeout.connect == 1.5
+        assert client.timeout.read == 7.0
+
+
+class TestStubServer:
+    def test_classifies_through_pooled_client(self, stub_server):
+        results = classify_with_llm_sync(
+            _candidates(3), provider="openai", api_key="k", base_url=_base_url(stub_server),
+        )
+        assert [r.title for r in results] == ["Stub 0", "Stub 1", "Stub 2"]
+        assert len(stub_server.requests) == 1
+
+    def test_read_timeout(self, stub_server):
+        stub_server.delay = 1.0
+        start = time.monotonic()
+        results = classify_with_llm_sync(
+            _candidates(2), provider="openai", api_key="k", base_url=_base_url(stub_server),
+            timeout=0.2, max_retries=0,
+        )
+        assert results == []
+        assert time.monotonic() - start < 1.0
+
+    def test_circuit_opens_and_skips_provider(self, stub_server, monkeypatch):
+        monkeypatch.setenv("LLM_CIRCUIT_FAILURES", "2")
+        stub_server.fail = True
+        options = dict(provider="openai", api_key="k", base_url=_base_url(stub_server), max_retries=0)
+
+        classify_with_llm_sync(_candidates(2), **options)
+        classify_with_llm_sync(_candidates(2), **options)
+        assert get_circuit_breaker("openai").state == "open"
+        sent = len(stub_server.requests)
+
+        assert classify_with_llm_sync(_candidates(2), **options) == []
+        assert len(stub_server.requests) == sent
@@ -0,0 +1,86 @@
+"""Tests for pipeline metrics: histogram/counter rendering, stage timers, multi-process export."""
+
+from shared.metrics import (
+    MetricsRegistry,
+    PipelineRun,
+    STAGE_DURATION,
+    merge_expositions,
+    primary_source_kind,
+    read_textfiles,
+    write_textfile,
+)
+from shared.schemas import PageText
+
+
+class TestRendering:
+    def test_histogram_buckets_are_cumulative(self):
+        registry = MetricsRegistry()
+        hist = registry.histogram("t_seconds", "Test.", ("stage",))
+        hist.buckets = (0.1, 1.0)
+        for value in (0.05, 0.1, 0.5, 3.0):
+            hist.observe(value, stage="find")
+
+        lines = registry.render().splitlines()
+        assert lines[:2] == ["# HELP t_seconds Test.", "# TYPE t_seconds histogram"]
+        assert 't_seconds_bucket{stage="find",le="0.1"} 2' in lines
+        assert 't_seconds_bucket{stage="find",le="1"} 3' in lines
+        assert 't_seconds_bucket{stage="find",le="+Inf"} 4' in lines
+        assert 't_seconds_sum{stage="find"} 3.65' in lines
+        assert 't_seconds_count{stage="find"} 4' in lines
+
+    def test_counter_with_extra_labels_and_escaping(self):
+        registry = MetricsRegistry()
+        counter = registry.counter("t_total", "Test.", ("item",))
+        counter.inc(3, item='say "hi"')
+        assert 't_total{item="say \\"hi\\"",worker="42"} 3' in registry.render({"worker": "42"})
+
+
+class TestPipelineRun:
+    def test_stage_labels_and_summary(self):
+        run = PipelineRun("Syllabus.PDF")
+        with run.stage("extract"):
+            run.set_pages([PageText(page=1, text="a", source_kind="ocr")])
+        assert run.file_type == "pdf"
+        assert STAGE_DURATION.count(stage="extract", file_type="pdf", source_kind="ocr") >= 1
+        assert set(run.summary()) == {"extract"}
+
+    def test_deferred_run_records_on_flush(self):
+        import pickle
+
+        labels = dict(stage="extract", file_type="docx", source_kind="docx")
+        before = STAGE_DURATION.count(**labels)
+        run = PipelineRun("notes.docx", deferred=True)
+        with run.stage("extract"):
+            run.set_pages([PageText(page=1, text="a", source_kind="docx")])
+        assert STAGE_DURATION.count(**labels) == before
+
+        # Round-trips through pickle, as when returned from a pool process
+        restored = pickle.loads(pickle.dumps(run))
+        restored.flush()
+        restored.flush()
+        assert STAGE_DURATION.count(**labels) == before + 1
+
+    def test_primary_source_kind(self):
+        pages = [PageText(page=1, text="a"), PageText(page=2, text="b", source_kind="table")]
+        assert primary_source_kind(pages) == "pdf_text"
+        assert primary_source_kind([PageText(page=1, text="a", source_kind="docx")]) == "docx"
+        assert primary_source_kind([]) == "unknown"
+
+
+class TestExport:
+    def test_merge_keeps_one_header_per_family(self):
+        a = '# HELP x_total X.\n# TYPE x_total counter\nx_total{worker="1"} 1\n'
+        b = '# HELP x_total X.\n# TYPE x_total counter\nx_total{worker="2"} 5\n'
+        assert merge_expositions([a, b]).splitlines() == [
+            "# HELP x_total X.",
+            "# TYPE x_total counter",
+            'x_total{worker="1"} 1',
+            'x_total{worker="2"} 5',
+        ]
+
+    def test_textfile_round_trip(self, tmp_path):
+        path = write_textfile(str(tmp_path), extra_labels={"worker": "7"})
+        assert path.endswith(".prom")
+        merged = read_textfiles(str(tmp_path))
+        assert "# TYPE syllascribe_stage_duration_seconds histogram" in merged
+        assert not list(tmp_path.glob("*.tmp"))
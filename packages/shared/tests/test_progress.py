@@ -0,0 +1,67 @@
+"""Tests for job progress publishing."""
+
+import json
+
+from shared.progress import ProgressPublisher, channel, is_terminal, last_event_key
+
+
+class _FakeRedis:
+    def __init__(self, fail=False):
+        self.fail = fail
+        self.store = {}
+        self.published = []
+
+    def pipeline(self, transaction=True):
+        return _FakePipeline(self)
+
+
+class _FakePipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.ops = []
+
+    def set(self, key, value, ex=None):
+        self.ops.append(("set", key, value))
+
+    def publish(self, name, message):
+        self.ops.append(("publish", name, message))
+
+    def execute(self):
+        if self.redis.fail:
+            raise ConnectionError("redis down")
+        for op, key, value in self.ops:
+            if op == "set":
+                self.redis.store[key] = value
+            else:
+                self.redis.published.append((key, value))
+
+
+def test_publish_sets_latest_and_notifies():
+    redis = _FakeRedis()
+    publisher = ProgressPublisher(client=redis)
+
+    publisher.publish("job-1", "pages", pages=3, ocr_pages=1)
+    event = publisher.publish("job-1", "done", "ready", events=12)
+
+    assert [json.loads(m)["stage"] for name, m in redis.published] == ["pages", "done"]
+    assert {name for name, _ in redis.published} == {channel("job-1")}
+    assert json.loads(redis.store[last_event_key("job-1")]) == event
+    assert event["status"] == "ready" and event["events"] == 12
+    assert is_terminal(event)
+
+
+def test_failures_are_swallowed_and_backed_off():
+    redis = _FakeRedis(fail=True)
+    publisher = ProgressPublisher(client=redis)
+    assert publisher.publish("job-1", "extracting") is None
+
+    redis.fail = False
+    # Still inside the reconnect backoff window
+    assert publisher.publish("job-1", "pages", pages=1) is None
+    assert redis.published == []
+
+
+def test_disabled_without_redis_url():
+    publisher = ProgressPublisher("memory://")
+    assert not publisher.enabled
+    assert publisher.publish("job-1", "extracting") is None
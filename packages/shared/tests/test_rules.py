@@ -0,0 +1,133 @@
+"""Tests for rules: rule-pack format, compilation, caching, and per-job resolution."""
+
+import json
+from datetime import date
+
+import pytest
+
+from shared.extraction.event_assembler import (
+    CATEGORY_KEYWORDS,
+    assemble_events,
+    _classify_category,
+    _score_confidence,
+)
+from shared.extraction.rules import (
+    RulePack,
+    compile_rules,
+    default_rules,
+    load_rule_pack,
+    resolve_rule_pack,
+)
+from shared.schemas import Candidate
+
+
+class TestCompileRules:
+    def test_default_matches_keyword_dicts(self):
+        rules = default_rules()
+        assert rules.categories == tuple(CATEGORY_KEYWORDS)
+        assert rules.classify("Spring Break - No Class") == "holiday"
+        assert rules.classify("Problem set 3") == "assignment"
+        assert rules.classify("Nothing to see") == "other"
+
+    def test_word_priority_follows_category_order(self):
+        # "final" (exam) and "paper" (assignment): exam is listed first
+        assert default_rules().classify("Final paper") == "exam"
+
+    def test_cached_by_content_hash(self):
+        pack = {"name": "custom", "scoring": {"categorized": 0.70}}
+        assert compile_rules(pack) is compile_rules(RulePack.model_validate(pack))
+        assert compile_rules(pack) is not default_rules()
+
+    def test_unknown_weight_rejected(self):
+        with pytest.raises(ValueError):
+            RulePack.model_validate({"scoring": {"not_a_weight": 1.0}})
+
+    def test_invalid_pattern_rejected(self):
+        with pytest.raises(ValueError):
+            RulePack.model_validate({"schedule_patterns": ["("]})
+
+
+class TestCustomPack:
+    PACK = {
+        "name": "lab-school",
+        "category_keywords": {
+            "exam": ["practical", "exam"],
+            "assignment": ["lab write-up", "due"],
+        },
+        "strong_keywords": {"exam": ["practical"]},
+        "scoring": {"strong_one": 0.80},
+    }
+
+    def test_classification_uses_pack(self):
+        rules = compile_rules(self.PACK)
+        assert _classify_category("Lab practical", rules) == "exam"
+        assert _classify_category("Lab write-up for unit 2", rules) == "assignment"
+        assert _classify_category("Reading: Chapter 5", rules) == "other"
+
+    def test_scoring_uses_pack_weights(self):
+        rules = compile_rules(self.PACK)
+        candidate = Candidate(
+            date=date(2026, 3, 4), raw_match="March 4",
+            context="Lab practical in the teaching lab on March 4", page=1,
+        )
+        assert _score_confidence(candidate.context, "exam", candidate, rules) == 0.80
+
+    def test_assemble_events_with_pack(self):
+        candidate = Candidate(
+            date=date(2026, 3, 4), raw_match="March 4",
+            context="Lab practical in the teaching lab on March 4", page=1,
+        )
+        default_event = assemble_events([candidate])[0]
+        pack_event = assemble_events([candidate], rules=self.PACK)[0]
+        assert default_event.category == "other"
+        assert pack_event.category == "exam"
+        assert pack_event.confidence == 0.80
+
+
+class TestResolveRulePack:
+    def test_none_is_default(self):
+        assert resolve_rule_pack(None, None) is default_rules()
+        assert resolve_rule_pack("default", None) is default_rules()
+
+    def test_loads_named_pack_from_dir(self, tmp_path):
+        (tmp_path / "state-u.json").write_text(json.dumps({"scoring": {"categorized": 0.7}}))
+        rules = resolve_rule_pack("state-u", str(tmp_path))
+        assert rules.name == "state-u"
+        assert rules.weights.categorized == 0.7
+        # Same content resolves to the same compiled rules
+        assert resolve_rule_pack("state-u", str(tmp_path)) is rules
+        assert load_rule_pack(str(tmp_path / "state-u.json")).name == "state-u"
+
+    def test_unchanged_file_is_not_reloaded(self, tmp_path, monkeypatch):
+        from shared.extraction import rules as rules_module
+
+        path = tmp_path / "cached.json"
+        path.write_text(json.dumps({"scoring": {"categorized": 0.7}}))
+        first = resolve_rule_pack("cached", str(tmp_path))
+        loads = []
+        monkeypatch.setattr(rules_module, "load_rule_pack", lambda p: loads.append(p) or load_rule_pack(p))
+        assert resolve_rule_pack("cached", str(tmp_path)) is first
+        assert loads == []
+
+        # A rewrite (new size) is picked up
+        path.write_text(json.dumps({"scoring": {"categorized": 0.65}}))
+        assert resolve_rule_pack("cached", str(tmp_path)).weights.categorized == 0.65
+        assert len(loads) == 1
+
+    def test_compiled_cache_is_bounded(self, monkeypatch):
+        from shared.extraction import rules as rules_module
+
+        monkeypatch.setattr(rules_module, "COMPILED_CACHE_SIZE", 3)
+        for i in range(10):
+            compile_rules({"name": f"pack-{i}", "scoring": {"categorized": 0.5 + i / 100}})
+        assert len(rules_module._compiled_cache) <= 3
+        # The default rules are held outside the LRU
+        assert resolve_rule_pack(None, None) is default_rules()
+
+    def test_missing_pack(self, tmp_path):
+        with pytest.raises(ValueError):
+            resolve_rule_pack("nope", str(tmp_path))
+
+    def test_rejects_path_traversal(self, tmp_path):
+        with pytest.raises(ValueError):
+            resolve_rule_pack("../etc/passwd", str(tmp_path))
@@ -0,0 +1,47 @@
+"""Tests for text_extractor: table header detection and column layouts."""
+
+from shared.extraction.text_extractor import (
+    detect_table_columns,
+    _clean_row,
+    _detect_table_layout,
+)
+from shared.schemas import TableLayout
+
+
+class TestDetectTableColumns:
+    def test_schedule_header(self):
+        cols = detect_table_columns(["Week", "Date", "Topic", "Due", "Readings"])
+        assert cols == {"date": 1, "topic": 2, "due": 3, "reading": 4}
+
+    def test_combined_header_takes_first_role(self):
+        cols = detect_table_columns(["Week", "Date", "Topic / Assignment"])
+        assert cols == {"date": 1, "topic": 2}
+
+    def test_data_row_is_not_header(self):
+        assert detect_table_columns(["Week 1", "Jan 12", "Introduction"]) == {}
+
+    def test_requires_date_column(self):
+        assert detect_table_columns(["Topic", "Reading"]) == {}
+
+
+class TestTableLayout:
+    def test_clean_row_keeps_positions(self):
+        assert _clean_row(["Week 1", None, " Multi\nline  cell "]) == ["Week 1", "", "Multi line cell"]
+
+    def test_headed_table(self):
+        layout, has_header = _detect_table_layout(
+            [["Date", "Topic"], ["Jan 12", "Intro"]], previous=None,
+        )
+        assert has_header
+        assert layout.columns == {"date": 0, "topic": 1}
+
+    def test_continuation_inherits_previous_layout(self):
+        previous = TableLayout(header=["Date", "Topic"], columns={"date": 0, "topic": 1})
+        layout, has_header = _detect_table_layout([["Apr 20", "Stacks"]], previous)
+        assert not has_header
+        assert layout.columns == previous.columns
+
+    def test_continuation_with_different_width_has_no_layout(self):
+        previous = TableLayout(header=["Date", "Topic"], columns={"date": 0, "topic": 1})
+        layout, _ = _detect_table_layout([["1", "Apr 20", "Stacks"]], previous)
+        assert layout.columns == {}
@@ -0,0 +1,9 @@
+"""Tests for extraction warm-up."""
+
+from shared.extraction.warmup import warm_up
+
+
+def test_warm_up_runs_every_step():
+    timings = warm_up()
+    assert set(timings) == {"imports", "rules", "find", "assemble"}
+    assert all(seconds >= 0 for seconds in timings.values())
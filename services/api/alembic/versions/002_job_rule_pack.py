@@ -0,0 +1,23 @@
+"""Per-job assembler rule pack selection.
+
+Revision ID: 002
+Revises: 001
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "002"
+down_revision: Union[str, None] = "001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("rule_pack", sa.String(100), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("jobs", "rule_pack")
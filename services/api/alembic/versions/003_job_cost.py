@@ -0,0 +1,29 @@
+"""Job scheduling lane and estimated vs. actual processing cost.
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "003"
+down_revision: Union[str, None] = "002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("lane", sa.String(10), nullable=True))
+    op.add_column("jobs", sa.Column("estimated_pages", sa.Integer(), nullable=True))
+    op.add_column("jobs", sa.Column("estimated_seconds", sa.Float(), nullable=True))
+    op.add_column("jobs", sa.Column("actual_seconds", sa.Float(), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("jobs", "actual_seconds")
+    op.drop_column("jobs", "estimated_seconds")
+    op.drop_column("jobs", "estimated_pages")
+    op.drop_column("jobs", "lane")
@@ -0,0 +1,34 @@
+"""Batch uploads: batches table and jobs.batch_id.
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "004"
+down_revision: Union[str, None] = "003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "batches",
+        sa.Column("id", sa.Uuid(), primary_key=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now()),
+    )
+    op.add_column(
+        "jobs",
+        sa.Column("batch_id", sa.Uuid(), sa.ForeignKey("batches.id", ondelete="SET NULL"), nullable=True),
+    )
+    op.create_index("ix_jobs_batch_id", "jobs", ["batch_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_batch_id", table_name="jobs")
+    op.drop_column("jobs", "batch_id")
+    op.drop_table("batches")
@@ -0,0 +1,25 @@
+"""SHA-256 of each job's upload, for caching and dedup.
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+revision: str = "005"
+down_revision: Union[str, None] = "004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("jobs", sa.Column("content_sha256", sa.String(64), nullable=True))
+    op.create_index("ix_jobs_content_sha256", "jobs", ["content_sha256"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_jobs_content_sha256", table_name="jobs")
+    op.drop_column("jobs", "content_sha256")
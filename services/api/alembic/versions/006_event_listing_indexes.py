@@ -0,0 +1,30 @@
+"""Indexes for keyset-paginated event listings.
+
+Events are listed per job ordered by (date, title, id), optionally filtered by
+category. Both composite indexes start with job_id, so the single-column
+ix_events_job_id is redundant and dropped.
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-19
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "006"
+down_revision: Union[str, None] = "005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_events_job_order", "events", ["job_id", "date", "title", "id"])
+    op.create_index("ix_events_job_category", "events", ["job_id", "category", "date", "title", "id"])
+    op.drop_index("ix_events_job_id", table_name="events")
+
+
+def downgrade() -> None:
+    op.create_index("ix_events_job_id", "events", ["job_id"])
+    op.drop_index("ix_events_job_category", table_name="events")
+    op.drop_index("ix_events_job_order", table_name="events")
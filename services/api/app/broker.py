@@ -0,0 +1,133 @@
+"""Process-wide Celery producer and Redis connection pool for the API.
+
+Created once in the FastAPI lifespan instead of per request. Broker health is
+checked by a background task every BROKER_HEALTH_INTERVAL_SECONDS, so a request
+reads a cached flag instead of pinging Redis (and waiting out its timeout when
+Redis is down). Celery publishes are synchronous (kombu), so dispatch runs in a
+worker thread and never blocks the event loop.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from typing import Any, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class Broker:
+    def __init__(self, url: str):
+        self.url = url
+        self.healthy = False
+        self.checked_at = 0.0  # time.monotonic() of the last health check
+        self._pool = None
+        self._celery = None
+        self._refresher: Optional[asyncio.Task] = None
+
+    @property
+    def started(self) -> bool:
+        return self._celery is not None
+
+    @property
+    def available(self) -> bool:
+        """True if started and the last health check passed."""
+        return self.started and self.healthy
+
+    async def start(self) -> None:
+        import redis.asyncio as aioredis
+        from celery import Celery
+
+        self._pool = aioredis.ConnectionPool.from_url(
+            self.url,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_connect_timeout=settings.BROKER_TIMEOUT_SECONDS,
+            socket_timeout=settings.BROKER_TIMEOUT_SECONDS,
+        )
+        self._celery = Celery(broker=self.url, set_as_current=False)
+        # Fail a publish quickly when Redis goes away between health checks
+        self._celery.conf.update(
+            broker_connection_timeout=settings.BROKER_TIMEOUT_SECONDS,
+            broker_connection_max_retries=1,
+            task_publish_retry_policy={"max_retries": 1, "interval_start": 0, "interval_step": 0.2},
+        )
+        await self.check()
+        self._refresher = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self) -> None:
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+        if self._pool is not None:
+            await self._pool.aclose()
+            self._pool = None
+        if self._celery is not None:
+            await asyncio.to_thread(self._celery.close)
+            self._celery = None
+        self.healthy = False
+
+    def redis(self):
+        """An asyncio Redis client on the shared pool (cheap; create per use)."""
+        import redis.asyncio as aioredis
+
+        if self._pool is None:
+            raise RuntimeError("Broker is not started")
+        return aioredis.Redis(connection_pool=self._pool)
+
+    async def check(self) -> bool:
+        """Ping Redis and update the cached health flag."""
+        was_healthy = self.healthy
+        try:
+            await self.redis().ping()
+            self.healthy = True
+        except Exception as exc:
+            self.healthy = False
+            if was_healthy or not self.checked_at:
+                logger.warning("Broker unavailable (%s); extraction will run inline", exc)
+        else:
+            if not was_healthy and self.checked_at:
+                logger.info("Broker available again")
+        self.checked_at = time.monotonic()
+        return self.healthy
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(settings.BROKER_HEALTH_INTERVAL_SECONDS)
+            await self.check()
+
+    async def send_task(self, name: str, args: Optional[list] = None, kwargs: Optional[dict] = None, **options: Any) -> bool:
+        """Publish a task off the event loop; False (and marked unhealthy) if it fails."""
+        if not self.available:
+            return False
+        try:
+            await asyncio.to_thread(self._celery.send_task, name, args=args, kwargs=kwargs, **options)
+            return True
+        except Exception:
+            logger.exception("Dispatching %s failed", name)
+            self.healthy = False
+            return False
+
+    async def send_group(self, name: str, args_list: list[list], **options: Any) -> bool:
+        """Publish one task per args entry as a Celery group, off the event loop."""
+        if not self.available:
+            return False
+        from celery import group
+
+        signatures = group(self._celery.signature(name, args=args, **options) for args in args_list)
+        try:
+            await asyncio.to_thread(signatures.apply_async)
+            return True
+        except Exception:
+            logger.exception("Dispatching a group of %s failed", name)
+            self.healthy = False
+            return False
+
+
+broker = Broker(settings.REDIS_URL)
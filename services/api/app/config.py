@@ -26,13 +26,26 @@ class Settings(BaseSettings):
     DATABASE_URL: str = f"sqlite+aiosqlite:///{_DEFAULT_SQLITE_PATH}"
     DATABASE_URL_SYNC: str = f"sqlite:///{_DEFAULT_SQLITE_PATH}"
     REDIS_URL: str = "redis://localhost:6379/0"
+    REDIS_MAX_CONNECTIONS: int = 50  # Shared API pool (health checks, progress streams)
+    BROKER_TIMEOUT_SECONDS: float = 1.0
+    BROKER_HEALTH_INTERVAL_SECONDS: float = 5.0  # How often the cached broker health is refreshed
     UPLOAD_DIR: str = "../../data/uploads"
     RUN_EXTRACTION_INLINE: bool = False  # When True, run extraction in API (no Celery); use on Railway where API and Worker have no shared volume
+    INLINE_WORKERS: int = 2  # Processes extracting inline uploads (0 = a thread in the API process)
+    INLINE_MAX_PENDING: int = 8  # Inline jobs running or waiting; more are refused with 503
+    INLINE_RETRY_AFTER_SECONDS: int = 10  # Retry-After sent with that 503
     ALLOWED_ORIGINS: str = "http://localhost:3000,http://127.0.0.1:3000"
     USE_LLM_CLASSIFIER: bool = False
     LLM_PROVIDER: str = "openai"
     LLM_API_KEY: str = ""
+    RULE_PACK_DIR: str = ""  # Directory of <name>.json assembler rule packs selectable per upload
     UPLOAD_RETENTION_HOURS: int = 168
+    MAX_UPLOAD_MB: int = 50  # Uploads (and archive members) larger than this are rejected with 413
+    FAST_LANE_MAX_SECONDS: float = 10.0  # Jobs estimated at or below this go to the fast extract lane
+    BATCH_MAX_FILES: int = 1000  # Max syllabi per batch upload
+    BATCH_MAX_TOTAL_MB: int = 1024  # Max total (uncompressed) size of a batch's accepted files
+    BATCH_TASK_SIZE: int = 10  # Jobs processed by each batch worker task
+    PROGRESS_STREAM_MAX_SECONDS: int = 900  # Max lifetime of one /progress SSE connection
 
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
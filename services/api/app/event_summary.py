@@ -0,0 +1,67 @@
+"""A job's event counts in one aggregate query, shared by the job and events endpoints.
+
+Job pages poll GET /api/job/{job_id} while processing, so the job row and its
+counts (total, needs attention, per category) come from a single statement: the
+job left-joined to its events, grouped by category, with COUNT(...) FILTER
+(WHERE ...) aggregates. Both SQLite (3.30+) and Postgres support FILTER.
+"""
+
+from __future__ import annotations
+
+import uuid
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from .models import Event, Job
+
+# Events below this confidence need review (as set by the pipeline)
+LOW_CONFIDENCE_THRESHOLD = 0.6
+
+
+@dataclass
+class EventSummary:
+    total: int = 0
+    ambiguous: int = 0
+    low_confidence: int = 0
+    needs_attention: int = 0  # ambiguous or low confidence
+    by_category: dict[str, int] = field(default_factory=dict)
+
+
+def needs_attention_clause():
+    return Event.is_ambiguous.is_(True) | (Event.confidence < LOW_CONFIDENCE_THRESHOLD)
+
+
+async def load_job_summary(db: AsyncSession, job_id: uuid.UUID) -> Optional[tuple[Job, EventSummary]]:
+    """The job and its event counts in one round trip, or None if the job doesn't exist."""
+    count = func.count(Event.id)
+    result = await db.execute(
+        select(
+            Job,
+            Event.category,
+            count.label("total"),
+            count.filter(Event.is_ambiguous.is_(True)).label("ambiguous"),
+            count.filter(Event.confidence < LOW_CONFIDENCE_THRESHOLD).label("low_confidence"),
+            count.filter(needs_attention_clause()).label("needs_attention"),
+        )
+        .outerjoin(Event, Event.job_id == Job.id)
+        .where(Job.id == job_id)
+        .group_by(Job.id, Event.category)
+    )
+
+    job: Optional[Job] = None
+    summary = EventSummary()
+    for row in result:
+        job = row.Job
+        if row.category is None:  # the outer join's row for a job without events
+            continue
+        summary.total += row.total
+        summary.ambiguous += row.ambiguous
+        summary.low_confidence += row.low_confidence
+        summary.needs_attention += row.needs_attention
+        summary.by_category[row.category] = row.total
+    if job is None:
+        return None
+    return job, summary
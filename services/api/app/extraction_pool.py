@@ -0,0 +1,188 @@
+"""Bounded process pool for extraction run inside the API.
+
+When the broker is unavailable (or RUN_EXTRACTION_INLINE is set), uploads are
+extracted in the API itself. Extraction is CPU-bound (PDF parsing, OCR, date
+matching), so it runs in INLINE_WORKERS child processes rather than threads,
+keeping the event loop and the GIL free for other requests. The pool is created
+once in the FastAPI lifespan; its children are spawned (not forked from the
+running server) and warmed up when they start.
+
+At most INLINE_MAX_PENDING jobs may be running or waiting for the pool; beyond
+that, uploads are refused with 503 and a Retry-After header instead of queueing
+without bound. With INLINE_WORKERS=0 extraction runs in a thread, as before.
+If a child process dies (the pool is then broken for every later submit), the
+jobs it took down fail and the pool is replaced for the next ones.
+
+run_extraction lives here rather than in the upload route so the children only
+import this module and the config, not the web app.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Awaitable, Callable, Optional
+
+from .config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class PoolSaturated(Exception):
+    """Raised when INLINE_MAX_PENDING jobs are already running or waiting."""
+
+
+def run_extraction(
+    job_id: str,
+    file_path: str,
+    original_filename: str = "",
+    rule_pack: Optional[str] = None,
+) -> dict:
+    """Run the extraction pipeline synchronously (fallback when Celery is unavailable).
+
+    Runs in a pool process, so the returned PipelineRun is deferred: the caller
+    records its metrics with run.flush().
+    """
+    from shared.extraction.text_extractor import extract_text
+    from shared.extraction.date_finder import find_date_candidates
+    from shared.extraction.event_assembler import assemble_events
+    from shared.extraction.rules import resolve_rule_pack
+    from shared.metrics import PipelineRun
+
+    run = PipelineRun(original_filename, deferred=True)
+    with run.stage("extract"):
+        pages = extract_text(file_path)
+        run.set_pages(pages)
+    if not pages:
+        return {"events": [], "error": "No text could be extracted from the uploaded file.", "run": run}
+
+    with run.stage("find"):
+        candidates = find_date_candidates(pages, filename=original_filename)
+    run.count("candidates", len(candidates))
+    if not candidates:
+        return {"events": [], "error": "No dates were found in the document.", "run": run}
+
+    with run.stage("assemble"):
+        rules = resolve_rule_pack(rule_pack, settings.RULE_PACK_DIR or None)
+        event_drafts = assemble_events(candidates, rules=rules)
+
+    # Optional LLM classification (only low-confidence/ambiguous/"other" drafts)
+    llm_routing = None
+    use_llm = os.environ.get("USE_LLM_CLASSIFIER", "false").lower() == "true"
+    llm_api_key = os.environ.get("LLM_API_KEY", "")
+    llm_provider = os.environ.get("LLM_PROVIDER", "openai")
+    # The "local" provider is an offline stub and needs no key
+    if use_llm and (llm_api_key or llm_provider == "local"):
+        try:
+            from shared.extraction.llm_classifier import (
+                classify_routed,
+                llm_options_from_env,
+                llm_routing_threshold_from_env,
+            )
+            with run.stage("llm"):
+                llm_routing = classify_routed(
+                    candidates, event_drafts, provider=llm_provider, api_key=llm_api_key,
+                    threshold=llm_routing_threshold_from_env(),
+                    **llm_options_from_env(),
+                )
+            run.count("llm_routed", llm_routing["routed"])
+            logger.info(
+                "LLM routing for job %s: %d routed, %d skipped",
+                job_id, llm_routing["routed"], llm_routing["skipped"],
+            )
+        except Exception:
+            pass  # LLM failure is non-fatal
+
+    return {"events": event_drafts, "error": None, "llm_routing": llm_routing, "run": run}
+
+
+def _init_pool_process() -> None:
+    """Pool process initializer: preload the extraction pipeline."""
+    try:
+        from shared.extraction.warmup import warm_up
+
+        warm_up()
+    except Exception:
+        logger.exception("Extraction warm-up failed; the first job in this process will be slower")
+
+
+class ExtractionPool:
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.pending = 0  # Jobs holding a slot: running or waiting for a pool process
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._background: set[asyncio.Task] = set()
+
+    @property
+    def started(self) -> bool:
+        return self._executor is not None
+
+    @property
+    def saturated(self) -> bool:
+        return self.pending >= self.max_pending
+
+    def start(self, prewarm: bool = False) -> None:
+        """Create the pool; with prewarm, spawn (and warm up) every process now rather than on first use."""
+        if self.workers <= 0 or self._executor is not None:
+            return
+        self._executor = self._new_executor()
+        if prewarm:
+            # Each submit spawns another process while none is idle
+            for _ in range(self.workers):
+                self._executor.submit(int)
+
+    def _new_executor(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_pool_process,
+        )
+
+    async def stop(self, timeout: float = 30.0) -> None:
+        """Let background jobs finish (up to timeout), then shut the pool down."""
+        if self._background:
+            _, unfinished = await asyncio.wait(set(self._background), timeout=timeout)
+            for task in unfinished:
+                task.cancel()
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.to_thread(executor.shutdown, wait=True, cancel_futures=True)
+
+    def acquire(self) -> None:
+        """Take a slot for one job (or one sequential run of jobs); PoolSaturated if none is free."""
+        if self.saturated:
+            raise PoolSaturated()
+        self.pending += 1
+
+    def release(self) -> None:
+        self.pending = max(0, self.pending - 1)
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        """Call fn(*args) in a pool process (a thread if the pool is off); fn and its result must pickle."""
+        executor = self._executor
+        if executor is None:
+            return await asyncio.to_thread(fn, *args)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(executor, fn, *args)
+        except BrokenProcessPool:
+            # Replace it once, whichever of the jobs it took down gets here first
+            if self._executor is executor:
+                logger.error("Extraction pool process died; starting a new pool")
+                self._executor = self._new_executor()
+                executor.shutdown(wait=False, cancel_futures=True)
+            raise
+
+    def spawn(self, coro: Awaitable[Any]) -> asyncio.Task:
+        """Run a background job on the event loop, keeping a reference until it finishes."""
+        task = asyncio.ensure_future(coro)
+        self._background.add(task)
+        task.add_done_callback(self._background.discard)
+        return task
+
+
+extraction_pool = ExtractionPool(settings.INLINE_WORKERS, settings.INLINE_MAX_PENDING)
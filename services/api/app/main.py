@@ -5,18 +5,28 @@ from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
+from .broker import broker
 from .config import settings
-from .routes import upload, jobs, events, export
+from .extraction_pool import extraction_pool
+from .routes import upload, jobs, batches, events, export, metrics
 from .database import init_db
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Create database tables on startup (handles SQLite dev mode)."""
+    """Create database tables on startup (handles SQLite dev mode), start the shared broker client and the inline extraction pool."""
     # Import models so Base.metadata knows about them
     from . import models  # noqa: F401
     await init_db()
-    yield
+    if not settings.RUN_EXTRACTION_INLINE:
+        await broker.start()
+    # Always available as the fallback when the broker is down; warmed up front when it is the main path
+    extraction_pool.start(prewarm=settings.RUN_EXTRACTION_INLINE)
+    try:
+        yield
+    finally:
+        await extraction_pool.stop()
+        await broker.stop()
 
 
 def create_app() -> FastAPI:
@@ -38,8 +48,10 @@ def create_app() -> FastAPI:
 
     app.include_router(upload.router)
     app.include_router(jobs.router)
+    app.include_router(batches.router)
     app.include_router(events.router)
     app.include_router(export.router)
+    app.include_router(metrics.router)
 
     @app.get("/api/health")
     async def health():
@@ -9,6 +9,7 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
@@ -20,6 +21,19 @@ from sqlalchemy.orm import Mapped, mapped_column, relationship
 from .database import Base
 
 
+class Batch(Base):
+    """A group of jobs submitted together (archive or multi-file upload)."""
+
+    __tablename__ = "batches"
+
+    id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now()
+    )
+
+    jobs: Mapped[list["Job"]] = relationship(back_populates="batch")
+
+
 class Job(Base):
     __tablename__ = "jobs"
 
@@ -30,6 +44,16 @@ class Job(Base):
     original_filename: Mapped[str] = mapped_column(String(512), nullable=False)
     upload_path: Mapped[str] = mapped_column(String(1024), nullable=False)
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
+    rule_pack: Mapped[str | None] = mapped_column(String(100), nullable=True)  # None = built-in rules
+    content_sha256: Mapped[str | None] = mapped_column(String(64), nullable=True, index=True)  # of the upload
+    batch_id: Mapped[uuid.UUID | None] = mapped_column(
+        Uuid, ForeignKey("batches.id", ondelete="SET NULL"), nullable=True, index=True
+    )
+    # Scheduling lane and cost estimate from upload time, and the measured pipeline time
+    lane: Mapped[str | None] = mapped_column(String(10), nullable=True)  # fast | slow
+    estimated_pages: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    estimated_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
+    actual_seconds: Mapped[float | None] = mapped_column(Float, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -37,6 +61,7 @@ class Job(Base):
         DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
     )
 
+    batch: Mapped["Batch | None"] = relationship(back_populates="jobs")
     courses: Mapped[list["Course"]] = relationship(back_populates="job", cascade="all, delete-orphan")
     events: Mapped[list["Event"]] = relationship(back_populates="job", cascade="all, delete-orphan")
 
@@ -58,6 +83,11 @@ class Course(Base):
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Keyset pagination of a job's events, all or by category (see routes/events.py)
+        Index("ix_events_job_order", "job_id", "date", "title", "id"),
+        Index("ix_events_job_category", "job_id", "category", "date", "title", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(Uuid, primary_key=True, default=uuid.uuid4)
     job_id: Mapped[uuid.UUID] = mapped_column(Uuid, ForeignKey("jobs.id", ondelete="CASCADE"), nullable=False)
@@ -0,0 +1,45 @@
+"""GET /api/batch/{batch_id} — aggregate progress of a batch upload."""
+
+import uuid
+
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ..database import get_db
+from ..models import Batch, Job
+from ..schemas import BatchJobStatus, BatchResponse
+
+router = APIRouter(prefix="/api", tags=["batches"])
+
+# Job statuses that are still waiting for the pipeline
+_PENDING_STATUSES = {"queued", "processing"}
+
+
+@router.get("/batch/{batch_id}", response_model=BatchResponse)
+async def get_batch(batch_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    batch = await db.get(Batch, batch_id)
+    if batch is None:
+        raise HTTPException(status_code=404, detail="Batch not found.")
+
+    result = await db.execute(
+        select(Job.id, Job.original_filename, Job.status)
+        .where(Job.batch_id == batch_id)
+        .order_by(Job.original_filename, Job.id)
+    )
+    jobs = [BatchJobStatus(id=row.id, original_filename=row.original_filename, status=row.status) for row in result]
+
+    status_counts: dict[str, int] = {}
+    for job in jobs:
+        status_counts[job.status] = status_counts.get(job.status, 0) + 1
+    completed = sum(n for status, n in status_counts.items() if status not in _PENDING_STATUSES)
+
+    return BatchResponse(
+        id=batch.id,
+        created_at=batch.created_at,
+        total=len(jobs),
+        status_counts=status_counts,
+        completed=completed,
+        progress=round(completed / len(jobs), 4) if jobs else 1.0,
+        jobs=jobs,
+    )
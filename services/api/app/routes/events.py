@@ -1,86 +1,187 @@
 """GET/PUT /api/job/{job_id}/events — event listing and bulk editing."""
 
+import base64
+import json
 import uuid
+from datetime import date
+from typing import Iterator, Optional
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy import delete, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from ..database import get_db
+from ..event_summary import load_job_summary, needs_attention_clause
 from ..models import Job, Event
 from ..schemas import (
     EventResponse,
     EventsBulkUpdate,
+    EventsBulkUpdateResponse,
+    EventUpdate,
     EventsListResponse,
-    NeedsAttention,
 )
 
 router = APIRouter(prefix="/api", tags=["events"])
 
 
-@router.get("/job/{job_id}/events", response_model=EventsListResponse)
-async def get_events(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    # Verify job exists
-    result = await db.execute(select(Job).where(Job.id == job_id))
-    if result.scalar_one_or_none() is None:
-        raise HTTPException(status_code=404, detail="Job not found.")
+# Listing order, and the key a page cursor encodes
+_ORDER_COLUMNS = ("date", "title", "id")
+MAX_PAGE_SIZE = 1000
 
-    # Fetch events sorted by date
-    events_result = await db.execute(
-        select(Event).where(Event.job_id == job_id).order_by(Event.date, Event.title)
-    )
-    events = list(events_result.scalars().all())
-
-    # Calculate needs_attention counts
-    ambiguous_count = sum(1 for e in events if e.is_ambiguous)
-    low_confidence_count = sum(1 for e in events if e.confidence < 0.6)
-    total_attention = sum(1 for e in events if e.is_ambiguous or e.confidence < 0.6)
-
-    return EventsListResponse(
-        events=[EventResponse.model_validate(e) for e in events],
-        needs_attention=NeedsAttention(
-            ambiguous_count=ambiguous_count,
-            low_confidence_count=low_confidence_count,
-            total=total_attention,
-        ),
-    )
+
+def _encode_cursor(row) -> str:
+    """Opaque cursor after a row: base64url JSON of its (date, title, id)."""
+    raw = json.dumps([row.date.isoformat(), row.title, str(row.id)], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
 
 
-@router.put("/job/{job_id}/events")
+def _decode_cursor(cursor: str) -> tuple[date, str, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        day, title, event_id = json.loads(raw)
+        return date.fromisoformat(day), str(title), uuid.UUID(event_id)
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor.")
+
+
+def _parse_fields(fields: Optional[str]) -> list[str]:
+    """Requested EventResponse fields, id first; every field if none are given."""
+    if not fields:
+        return list(EventResponse.model_fields)
+    names = [name.strip() for name in fields.split(",") if name.strip()]
+    unknown = sorted(set(names) - set(EventResponse.model_fields))
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown event fields: {', '.join(unknown)}.")
+    return ["id"] + [name for name in dict.fromkeys(names) if name != "id"]
+
+
+@router.get("/job/{job_id}/events", response_model=EventsListResponse, response_model_exclude_unset=True)
+async def get_events(
+    job_id: uuid.UUID,
+    limit: Optional[int] = Query(default=None, ge=1, le=MAX_PAGE_SIZE),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+    category: Optional[str] = None,
+    needs_attention: bool = False,
+    db: AsyncSession = Depends(get_db),
+):
+    """List a job's events ordered by (date, title, id).
+
+    Without limit every event is returned. With limit, pages are keyset
+    paginated: pass next_cursor back as cursor. fields= (comma-separated)
+    returns only those columns, e.g. fields=title,date,category to skip the
+    source excerpts. category= and needs_attention=true filter server-side; the
+    counts always cover the whole job.
+    """
+    names = _parse_fields(fields)
+    after = _decode_cursor(cursor) if cursor else None
+
+    # Verify job exists and count needs-attention items in one aggregate query
+    if (loaded := await load_job_summary(db, job_id)) is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    _, summary = loaded
+
+    # Plain column rows (no ORM objects); the order key is selected even if not requested
+    selected = names + [name for name in _ORDER_COLUMNS if name not in names]
+    query = select(*(getattr(Event, name) for name in selected)).where(Event.job_id == job_id)
+    if category:
+        query = query.where(Event.category == category)
+    if needs_attention:
+        query = query.where(needs_attention_clause())
+    if after:
+        query = query.where(tuple_(Event.date, Event.title, Event.id) > tuple_(*after))
+    query = query.order_by(Event.date, Event.title, Event.id)
+    if limit:
+        query = query.limit(limit + 1)
+    rows = (await db.execute(query)).all()
+
+    next_cursor = None
+    if limit and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1])
+
+    return {
+        # names are the leading selected columns, so zip drops the extra order-key values
+        "events": [dict(zip(names, row)) for row in rows],
+        "needs_attention": {
+            "ambiguous_count": summary.ambiguous,
+            "low_confidence_count": summary.low_confidence,
+            "total": summary.needs_attention,
+        },
+        "category_counts": summary.by_category,
+        "next_cursor": next_cursor,
+    }
+
+
+# Ids per IN (...) list, well under SQLite's and asyncpg's bind parameter limits
+_ID_CHUNK = 1000
+
+_PATCH_FIELDS = ("title", "date", "category", "description")
+
+
+def _chunks(ids: list[uuid.UUID]) -> Iterator[list[uuid.UUID]]:
+    for i in range(0, len(ids), _ID_CHUNK):
+        yield ids[i:i + _ID_CHUNK]
+
+
+def _merge_updates(updates: list[EventUpdate]) -> tuple[list[uuid.UUID], dict[uuid.UUID, dict]]:
+    """Collapse the payload into ids to delete and one patch per remaining event, in payload order.
+
+    A delete wins over any patch of the same event; later patches override earlier ones.
+    """
+    deletes: dict[uuid.UUID, None] = {}
+    patches: dict[uuid.UUID, dict] = {}
+    for update in updates:
+        if update.delete:
+            deletes[update.id] = None
+            patches.pop(update.id, None)
+        elif update.id not in deletes:
+            patch = patches.setdefault(update.id, {})
+            patch.update(
+                {name: getattr(update, name) for name in _PATCH_FIELDS if getattr(update, name) is not None}
+            )
+    return list(deletes), patches
+
+
+@router.put("/job/{job_id}/events", response_model=EventsBulkUpdateResponse)
 async def update_events(
     job_id: uuid.UUID,
     payload: EventsBulkUpdate,
     db: AsyncSession = Depends(get_db),
 ):
+    """Apply edits and deletions as set-based statements (a few round trips for any payload size).
+
+    Unknown events (or events of another job) are skipped and listed in not_found.
+    """
     # Verify job exists
-    result = await db.execute(select(Job).where(Job.id == job_id))
+    result = await db.execute(select(Job.id).where(Job.id == job_id))
     if result.scalar_one_or_none() is None:
         raise HTTPException(status_code=404, detail="Job not found.")
 
-    updated = 0
-    deleted = 0
-
-    for update in payload.updates:
-        event_result = await db.execute(
-            select(Event).where(Event.id == update.id, Event.job_id == job_id)
+    delete_ids, patches = _merge_updates(payload.updates)
+    requested = delete_ids + list(patches)
+    existing: set[uuid.UUID] = set()
+    for ids in _chunks(requested):
+        found = await db.execute(select(Event.id).where(Event.job_id == job_id, Event.id.in_(ids)))
+        existing.update(found.scalars())
+
+    delete_ids = [event_id for event_id in delete_ids if event_id in existing]
+    for ids in _chunks(delete_ids):
+        await db.execute(
+            delete(Event).where(Event.id.in_(ids)).execution_options(synchronize_session=False)
         )
-        event = event_result.scalar_one_or_none()
-        if event is None:
-            continue  # skip unknown events silently
 
-        if update.delete:
-            await db.delete(event)
-            deleted += 1
-            continue
-
-        if update.title is not None:
-            event.title = update.title
-        if update.date is not None:
-            event.date = update.date
-        if update.category is not None:
-            event.category = update.category
-        if update.description is not None:
-            event.description = update.description
-        updated += 1
-
-    return {"updated": updated, "deleted": deleted}
+    # ORM bulk UPDATE by primary key: one executemany per distinct set of patched fields
+    rows = [
+        {"id": event_id, **patch}
+        for event_id, patch in patches.items()
+        if event_id in existing and patch
+    ]
+    if rows:
+        await db.execute(update(Event), rows)
+
+    return EventsBulkUpdateResponse(
+        updated=sum(1 for event_id in patches if event_id in existing),
+        deleted=len(delete_ids),
+        not_found=[event_id for event_id in requested if event_id not in existing],
+    )
@@ -1,13 +1,21 @@
-"""GET /api/job/{job_id} and POST /api/job/{job_id}/finalize — job status endpoints."""
+"""GET /api/job/{job_id}, its progress stream, and POST /api/job/{job_id}/finalize — job status endpoints."""
 
+import asyncio
+import json
+import time
 import uuid
+from typing import AsyncIterator
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import select, func
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ..database import get_db
-from ..models import Job, Event
+from ..broker import broker
+from ..config import settings
+from ..database import async_session, get_db
+from ..event_summary import load_job_summary
+from ..models import Job
 from ..schemas import JobResponse
 
 router = APIRouter(prefix="/api", tags=["jobs"])
@@ -23,29 +31,20 @@ async def _get_job_or_404(job_id: uuid.UUID, db: AsyncSession) -> Job:
 
 @router.get("/job/{job_id}", response_model=JobResponse)
 async def get_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
-    job = await _get_job_or_404(job_id, db)
-
-    # Count events and needs-attention items
-    event_count_result = await db.execute(
-        select(func.count()).select_from(Event).where(Event.job_id == job_id)
-    )
-    event_count = event_count_result.scalar() or 0
-
-    attention_result = await db.execute(
-        select(func.count())
-        .select_from(Event)
-        .where(Event.job_id == job_id)
-        .where((Event.is_ambiguous == True) | (Event.confidence < 0.6))  # noqa: E712
-    )
-    needs_attention_count = attention_result.scalar() or 0
+    # Job row and event counts in one query (this endpoint is polled)
+    loaded = await load_job_summary(db, job_id)
+    if loaded is None:
+        raise HTTPException(status_code=404, detail="Job not found.")
+    job, summary = loaded
 
     return JobResponse(
         id=job.id,
         status=job.status,
         original_filename=job.original_filename,
         error_message=job.error_message,
-        event_count=event_count,
-        needs_attention_count=needs_attention_count,
+        event_count=summary.total,
+        needs_attention_count=summary.needs_attention,
+        category_counts=summary.by_category,
         created_at=job.created_at,
         updated_at=job.updated_at,
     )
@@ -61,3 +60,105 @@ async def finalize_job(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
         )
     job.status = "ready"
     return {"status": "ready"}
+
+
+# ── Progress stream (server-sent events) ─────────────────────────────────────
+
+_TERMINAL_STATUSES = {"needs_review", "ready", "failed"}
+_HEARTBEAT_SECONDS = 15.0
+_POLL_SECONDS = 2.0  # DB fallback when Redis is unreachable
+
+
+def _status_event(job: Job) -> dict:
+    """Progress event for a job's current row (used before and without pub/sub)."""
+    from shared.progress import make_event
+
+    if job.status == "failed":
+        return make_event(job.id, "failed", "failed", error=job.error_message)
+    if job.status in _TERMINAL_STATUSES:
+        return make_event(job.id, "done", job.status)
+    return make_event(job.id, job.status, job.status)
+
+
+def _sse(event: dict) -> str:
+    return f"data: {json.dumps(event, separators=(',', ':'), default=str)}\n\n"
+
+
+async def _redis_progress(job_id: uuid.UUID, deadline: float) -> AsyncIterator[str]:
+    """Relay the job's pub/sub events until a terminal one; raises if Redis is unreachable."""
+    from shared.progress import channel, is_terminal, last_event_key
+
+    if not broker.available:
+        raise ConnectionError("Redis is unavailable")
+    client = broker.redis()
+    pubsub = client.pubsub()
+    try:
+        await pubsub.subscribe(channel(str(job_id)))
+        # Subscribed first, so nothing published from here on is missed
+        last = await client.get(last_event_key(str(job_id)))
+        if last:
+            yield f"data: {last.decode()}\n\n"
+            if is_terminal(json.loads(last)):
+                return
+        while time.monotonic() < deadline:
+            message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=_HEARTBEAT_SECONDS)
+            if message is None:
+                yield ": keepalive\n\n"
+                continue
+            data = message["data"].decode()
+            yield f"data: {data}\n\n"
+            if is_terminal(json.loads(data)):
+                return
+    finally:
+        # Returns the connection to the shared pool
+        await pubsub.aclose()
+
+
+async def _polled_progress(job_id: uuid.UUID, status: str, deadline: float) -> AsyncIterator[str]:
+    """Fallback without Redis: read the job row every few seconds and emit status changes."""
+    while time.monotonic() < deadline:
+        await asyncio.sleep(_POLL_SECONDS)
+        async with async_session() as db:
+            job = await db.get(Job, job_id)
+        if job is None:
+            return
+        if job.status != status:
+            status = job.status
+            yield _sse(_status_event(job))
+            if status in _TERMINAL_STATUSES:
+                return
+
+
+@router.get("/job/{job_id}/progress")
+async def stream_job_progress(job_id: uuid.UUID, db: AsyncSession = Depends(get_db)):
+    """Stream the job's pipeline progress as server-sent events (see shared.progress).
+
+    The first event reflects the job row; the stream ends after a "done" or
+    "failed" event, or after PROGRESS_STREAM_MAX_SECONDS (EventSource reconnects).
+    """
+    job = await _get_job_or_404(job_id, db)
+    initial = _status_event(job)
+    status = job.status
+
+    async def events() -> AsyncIterator[str]:
+        yield _sse(initial)
+        if status in _TERMINAL_STATUSES:
+            return
+        deadline = time.monotonic() + settings.PROGRESS_STREAM_MAX_SECONDS
+        sent = False
+        try:
+            async for chunk in _redis_progress(job_id, deadline):
+                sent = True
+                yield chunk
+            return
+        except Exception:
+            if sent:
+                return  # the client reconnects and resumes from the latest event
+        async for chunk in _polled_progress(job_id, status, deadline):
+            yield chunk
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
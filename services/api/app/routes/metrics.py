@@ -0,0 +1,17 @@
+"""GET /api/metrics — pipeline metrics in Prometheus text format."""
+
+from fastapi import APIRouter
+from fastapi.responses import Response
+
+router = APIRouter(prefix="/api", tags=["metrics"])
+
+
+@router.get("/metrics")
+async def metrics():
+    """Stage timings and counters for extractions run in this API process."""
+    from shared.metrics import REGISTRY
+
+    return Response(
+        content=REGISTRY.render(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
@@ -1,147 +1,201 @@
-"""POST /api/upload — file upload and job creation."""
+"""POST /api/upload and /api/upload/batch — file upload and job creation."""
 
 import os
 import uuid
+import shutil
 import asyncio
+import hashlib
+import logging
 import traceback
+import zipfile
+import zlib
 
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from typing import TYPE_CHECKING, Any, BinaryIO, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from sqlalchemy import delete
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from ..broker import broker
 from ..config import settings
-from ..database import get_db
-from ..models import Job, Event
-from ..schemas import JobCreateResponse
+from ..database import async_session, get_db
+from ..extraction_pool import PoolSaturated, extraction_pool, run_extraction
+from ..models import Batch, Job, Event
+from ..schemas import BatchCreateResponse, JobCreateResponse
+
+if TYPE_CHECKING:
+    from shared.extraction.cost_estimator import CostEstimate
+
+logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api", tags=["upload"])
 
 ALLOWED_EXTENSIONS = {".pdf", ".docx", ".png", ".jpg", ".jpeg"}
 
+# Leading bytes each file type must start with (a PDF header may follow up to 1 KB of junk)
+_SIGNATURES = {
+    ".pdf": b"%PDF-",
+    ".docx": b"PK\x03\x04",
+    ".png": b"\x89PNG\r\n\x1a\n",
+    ".jpg": b"\xff\xd8\xff",
+    ".jpeg": b"\xff\xd8\xff",
+}
+_PDF_HEADER_WINDOW = 1024
+UPLOAD_CHUNK_BYTES = 1024 * 1024
 
-def _run_extraction_sync(job_id: str, file_path: str, original_filename: str = "") -> dict:
-    """Run the extraction pipeline synchronously (fallback when Celery is unavailable)."""
-    from shared.extraction.text_extractor import extract_text
-    from shared.extraction.date_finder import find_date_candidates
-    from shared.extraction.event_assembler import assemble_events
 
-    pages = extract_text(file_path)
-    if not pages:
-        return {"events": [], "error": "No text could be extracted from the uploaded file."}
+class UploadTooLarge(Exception):
+    pass
 
-    candidates = find_date_candidates(pages, filename=original_filename)
-    if not candidates:
-        return {"events": [], "error": "No dates were found in the document."}
 
-    event_drafts = assemble_events(candidates)
+def _upload_dir() -> str:
+    if os.path.isabs(settings.UPLOAD_DIR):
+        return settings.UPLOAD_DIR
+    return os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", settings.UPLOAD_DIR))
 
-    # Optional LLM classification
-    use_llm = os.environ.get("USE_LLM_CLASSIFIER", "false").lower() == "true"
-    llm_api_key = os.environ.get("LLM_API_KEY", "")
-    if use_llm and llm_api_key:
-        try:
-            from shared.extraction.llm_classifier import classify_with_llm_sync
-            llm_provider = os.environ.get("LLM_PROVIDER", "openai")
-            classifications = classify_with_llm_sync(
-                candidates=candidates, provider=llm_provider, api_key=llm_api_key
-            )
-            # Apply LLM results
-            cls_map = {c.candidate_index: c for c in classifications}
-            for i, draft in enumerate(event_drafts):
-                if i in cls_map:
-                    c = cls_map[i]
-                    if c.title:
-                        draft.title = c.title
-                    if c.category:
-                        draft.category = c.category
-                    if c.description:
-                        draft.description = c.description
-                    draft.confidence = round(max(0.10, min(0.99, draft.confidence + c.confidence_adjustment)), 2)
-        except Exception:
-            pass  # LLM failure is non-fatal
-
-    return {"events": event_drafts, "error": None}
 
+def _validate_rule_pack(rule_pack: Optional[str]) -> None:
+    """Validate the requested rule pack up front (compiled once and cached by content hash)."""
+    if not rule_pack:
+        return
+    from shared.extraction.rules import resolve_rule_pack
 
-@router.post("/upload", response_model=JobCreateResponse)
-async def upload_file(
-    file: UploadFile = File(...),
-    db: AsyncSession = Depends(get_db),
-):
-    # Validate file type
-    if not file.filename:
-        raise HTTPException(status_code=400, detail="No filename provided.")
+    try:
+        resolve_rule_pack(rule_pack, settings.RULE_PACK_DIR or None)
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc))
 
-    ext = os.path.splitext(file.filename)[1].lower()
-    if ext not in ALLOWED_EXTENSIONS:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Unsupported file type '{ext}'. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}",
-        )
 
-    # Create job
-    job_id = uuid.uuid4()
-    if os.path.isabs(settings.UPLOAD_DIR):
-        upload_dir = settings.UPLOAD_DIR
+def _max_upload_bytes() -> int:
+    return settings.MAX_UPLOAD_MB * 1024 * 1024
+
+
+def _content_error(filename: str, head: bytes) -> Optional[str]:
+    """Why the file's leading bytes don't match its extension, or None if they do."""
+    if not head:
+        return "The uploaded file is empty."
+    ext = os.path.splitext(filename)[1].lower()
+    signature = _SIGNATURES.get(ext)
+    if signature is None:
+        return None
+    if ext == ".pdf":
+        ok = signature in head[:_PDF_HEADER_WINDOW]
     else:
-        upload_dir = os.path.abspath(
-            os.path.join(os.path.dirname(__file__), "..", "..", settings.UPLOAD_DIR)
-        )
-    job_dir = os.path.join(upload_dir, str(job_id))
-    os.makedirs(job_dir, exist_ok=True)
+        ok = head.startswith(signature)
+    return None if ok else f"The file content does not match its '{ext}' extension."
 
-    # Save file
-    file_path = os.path.join(job_dir, file.filename)
-    content = await file.read()
-    with open(file_path, "wb") as f:
-        f.write(content)
 
-    # Create DB record
-    job = Job(
+def _stream_to_disk(src, dest_path: str, max_bytes: int) -> tuple[int, str, bytes]:
+    """Copy a file object to dest_path in chunks, hashing as it goes.
+
+    Returns (size, sha256 hex, first bytes). Raises UploadTooLarge as soon as
+    more than max_bytes have been read. Runs in a worker thread.
+    """
+    digest = hashlib.sha256()
+    size = 0
+    head = b""
+    with open(dest_path, "wb") as out:
+        while True:
+            chunk = src.read(UPLOAD_CHUNK_BYTES)
+            if not chunk:
+                break
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadTooLarge()
+            if len(head) < _PDF_HEADER_WINDOW:
+                head += chunk[:_PDF_HEADER_WINDOW - len(head)]
+            digest.update(chunk)
+            out.write(chunk)
+    return size, digest.hexdigest(), head
+
+
+def _build_job(
+    job_id: uuid.UUID,
+    filename: str,
+    file_path: str,
+    sha256: str,
+    estimate: "CostEstimate",
+    rule_pack: Optional[str] = None,
+    batch_id: Optional[uuid.UUID] = None,
+) -> Job:
+    """The (unflushed) job record for a saved upload; the cost estimate picks its lane."""
+    return Job(
         id=job_id,
         status="queued",
-        original_filename=file.filename,
+        original_filename=filename,
         upload_path=file_path,
+        rule_pack=rule_pack or None,
+        content_sha256=sha256,
+        batch_id=batch_id,
+        lane=estimate.lane(settings.FAST_LANE_MAX_SECONDS),
+        estimated_pages=estimate.pages,
+        estimated_seconds=estimate.seconds,
     )
-    db.add(job)
-    await db.flush()
-
-    # Try Celery first; fall back to inline extraction (or run inline when RUN_EXTRACTION_INLINE=true, e.g. Railway with no shared volume)
-    celery_dispatched = False
-    if not settings.RUN_EXTRACTION_INLINE:
-        try:
-            from celery import Celery
-            import redis as redis_lib
 
-            # Quick check if Redis is reachable
-            r = redis_lib.Redis.from_url(settings.REDIS_URL, socket_connect_timeout=1)
-            r.ping()
 
-            celery_app = Celery(broker=settings.REDIS_URL)
-            celery_app.send_task("app.tasks.process_job", args=[str(job_id)])
-            celery_dispatched = True
-        except Exception:
-            pass
+def _save_upload(src, filename: str) -> tuple[uuid.UUID, str, str, "CostEstimate"]:
+    """Stream an upload into a new job directory and estimate its cost (worker thread).
 
-    if not celery_dispatched:
-        # Run extraction inline in a thread to avoid blocking the event loop
-        job.status = "processing"
-        await db.flush()
+    Raises HTTPException (and removes the directory) if the file is too large,
+    empty, or not the type its extension claims.
+    """
+    from shared.extraction.cost_estimator import estimate_file_cost
 
+    job_id = uuid.uuid4()
+    job_dir = os.path.join(_upload_dir(), str(job_id))
+    os.makedirs(job_dir, exist_ok=True)
+    file_path = os.path.join(job_dir, filename)
+    try:
         try:
-            result = await asyncio.to_thread(
-                _run_extraction_sync, str(job_id), file_path, file.filename or ""
+            _, sha256, head = _stream_to_disk(src, file_path, _max_upload_bytes())
+        except UploadTooLarge:
+            raise HTTPException(
+                status_code=413, detail=f"File is larger than the {settings.MAX_UPLOAD_MB} MB limit."
             )
+        error = _content_error(filename, head)
+        if error:
+            raise HTTPException(status_code=400, detail=error)
+        return job_id, file_path, sha256, estimate_file_cost(filename, file_path)
+    except BaseException:
+        shutil.rmtree(job_dir, ignore_errors=True)
+        raise
 
-            if result["error"] and not result["events"]:
-                job.status = "needs_review"
-                job.error_message = result["error"]
-            else:
+
+def _pool_saturated() -> HTTPException:
+    return HTTPException(
+        status_code=503,
+        detail="The server is busy processing other uploads. Try again shortly.",
+        headers={"Retry-After": str(settings.INLINE_RETRY_AFTER_SECONDS)},
+    )
+
+
+async def _run_inline(db: AsyncSession, job: Job) -> None:
+    """Run extraction in the extraction pool (off the event loop) and persist the results.
+
+    The caller holds an extraction_pool slot.
+    """
+    job.status = "processing"
+    await db.flush()
+
+    try:
+        result = await extraction_pool.run(
+            run_extraction, str(job.id), job.upload_path, job.original_filename, job.rule_pack
+        )
+        # The run was timed in a pool process; record it here, where /api/metrics exports it
+        result["run"].flush()
+
+        if result["error"] and not result["events"]:
+            job.status = "needs_review"
+            job.error_message = result["error"]
+        else:
+            run = result["run"]
+            with run.stage("persist"):
                 has_ambiguous = False
                 has_low_confidence = False
                 for draft in result["events"]:
                     event = Event(
                         id=draft.id,
-                        job_id=job_id,
+                        job_id=job.id,
                         title=draft.title,
                         description=draft.description,
                         date=draft.date,
@@ -161,8 +215,258 @@ async def upload_file(
 
                 job.status = "needs_review" if (has_ambiguous or has_low_confidence) else "ready"
                 job.error_message = None
-        except Exception as exc:
-            job.status = "failed"
-            job.error_message = str(exc)[:1000]
+                await db.flush()
+            run.count("events", len(result["events"]))
+        # Measured time next to the estimate, for calibrating lanes
+        from shared.metrics import JOB_COST
+
+        job.actual_seconds = round(sum(result["run"].durations.values()), 2)
+        JOB_COST.observe(job.estimated_seconds, lane=job.lane, kind="estimated")
+        JOB_COST.observe(job.actual_seconds, lane=job.lane, kind="actual")
+    except Exception as exc:
+        job.status = "failed"
+        job.error_message = str(exc)[:1000]
+
+
+async def _run_in_background(job_ids: list[uuid.UUID]) -> None:
+    """Extract jobs one after another after the upload has returned, in their own sessions.
+
+    Releases the extraction_pool slot the upload acquired.
+    """
+    try:
+        for job_id in job_ids:
+            async with async_session() as db:
+                job = await db.get(Job, job_id)
+                if job is None:
+                    continue
+                # Committed so pollers and the progress stream see the job start
+                job.status = "processing"
+                await db.commit()
+                await _run_inline(db, job)
+                await db.commit()
+    except Exception:
+        logger.exception("Background extraction failed")
+    finally:
+        extraction_pool.release()
+
+
+async def _process_inline(db: AsyncSession, jobs: list[Job], background: bool) -> None:
+    """Extract jobs in the API, in order; with background, after the response is sent.
+
+    Raises 503 (Retry-After) if the extraction pool is saturated; the jobs (and
+    their batch) were committed for dispatch, so they are deleted again along with
+    the uploads' directories.
+    """
+    try:
+        extraction_pool.acquire()
+    except PoolSaturated:
+        await db.execute(delete(Job).where(Job.id.in_([job.id for job in jobs])))
+        batch_ids = {job.batch_id for job in jobs if job.batch_id is not None}
+        if batch_ids:
+            await db.execute(delete(Batch).where(Batch.id.in_(batch_ids)))
+        await db.commit()
+        for job in jobs:
+            shutil.rmtree(os.path.dirname(job.upload_path), ignore_errors=True)
+        raise _pool_saturated()
+    if background:
+        # The jobs are already committed, so the background sessions see them
+        extraction_pool.spawn(_run_in_background([job.id for job in jobs]))
+        return
+    try:
+        for job in jobs:
+            await _run_inline(db, job)
+    finally:
+        extraction_pool.release()
+
+
+@router.post("/upload", response_model=JobCreateResponse)
+async def upload_file(
+    file: UploadFile = File(...),
+    rule_pack: Optional[str] = Form(default=None),
+    background: bool = Form(default=False),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create a job for one syllabus.
+
+    Without a Celery broker the upload is extracted in the API: before the
+    response by default, or after it with background=true (poll the job or its
+    /progress stream). 503 with Retry-After when inline extraction is saturated.
+    """
+    # Validate file type
+    filename = os.path.basename(file.filename or "")
+    if not filename:
+        raise HTTPException(status_code=400, detail="No filename provided.")
+
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in ALLOWED_EXTENSIONS:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unsupported file type '{ext}'. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}",
+        )
+    if file.size is not None and file.size > _max_upload_bytes():
+        raise HTTPException(status_code=413, detail=f"File is larger than the {settings.MAX_UPLOAD_MB} MB limit.")
+
+    _validate_rule_pack(rule_pack)
+    # Refuse before reading the body if the upload could only wait for a saturated pool
+    if not broker.available and extraction_pool.saturated:
+        raise _pool_saturated()
+
+    # Stream to disk off the event loop (hashing and size-checking as it goes);
+    # bad files are rejected before the job row exists
+    job_id, file_path, sha256, estimate = await asyncio.to_thread(_save_upload, file.file, filename)
+    job = _build_job(job_id, filename, file_path, sha256, estimate, rule_pack)
+    db.add(job)
+    # Committed before dispatch: a worker may load the job as soon as the task is published
+    await db.commit()
+
+    # Try Celery first; fall back to inline extraction (or run inline when RUN_EXTRACTION_INLINE=true, e.g. Railway with no shared volume).
+    # The broker's health is cached, so an unreachable Redis costs nothing here.
+    celery_dispatched = await broker.send_task(
+        "app.tasks.process_job", args=[str(job.id)], kwargs={"lane": job.lane}
+    )
+    if not celery_dispatched:
+        await _process_inline(db, [job], background)
+
+    return JobCreateResponse(job_id=job.id, status=job.status)
+
+
+# A batch entry to save: (name for skipped, file name, archive or None, ZipInfo or plain file object)
+_BatchEntry = tuple[str, str, Optional[zipfile.ZipFile], Any]
+
+
+def _plan_batch(
+    files: list[tuple[str, BinaryIO]],
+    archives: list[zipfile.ZipFile],
+) -> tuple[list[_BatchEntry], list[str]]:
+    """Pick the files to save from plain uploads and .zip archives, reading only sizes and zip directories.
+
+    Unsupported types, unreadable archives and files over MAX_UPLOAD_MB are
+    skipped. Raises 400 past BATCH_MAX_FILES accepted files and 413 when their
+    (declared, uncompressed) sizes add up to more than BATCH_MAX_TOTAL_MB, before
+    any content is read. Archives are opened on the spooled upload files and
+    appended to archives; the caller closes them.
+    """
+    max_bytes = _max_upload_bytes()
+    entries: list[_BatchEntry] = []
+    skipped: list[str] = []
+    total = 0
+    for name, src in files:
+        ext = os.path.splitext(name)[1].lower()
+        if ext != ".zip":
+            size = src.seek(0, os.SEEK_END)
+            src.seek(0)
+            if ext in ALLOWED_EXTENSIONS and size <= max_bytes:
+                entries.append((name, os.path.basename(name), None, src))
+                total += size
+            else:
+                skipped.append(name)
+        else:
+            try:
+                archive = zipfile.ZipFile(src)
+            except zipfile.BadZipFile:
+                skipped.append(name)
+                continue
+            archives.append(archive)
+            for info in archive.infolist():
+                # Only the base name is used, so member paths cannot escape the job directory
+                member = os.path.basename(info.filename)
+                if info.is_dir() or not member or member.startswith(".") or info.filename.startswith("__MACOSX/"):
+                    continue
+                label = f"{name}/{info.filename}"
+                if os.path.splitext(member)[1].lower() not in ALLOWED_EXTENSIONS or info.file_size > max_bytes:
+                    skipped.append(label)
+                    continue
+                entries.append((label, member, archive, info))
+                total += info.file_size
+        if len(entries) > settings.BATCH_MAX_FILES:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Too many files; the limit is {settings.BATCH_MAX_FILES} per batch.",
+            )
+    if total > settings.BATCH_MAX_TOTAL_MB * 1024 * 1024:
+        raise HTTPException(
+            status_code=413,
+            detail=f"The batch is larger than the {settings.BATCH_MAX_TOTAL_MB} MB limit (uncompressed).",
+        )
+    return entries, skipped
+
+
+def _save_batch(
+    files: list[tuple[str, BinaryIO]],
+    rule_pack: Optional[str],
+    batch_id: uuid.UUID,
+) -> tuple[list[Job], list[str]]:
+    """Stream every accepted batch file to its own job directory (worker thread).
+
+    Files go through _save_upload like single uploads (chunked, hashed, size- and
+    content-checked); a rejected file is skipped. Returns the unflushed jobs and
+    the skipped names. If the batch is refused, nothing is left on disk.
+    """
+    archives: list[zipfile.ZipFile] = []
+    jobs: list[Job] = []
+    try:
+        entries, skipped = _plan_batch(files, archives)
+        for label, filename, archive, item in entries:
+            src = archive.open(item) if archive is not None else item
+            try:
+                job_id, file_path, sha256, estimate = _save_upload(src, filename)
+            except (HTTPException, zipfile.BadZipFile, zlib.error):  # rejected, or a corrupt member
+                skipped.append(label)
+                continue
+            finally:
+                if archive is not None:
+                    src.close()
+            jobs.append(_build_job(job_id, filename, file_path, sha256, estimate, rule_pack, batch_id))
+    except BaseException:
+        for job in jobs:
+            shutil.rmtree(os.path.dirname(job.upload_path), ignore_errors=True)
+        raise
+    finally:
+        for archive in archives:
+            archive.close()
+    return jobs, skipped
+
+
+@router.post("/upload/batch", response_model=BatchCreateResponse)
+async def upload_batch(
+    files: list[UploadFile] = File(...),
+    rule_pack: Optional[str] = Form(default=None),
+    background: bool = Form(default=False),
+    db: AsyncSession = Depends(get_db),
+):
+    """Create jobs for many syllabi at once (several files and/or .zip archives).
+
+    All jobs are created in one transaction. With Celery, they are dispatched as
+    a group of process_batch tasks of BATCH_TASK_SIZE jobs each; progress is at
+    GET /api/batch/{batch_id}. Without it, the jobs are extracted inline one
+    after another (holding one extraction pool slot), optionally in the background.
+    """
+    _validate_rule_pack(rule_pack)
+    if not broker.available and extraction_pool.saturated:
+        raise _pool_saturated()
+
+    # The uploads are already spooled to temporary files; they are read from there in chunks
+    batch = Batch(id=uuid.uuid4())
+    jobs, skipped = await asyncio.to_thread(
+        _save_batch, [(f.filename or "", f.file) for f in files], rule_pack, batch.id
+    )
+    if not jobs:
+        raise HTTPException(status_code=400, detail="No supported files in the upload.")
+    db.add(batch)
+    db.add_all(jobs)
+    # One transaction for the batch and its jobs, committed before any worker can load them
+    await db.commit()
+
+    # Cheapest jobs first so small documents in the batch finish early
+    ordered = sorted(jobs, key=lambda job: job.estimated_seconds or 0.0)
+    size = max(1, settings.BATCH_TASK_SIZE)
+    # Whole-pipeline batch tasks are dominated by extraction, so they use its queue
+    celery_dispatched = await broker.send_group(
+        "app.tasks.process_batch",
+        [[[str(job.id) for job in ordered[i:i + size]]] for i in range(0, len(ordered), size)],
+        queue="extract",
+    )
+    if not celery_dispatched:
+        await _process_inline(db, jobs, background)
 
-    return JobCreateResponse(job_id=job_id)
+    return BatchCreateResponse(batch_id=batch.id, job_ids=[job.id for job in jobs], skipped=skipped)
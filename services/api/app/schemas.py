@@ -4,10 +4,13 @@ from __future__ import annotations
 
 import uuid
 from datetime import date, datetime
-from typing import Optional
+from typing import Annotated, Optional, Union
 
 from pydantic import BaseModel, Field
 
+# For optional fields named "date": with a None default, the field name shadows the type in its class
+_Date = date
+
 
 # ── Job ──────────────────────────────────────────────────────────────────────
 
@@ -18,6 +21,7 @@ class JobResponse(BaseModel):
     error_message: Optional[str] = None
     event_count: int = 0
     needs_attention_count: int = 0
+    category_counts: dict[str, int] = Field(default_factory=dict)  # event category -> number of events
     created_at: datetime
     updated_at: datetime
 
@@ -26,6 +30,31 @@ class JobResponse(BaseModel):
 
 class JobCreateResponse(BaseModel):
     job_id: uuid.UUID
+    status: str = "queued"  # Final status if the upload was processed inline before returning
+
+
+class BatchCreateResponse(BaseModel):
+    batch_id: uuid.UUID
+    job_ids: list[uuid.UUID]
+    skipped: list[str] = Field(default_factory=list)  # archive members / files not accepted
+
+
+class BatchJobStatus(BaseModel):
+    id: uuid.UUID
+    original_filename: str
+    status: str
+
+    model_config = {"from_attributes": True}
+
+
+class BatchResponse(BaseModel):
+    id: uuid.UUID
+    created_at: datetime
+    total: int
+    status_counts: dict[str, int]  # job status -> number of jobs
+    completed: int  # jobs no longer queued or processing
+    progress: float  # completed / total
+    jobs: list[BatchJobStatus]
 
 
 # ── Event ────────────────────────────────────────────────────────────────────
@@ -50,9 +79,31 @@ class EventResponse(BaseModel):
     model_config = {"from_attributes": True}
 
 
+class PartialEventResponse(BaseModel):
+    """An event with only the fields requested with ?fields= (id is always included)."""
+    id: uuid.UUID
+    job_id: Optional[uuid.UUID] = None
+    course_id: Optional[int] = None
+    title: Optional[str] = None
+    description: Optional[str] = None
+    date: Optional[_Date] = None
+    all_day: Optional[bool] = None
+    category: Optional[str] = None
+    confidence: Optional[float] = None
+    source_page: Optional[int] = None
+    source_excerpt: Optional[str] = None
+    source_kind: Optional[str] = None
+    is_ambiguous: Optional[bool] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
 class EventsListResponse(BaseModel):
-    events: list[EventResponse]
-    needs_attention: NeedsAttention
+    # Full events validate as EventResponse on the first try; only projections fall through
+    events: list[Annotated[Union[EventResponse, PartialEventResponse], Field(union_mode="left_to_right")]]
+    needs_attention: NeedsAttention  # counts for the whole job, not just this page
+    category_counts: dict[str, int] = Field(default_factory=dict)
+    next_cursor: Optional[str] = None  # pass as ?cursor= for the next page; None on the last page
 
 
 class NeedsAttention(BaseModel):
@@ -78,3 +129,9 @@ class EventUpdate(BaseModel):
 class EventsBulkUpdate(BaseModel):
     """Bulk event update payload."""
     updates: list[EventUpdate]
+
+
+class EventsBulkUpdateResponse(BaseModel):
+    updated: int  # events patched
+    deleted: int
+    not_found: list[uuid.UUID] = Field(default_factory=list)  # ids not among the job's events (skipped)
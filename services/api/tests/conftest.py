@@ -0,0 +1,63 @@
+"""API test setup: a throwaway SQLite database and inline extraction (no broker)."""
+
+import os
+import sys
+import tempfile
+import uuid
+from datetime import date
+
+import pytest
+
+_tmp = tempfile.mkdtemp(prefix="syllascribe-api-tests-")
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{_tmp}/api.db")
+os.environ.setdefault("DATABASE_URL_SYNC", f"sqlite:///{_tmp}/api.db")
+os.environ.setdefault("UPLOAD_DIR", os.path.join(_tmp, "uploads"))
+os.environ.setdefault("RUN_EXTRACTION_INLINE", "true")
+os.environ.setdefault("INLINE_WORKERS", "0")
+
+_here = os.path.dirname(os.path.abspath(__file__))
+for path in (os.path.join(_here, ".."), os.path.join(_here, "..", "..", "..", "packages", "shared")):
+    path = os.path.abspath(path)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+
+from app.config import settings  # noqa: E402
+from app.database import Base  # noqa: E402
+from app.main import app  # noqa: E402
+from app.models import Event, Job  # noqa: E402
+
+_sync_engine = create_engine(settings.DATABASE_URL_SYNC)
+
+
+@pytest.fixture(scope="session")
+def client():
+    with TestClient(app) as c:
+        yield c
+
+
+@pytest.fixture()
+def db():
+    """A synchronous session on the test database, for seeding and checking rows."""
+    Base.metadata.create_all(_sync_engine)
+    session = sessionmaker(bind=_sync_engine, expire_on_commit=False)()
+    yield session
+    session.close()
+
+
+@pytest.fixture()
+def make_job(db):
+    """Create a job with events: make_job([dict(title=..., date=..., ...), ...]) -> Job."""
+
+    def make(events=(), status="needs_review"):
+        job = Job(id=uuid.uuid4(), status=status, original_filename="syllabus.pdf", upload_path="/nowhere")
+        db.add(job)
+        for fields in events:
+            db.add(Event(job_id=job.id, **{"title": "Event", "date": date(2026, 2, 1), **fields}))
+        db.commit()
+        return job
+
+    return make
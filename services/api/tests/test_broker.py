@@ -0,0 +1,178 @@
+"""Tests for the shared broker client, with a stub Celery app and Redis client (no Redis server)."""
+
+import asyncio
+import os
+import threading
+import time
+
+import celery
+import pytest
+
+from app.broker import Broker, broker
+from app.config import settings
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "packages", "shared", "fixtures", "synthetic_syllabus.pdf",
+)
+
+
+class StubRedis:
+    def __init__(self, up):
+        self.up = up  # callable: is Redis reachable right now?
+
+    async def ping(self):
+        if not self.up():
+            raise ConnectionError("Connection refused")
+        return True
+
+
+class StubCelery:
+    """Records publishes; each takes delay seconds (a slow broker) or raises if failing."""
+
+    def __init__(self, delay=0.0, failing=False):
+        self.delay = delay
+        self.failing = failing
+        self.sent = []
+        self.threads = set()
+
+    def _publish(self, what):
+        self.threads.add(threading.get_ident())
+        time.sleep(self.delay)
+        if self.failing:
+            raise ConnectionError("Connection refused")
+        self.sent.append(what)
+
+    def send_task(self, name, args=None, kwargs=None, **options):
+        self._publish((name, args, kwargs, options))
+
+    def signature(self, name, args=None, **options):
+        return self, (name, args, options)
+
+    def close(self):
+        pass
+
+
+class StubGroup:
+    """Stands in for celery.group over StubCelery signatures."""
+
+    def __init__(self, signatures):
+        self.signatures = list(signatures)
+
+    def apply_async(self):
+        celery_app = self.signatures[0][0]
+        celery_app._publish([signature for _, signature in self.signatures])
+
+
+def _broker(celery_app, up=lambda: True):
+    b = Broker("redis://stub")
+    b._celery = celery_app
+    b.redis = lambda: StubRedis(up)
+    return b
+
+
+@pytest.fixture(autouse=True)
+def stub_group(monkeypatch):
+    monkeypatch.setattr(celery, "group", StubGroup)
+
+
+def test_check_caches_health():
+    state = {"up": False}
+    b = _broker(StubCelery(), up=lambda: state["up"])
+    assert asyncio.run(b.check()) is False
+    assert not b.available and b.checked_at > 0
+    state["up"] = True
+    assert asyncio.run(b.check()) is True
+    assert b.available
+
+
+def test_unhealthy_broker_does_not_publish():
+    stub = StubCelery()
+    b = _broker(stub)
+    assert asyncio.run(b.send_task("app.tasks.process_job", args=["1"])) is False
+    assert stub.sent == []
+
+
+def test_failed_publish_marks_broker_unavailable():
+    for send in (
+        lambda b: b.send_task("app.tasks.process_job", args=["1"]),
+        lambda b: b.send_group("app.tasks.process_batch", [[["1"]], [["2"]]], queue="extract"),
+    ):
+        stub = StubCelery(failing=True)
+        b = _broker(stub)
+        b.healthy = True
+        assert asyncio.run(send(b)) is False
+        assert not b.available
+
+
+def test_send_group_publishes_one_signature_per_entry():
+    stub = StubCelery()
+    b = _broker(stub)
+    b.healthy = True
+    assert asyncio.run(b.send_group("app.tasks.process_batch", [[["1", "2"]], [["3"]]], queue="extract")) is True
+    assert stub.sent == [[
+        ("app.tasks.process_batch", [["1", "2"]], {"queue": "extract"}),
+        ("app.tasks.process_batch", [["3"]], {"queue": "extract"}),
+    ]]
+
+
+def test_publishes_run_off_the_event_loop():
+    stub = StubCelery(delay=0.2)
+    b = _broker(stub)
+    b.healthy = True
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        sent = await asyncio.gather(
+            b.send_task("app.tasks.process_job", args=["1"]),
+            b.send_group("app.tasks.process_batch", [[["2"]]]),
+        )
+        task.cancel()
+        return sent, ticks, threading.get_ident()
+
+    sent, ticks, loop_thread = asyncio.run(scenario())
+    assert sent == [True, True]
+    # The loop kept running while both 0.2 s publishes were in flight
+    assert ticks >= 10
+    assert loop_thread not in stub.threads
+
+
+def test_refresh_loop_restores_health(monkeypatch):
+    monkeypatch.setattr(settings, "BROKER_HEALTH_INTERVAL_SECONDS", 0.01)
+    state = {"up": False}
+    b = _broker(StubCelery(), up=lambda: state["up"])
+
+    async def scenario():
+        await b.check()
+        assert not b.available
+        b._refresher = asyncio.create_task(b._refresh_loop())
+        state["up"] = True
+        for _ in range(100):
+            if b.available:
+                break
+            await asyncio.sleep(0.01)
+        available = b.available
+        await b.stop()
+        return available
+
+    assert asyncio.run(scenario()) is True
+    assert not b.healthy
+
+
+def test_upload_falls_back_to_inline_when_publish_fails(client, monkeypatch):
+    stub = StubCelery(failing=True)
+    monkeypatch.setattr(broker, "_celery", stub)
+    monkeypatch.setattr(broker, "healthy", True)
+    with open(FIXTURE, "rb") as f:
+        response = client.post("/api/upload", files={"file": ("s.pdf", f.read(), "application/pdf")})
+    assert response.status_code == 200, response.text
+    # Extracted in the API instead of waiting in the queue
+    assert response.json()["status"] in ("ready", "needs_review")
+    assert not broker.available
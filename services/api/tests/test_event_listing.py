@@ -0,0 +1,91 @@
+"""Tests for GET /api/job/{id}/events: keyset pages, field projection and filters."""
+
+import uuid
+from datetime import date
+
+import pytest
+
+# Ties on (date, title) so the id tie-break decides the order
+EVENTS = (
+    [dict(title="Quiz", date=date(2026, 2, 3), category="exam", confidence=0.9) for _ in range(4)]
+    + [dict(title="Homework", date=date(2026, 2, 3), category="assignment", confidence=0.5) for _ in range(3)]
+    + [dict(title="Reading", date=date(2026, 1, 20), category="reading", confidence=0.9, is_ambiguous=True)]
+    + [dict(title=f"Lab {i}", date=date(2026, 3, i + 1), category="assignment", confidence=0.8) for i in range(5)]
+)
+
+
+@pytest.fixture()
+def job(make_job):
+    return make_job(EVENTS)
+
+
+def _list(client, job, **params):
+    response = client.get(f"/api/job/{job.id}/events", params=params)
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def _walk(client, job, limit, **params):
+    events, cursor, pages = [], None, 0
+    while True:
+        body = _list(client, job, limit=limit, **params, **({"cursor": cursor} if cursor else {}))
+        events += body["events"]
+        pages += 1
+        cursor = body["next_cursor"]
+        if cursor is None:
+            return events, pages
+
+
+@pytest.mark.parametrize("limit", [1, 2, 3, 13, 100])
+def test_pages_match_unpaged_list(client, job, limit):
+    full = _list(client, job)
+    assert full["next_cursor"] is None
+    keys = [(e["date"], e["title"], e["id"]) for e in full["events"]]
+    assert keys == sorted(keys)
+
+    paged, pages = _walk(client, job, limit)
+    assert paged == full["events"]
+    assert pages == max(1, -(-len(EVENTS) // limit))
+
+
+def test_malformed_cursor_and_unknown_field(client, job):
+    for cursor in ("not-base64!", "bm90IGpzb24", "WzEsMl0"):  # garbage, "not json", "[1,2]"
+        assert client.get(f"/api/job/{job.id}/events", params={"cursor": cursor}).status_code == 400
+    response = client.get(f"/api/job/{job.id}/events", params={"fields": "title,secret"})
+    assert response.status_code == 400
+    assert "secret" in response.json()["detail"]
+
+
+def test_fields_projection(client, job):
+    body = _list(client, job, fields="title,date")
+    assert len(body["events"]) == len(EVENTS)
+    assert all(set(e) == {"id", "title", "date"} for e in body["events"])
+    assert set(_list(client, job, fields="id")["events"][0]) == {"id"}
+
+    # Projection works with paging (the cursor uses columns that are not returned)
+    paged, _ = _walk(client, job, 4, fields="category")
+    assert all(set(e) == {"id", "category"} for e in paged)
+    assert [e["id"] for e in paged] == [e["id"] for e in _list(client, job)["events"]]
+
+
+def test_filters_keep_whole_job_counts(client, job):
+    full = _list(client, job)
+
+    assignments = _list(client, job, category="assignment")
+    assert {e["category"] for e in assignments["events"]} == {"assignment"}
+    assert len(assignments["events"]) == 8
+    assert assignments["category_counts"] == full["category_counts"] == {"exam": 4, "assignment": 8, "reading": 1}
+
+    attention = _list(client, job, needs_attention="true")
+    assert {e["title"] for e in attention["events"]} == {"Homework", "Reading"}
+    assert len(attention["events"]) == 4
+    assert attention["needs_attention"] == full["needs_attention"] == {
+        "ambiguous_count": 1, "low_confidence_count": 3, "total": 4,
+    }
+
+    paged, _ = _walk(client, job, 3, category="assignment", needs_attention="true")
+    assert [e["title"] for e in paged] == ["Homework"] * 3
+
+
+def test_unknown_job(client):
+    assert client.get(f"/api/job/{uuid.uuid4()}/events").status_code == 404
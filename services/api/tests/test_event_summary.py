@@ -0,0 +1,70 @@
+"""Tests for the single-query job summary behind GET /job/{id} and /job/{id}/events."""
+
+import asyncio
+import uuid
+
+from sqlalchemy import func, select
+
+from app.database import async_session
+from app.event_summary import load_job_summary
+from app.models import Event
+
+EVENTS = [
+    dict(category="exam", confidence=0.9),
+    dict(category="exam", confidence=0.4),  # low confidence
+    dict(category="exam", confidence=0.3, is_ambiguous=True),  # both: counted once as needing attention
+    dict(category="assignment", confidence=0.95, is_ambiguous=True),
+    dict(category="assignment", confidence=0.6),  # at the threshold: not low
+    dict(category="other", confidence=0.59),
+]
+
+
+def _summary(job_id):
+    async def load():
+        async with async_session() as db:
+            return await load_job_summary(db, job_id)
+
+    return asyncio.run(load())
+
+
+def test_counts_match_per_count_queries(make_job, db):
+    job = make_job(EVENTS)
+    loaded, summary = _summary(job.id)
+    assert loaded.id == job.id
+
+    # The per-COUNT queries GET /job/{id} used to run
+    def count(*where):
+        return db.scalar(select(func.count()).select_from(Event).where(Event.job_id == job.id, *where))
+
+    assert summary.total == count() == 6
+    assert summary.ambiguous == count(Event.is_ambiguous.is_(True)) == 2
+    assert summary.low_confidence == count(Event.confidence < 0.6) == 3
+    assert summary.needs_attention == count((Event.is_ambiguous.is_(True)) | (Event.confidence < 0.6)) == 4
+    assert summary.by_category == {"exam": 3, "assignment": 2, "other": 1}
+
+
+def test_job_without_events_has_zero_counts(make_job):
+    job = make_job([], status="processing")
+    loaded, summary = _summary(job.id)
+    assert loaded.status == "processing"
+    assert (summary.total, summary.ambiguous, summary.low_confidence, summary.needs_attention) == (0, 0, 0, 0)
+    assert summary.by_category == {}
+
+
+def test_missing_job_is_none():
+    assert _summary(uuid.uuid4()) is None
+
+
+def test_endpoints_report_the_summary(client, make_job):
+    job = make_job(EVENTS)
+    body = client.get(f"/api/job/{job.id}").json()
+    assert (body["event_count"], body["needs_attention_count"]) == (6, 4)
+    assert body["category_counts"] == {"exam": 3, "assignment": 2, "other": 1}
+
+    listing = client.get(f"/api/job/{job.id}/events").json()
+    assert listing["needs_attention"] == {"ambiguous_count": 2, "low_confidence_count": 3, "total": 4}
+
+    empty = make_job([], status="queued")
+    body = client.get(f"/api/job/{empty.id}").json()
+    assert (body["event_count"], body["needs_attention_count"], body["category_counts"]) == (0, 0, {})
+    assert client.get(f"/api/job/{uuid.uuid4()}").status_code == 404
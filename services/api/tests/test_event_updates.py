@@ -0,0 +1,88 @@
+"""Tests for PUT /api/job/{id}/events: payload merging and the set-based statements."""
+
+import uuid
+from datetime import datetime
+
+from app.models import Event
+from app.routes import events as events_route
+from app.routes.events import _merge_updates
+from app.schemas import EventUpdate
+
+
+def _ids(n):
+    return [uuid.uuid4() for _ in range(n)]
+
+
+class TestMergeUpdates:
+    def test_later_patches_override_earlier_ones(self):
+        (a,) = _ids(1)
+        deletes, patches = _merge_updates([
+            EventUpdate(id=a, title="First", category="exam"),
+            EventUpdate(id=a, title="Second"),
+            EventUpdate(id=a, description="Notes"),
+        ])
+        assert deletes == []
+        assert patches == {a: {"title": "Second", "category": "exam", "description": "Notes"}}
+
+    def test_delete_wins_over_patches_before_and_after(self):
+        a, b = _ids(2)
+        deletes, patches = _merge_updates([
+            EventUpdate(id=a, title="Edited"),
+            EventUpdate(id=a, delete=True),
+            EventUpdate(id=b, delete=True),
+            EventUpdate(id=b, title="Too late"),
+        ])
+        assert deletes == [a, b]
+        assert patches == {}
+
+    def test_empty_patch_is_kept_and_order_preserved(self):
+        a, b, c = _ids(3)
+        deletes, patches = _merge_updates([
+            EventUpdate(id=c, title="C"), EventUpdate(id=a), EventUpdate(id=b, delete=True),
+        ])
+        assert deletes == [b]
+        assert list(patches) == [c, a]
+        assert patches[a] == {}
+
+
+def test_bulk_update_endpoint(client, make_job, db, monkeypatch):
+    # Small IN chunks so the chunked SELECT/DELETE paths run more than once
+    monkeypatch.setattr(events_route, "_ID_CHUNK", 2)
+    stale = datetime(2020, 1, 1)
+    job = make_job([dict(title=f"E{i}", category="other", updated_at=stale) for i in range(6)])
+    other_job = make_job([dict(title="Not yours")])
+    ids = [e.id for e in db.query(Event).filter(Event.job_id == job.id).order_by(Event.title)]
+    foreign = db.query(Event.id).filter(Event.job_id == other_job.id).scalar()
+    unknown = uuid.uuid4()
+
+    response = client.put(f"/api/job/{job.id}/events", json={"updates": [
+        {"id": str(ids[0]), "title": "Midterm", "category": "exam"},
+        {"id": str(ids[1]), "description": "Bring a calculator"},
+        {"id": str(ids[1]), "title": "Quiz"},
+        {"id": str(ids[2]), "delete": True},
+        {"id": str(ids[3]), "title": "Dropped"},
+        {"id": str(ids[3]), "delete": True},
+        {"id": str(foreign), "title": "Hijack"},
+        {"id": str(unknown), "delete": True},
+    ]})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["updated"], body["deleted"]) == (2, 2)
+    assert sorted(body["not_found"]) == sorted([str(unknown), str(foreign)])
+
+    db.expire_all()
+    rows = {e.id: e for e in db.query(Event).filter(Event.job_id == job.id)}
+    assert set(rows) == {ids[0], ids[1], ids[4], ids[5]}
+    assert (rows[ids[0]].title, rows[ids[0]].category) == ("Midterm", "exam")
+    assert (rows[ids[1]].title, rows[ids[1]].description) == ("Quiz", "Bring a calculator")
+    assert rows[ids[0]].updated_at.replace(tzinfo=None) > stale
+    assert rows[ids[1]].updated_at.replace(tzinfo=None) > stale
+    assert rows[ids[4]].updated_at.replace(tzinfo=None) == stale
+    # Events of another job are never touched
+    assert db.query(Event).filter(Event.job_id == other_job.id).one().title == "Not yours"
+
+
+def test_bulk_update_unknown_job(client):
+    response = client.put(f"/api/job/{uuid.uuid4()}/events", json={"updates": []})
+    assert response.status_code == 404
@@ -0,0 +1,117 @@
+"""Inline extraction: bounded pending depth, 503 when saturated, background mode and pool recovery."""
+
+import asyncio
+import os
+import threading
+import time
+import uuid
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from app.config import settings
+from app.extraction_pool import ExtractionPool, PoolSaturated, extraction_pool
+from app.models import Job
+from app.routes import upload
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "packages", "shared", "fixtures", "synthetic_syllabus.pdf",
+)
+
+
+@pytest.fixture(scope="module")
+def pdf():
+    with open(FIXTURE, "rb") as f:
+        return f.read()
+
+
+def _upload_dirs():
+    root = settings.UPLOAD_DIR
+    return set(os.listdir(root)) if os.path.isdir(root) else set()
+
+
+def test_pending_depth_is_bounded():
+    pool = ExtractionPool(workers=0, max_pending=2)
+    pool.acquire()
+    pool.acquire()
+    assert pool.saturated
+    with pytest.raises(PoolSaturated):
+        pool.acquire()
+    pool.release()
+    pool.acquire()
+    assert pool.pending == 2
+
+
+def test_saturated_pool_refuses_upload_before_reading(client, monkeypatch, pdf):
+    monkeypatch.setattr(extraction_pool, "max_pending", 0)
+    before = _upload_dirs()
+    response = client.post("/api/upload", files={"file": ("s.pdf", pdf, "application/pdf")})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(settings.INLINE_RETRY_AFTER_SECONDS)
+    assert _upload_dirs() == before
+
+
+def test_saturated_at_dispatch_removes_committed_jobs(client, db, monkeypatch, pdf):
+    # The pool fills up between the up-front check and the dispatch
+    def saturated():
+        raise PoolSaturated()
+
+    monkeypatch.setattr(extraction_pool, "acquire", saturated)
+    name = f"{uuid.uuid4().hex}.pdf"
+    before = _upload_dirs()
+    response = client.post("/api/upload/batch", files=[
+        ("files", (name, pdf, "application/pdf")),
+        ("files", ("other.pdf", pdf, "application/pdf")),
+    ])
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == str(settings.INLINE_RETRY_AFTER_SECONDS)
+    assert db.query(Job).filter(Job.original_filename == name).count() == 0
+    assert _upload_dirs() == before
+
+
+def test_background_upload_returns_before_extraction(client, db, monkeypatch, pdf):
+    started = threading.Event()
+    proceed = threading.Event()
+    real = upload.run_extraction
+
+    def blocking(*args):
+        started.set()
+        assert proceed.wait(10)
+        return real(*args)
+
+    monkeypatch.setattr(upload, "run_extraction", blocking)
+    response = client.post(
+        "/api/upload", files={"file": ("s.pdf", pdf, "application/pdf")}, data={"background": "true"},
+    )
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert body["status"] == "queued"
+    assert started.wait(10)
+    # The slot is held while the job runs after the response
+    assert extraction_pool.pending == 1
+
+    proceed.set()
+    job_id = uuid.UUID(body["job_id"])
+    deadline = time.monotonic() + 10
+    while extraction_pool.pending and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert extraction_pool.pending == 0
+    db.expire_all()
+    job = db.get(Job, job_id)
+    assert job.status in ("ready", "needs_review")
+
+
+def test_broken_pool_is_replaced():
+    pool = ExtractionPool(workers=1, max_pending=2)
+    pool.start()
+
+    async def scenario():
+        try:
+            # A child dying (e.g. a crash in a PDF library) breaks the executor
+            with pytest.raises(BrokenProcessPool):
+                await pool.run(os._exit, 1)
+            return await pool.run(abs, -3)
+        finally:
+            await pool.stop()
+
+    assert asyncio.run(scenario()) == 3
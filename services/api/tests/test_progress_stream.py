@@ -0,0 +1,143 @@
+"""Tests for GET /api/job/{job_id}/progress: the pub/sub relay and its polling fallback."""
+
+import json
+import threading
+
+import pytest
+
+from app.broker import broker
+from app.config import settings
+from app.models import Job
+from app.routes import jobs
+from shared.progress import channel, last_event_key, make_event
+
+
+@pytest.fixture(autouse=True)
+def bounded_streams(monkeypatch):
+    # The test client returns once the whole stream has been produced; never wait the default 15 minutes
+    monkeypatch.setattr(settings, "PROGRESS_STREAM_MAX_SECONDS", 5)
+
+
+def _read(client, job_id):
+    """The stream's events and keepalive count, once it has ended."""
+    events, keepalives = [], 0
+    with client.stream("GET", f"/api/job/{job_id}/progress") as response:
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        for line in response.iter_lines():
+            if line.startswith("data: "):
+                events.append(json.loads(line[len("data: "):]))
+            elif line == ": keepalive":
+                keepalives += 1
+    return events, keepalives
+
+
+class FakePubSub:
+    def __init__(self, redis):
+        self.redis = redis
+
+    async def subscribe(self, name):
+        self.redis.calls.append(("subscribe", name))
+
+    async def get_message(self, ignore_subscribe_messages=False, timeout=None):
+        self.redis.calls.append(("get_message",))
+        if not self.redis.messages:
+            raise AssertionError("read past the end of the stream")
+        message = self.redis.messages.pop(0)
+        return None if message is None else {"type": "message", "data": json.dumps(message).encode()}
+
+    async def aclose(self):
+        self.redis.calls.append(("aclose",))
+
+
+class FakeRedis:
+    """Last stored event plus the messages (None = no message before the heartbeat) to deliver."""
+
+    def __init__(self, last, messages):
+        self.last = last
+        self.messages = list(messages)
+        self.calls = []
+
+    def pubsub(self):
+        return FakePubSub(self)
+
+    async def get(self, key):
+        self.calls.append(("get", key))
+        return None if self.last is None else json.dumps(self.last).encode()
+
+
+@pytest.fixture()
+def fake_redis(monkeypatch):
+    def install(last, messages):
+        fake = FakeRedis(last, messages)
+        monkeypatch.setattr(broker, "_celery", object())
+        monkeypatch.setattr(broker, "healthy", True)
+        monkeypatch.setattr(broker, "redis", lambda: fake)
+        return fake
+
+    return install
+
+
+def test_terminal_job_sends_one_event(client, make_job):
+    job = make_job(status="ready")
+    events, _ = _read(client, job.id)
+    assert [(e["stage"], e["status"]) for e in events] == [("done", "ready")]
+
+
+def test_polling_fallback_until_terminal_status(client, db, make_job, monkeypatch):
+    monkeypatch.setattr(jobs, "_POLL_SECONDS", 0.01)
+    assert not broker.available
+    job = make_job(status="processing")
+
+    def fail():
+        row = db.get(Job, job.id)
+        row.status = "failed"
+        row.error_message = "No text could be extracted"
+        db.commit()
+
+    # The job fails while the stream is polling it
+    timer = threading.Timer(0.2, fail)
+    timer.start()
+    try:
+        events, _ = _read(client, job.id)
+    finally:
+        timer.join()
+    assert [(e["stage"], e["status"]) for e in events] == [
+        ("processing", "processing"),
+        ("failed", "failed"),
+    ]
+    assert events[-1]["error"] == "No text could be extracted"
+
+
+def test_stream_ends_after_max_seconds(client, make_job, monkeypatch):
+    monkeypatch.setattr(jobs, "_POLL_SECONDS", 0.01)
+    monkeypatch.setattr(settings, "PROGRESS_STREAM_MAX_SECONDS", 0.1)
+    job = make_job(status="queued")
+    events, _ = _read(client, job.id)
+    assert [e["stage"] for e in events] == ["queued"]
+
+
+def test_subscribes_then_replays_last_event(client, make_job, fake_redis, monkeypatch):
+    monkeypatch.setattr(jobs, "_HEARTBEAT_SECONDS", 0.01)
+    job = make_job(status="processing")
+    job_id = str(job.id)
+    fake = fake_redis(
+        make_event(job_id, "pages", pages=3),
+        [None, make_event(job_id, "assembled", events=5), make_event(job_id, "done", "needs_review", events=5)],
+    )
+
+    events, keepalives = _read(client, job.id)
+    assert [e["stage"] for e in events] == ["processing", "pages", "assembled", "done"]
+    assert keepalives == 1
+    # The last event is read only after subscribing, so nothing in between is lost
+    assert fake.calls[:2] == [("subscribe", channel(job_id)), ("get", last_event_key(job_id))]
+    assert fake.calls[-1] == ("aclose",)
+
+
+def test_replayed_terminal_event_ends_stream(client, make_job, fake_redis):
+    job = make_job(status="processing")
+    job_id = str(job.id)
+    fake = fake_redis(make_event(job_id, "done", "ready", events=2), [])
+    events, _ = _read(client, job.id)
+    assert [e["stage"] for e in events] == ["processing", "done"]
+    assert ("get_message",) not in fake.calls
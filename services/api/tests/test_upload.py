@@ -0,0 +1,92 @@
+"""Tests for POST /api/upload: streamed to disk with hashing, size limits and content checks."""
+
+import hashlib
+import io
+import os
+import uuid
+
+import pytest
+from fastapi import HTTPException
+
+from app.config import settings
+from app.models import Job
+from app.routes import upload
+from shared.extraction import cost_estimator
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "packages", "shared", "fixtures", "synthetic_syllabus.pdf",
+)
+
+
+@pytest.fixture(scope="module")
+def pdf():
+    with open(FIXTURE, "rb") as f:
+        return f.read()
+
+
+def _upload_dirs():
+    root = settings.UPLOAD_DIR
+    return set(os.listdir(root)) if os.path.isdir(root) else set()
+
+
+def _post(client, name, content, content_type="application/pdf"):
+    return client.post("/api/upload", files={"file": (name, content, content_type)})
+
+
+def test_upload_stores_file_and_its_hash(client, db, pdf):
+    response = _post(client, "syllabus.pdf", pdf)
+    assert response.status_code == 200, response.text
+    job = db.get(Job, uuid.UUID(response.json()["job_id"]))
+    assert job.content_sha256 == hashlib.sha256(pdf).hexdigest()
+    with open(job.upload_path, "rb") as f:
+        assert f.read() == pdf
+    assert job.estimated_pages and job.lane
+
+
+def test_oversized_upload_rejected(client, monkeypatch):
+    monkeypatch.setattr(settings, "MAX_UPLOAD_MB", 1)
+    before = _upload_dirs()
+    response = _post(client, "big.pdf", b"%PDF-1.4\n" + b"\0" * (1024 * 1024))
+    assert response.status_code == 413
+    assert "1 MB" in response.json()["detail"]
+    assert _upload_dirs() == before
+
+
+def test_streamed_size_limit_removes_partial_upload(monkeypatch):
+    # A body whose size isn't known up front is cut off while streaming
+    monkeypatch.setattr(settings, "MAX_UPLOAD_MB", 1)
+    monkeypatch.setattr(upload, "UPLOAD_CHUNK_BYTES", 64 * 1024)
+    before = _upload_dirs()
+    with pytest.raises(HTTPException) as exc:
+        upload._save_upload(io.BytesIO(b"%PDF-1.4\n" + b"\0" * (2 * 1024 * 1024)), "big.pdf")
+    assert exc.value.status_code == 413
+    assert _upload_dirs() == before
+
+
+def test_failure_after_streaming_removes_upload(monkeypatch, pdf):
+    def broken(filename, path):
+        raise RuntimeError("estimator crashed")
+
+    monkeypatch.setattr(cost_estimator, "estimate_file_cost", broken)
+    before = _upload_dirs()
+    with pytest.raises(RuntimeError):
+        upload._save_upload(io.BytesIO(pdf), "syllabus.pdf")
+    assert _upload_dirs() == before
+
+
+@pytest.mark.parametrize("name, content", [
+    ("fake.pdf", b"this is not a PDF"),
+    ("photo.png", b"\xff\xd8\xff\xe0 a JPEG named .png"),
+    ("empty.pdf", b""),
+])
+def test_content_must_match_extension(client, db, name, content):
+    before = _upload_dirs()
+    response = _post(client, name, content, "application/octet-stream")
+    assert response.status_code == 400
+    assert _upload_dirs() == before
+    assert db.query(Job).filter(Job.original_filename == name).count() == 0
+
+
+def test_pdf_header_may_follow_leading_bytes(client, pdf):
+    response = _post(client, "prefixed.pdf", b"\r\n" * 100 + pdf)
+    assert response.status_code == 200, response.text
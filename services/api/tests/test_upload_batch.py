@@ -0,0 +1,101 @@
+"""Tests for POST /api/upload/batch: archives are planned from their directories and streamed to disk."""
+
+import io
+import os
+import uuid
+import zipfile
+
+import pytest
+
+from app.config import settings
+from app.models import Job
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "packages", "shared", "fixtures", "synthetic_syllabus.pdf",
+)
+
+
+@pytest.fixture(scope="module")
+def pdf():
+    with open(FIXTURE, "rb") as f:
+        return f.read()
+
+
+def _zip(members):
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, content in members.items():
+            archive.writestr(name, content)
+    return buf.getvalue()
+
+
+def _upload_dirs():
+    root = settings.UPLOAD_DIR
+    return set(os.listdir(root)) if os.path.isdir(root) else set()
+
+
+def _post(client, files):
+    return client.post("/api/upload/batch", files=[("files", f) for f in files])
+
+
+def test_batch_saves_files_and_skips_rejects(client, db, pdf):
+    archive = _zip({
+        "week1/a.pdf": pdf,
+        "b.pdf": pdf,
+        "notes.txt": b"not a syllabus",
+        "fake.pdf": b"this is not a PDF",
+        "__MACOSX/._a.pdf": b"",
+    })
+    response = _post(client, [("bundle.zip", archive, "application/zip"), ("c.pdf", pdf, "application/pdf")])
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert len(body["job_ids"]) == 3
+    assert sorted(body["skipped"]) == ["bundle.zip/fake.pdf", "bundle.zip/notes.txt"]
+
+    jobs = db.query(Job).filter(Job.batch_id == uuid.UUID(body["batch_id"])).all()
+    assert sorted(job.original_filename for job in jobs) == ["a.pdf", "b.pdf", "c.pdf"]
+    for job in jobs:
+        assert os.path.getsize(job.upload_path) == len(pdf)
+        assert job.content_sha256 and job.estimated_pages
+
+
+def test_too_many_files_rejected_before_reading(client, monkeypatch, pdf):
+    monkeypatch.setattr(settings, "BATCH_MAX_FILES", 2)
+    archive = _zip({f"{i}.pdf": pdf for i in range(3)})
+
+    def no_reads(*args, **kwargs):
+        raise AssertionError("archive members must not be read")
+
+    monkeypatch.setattr(zipfile.ZipFile, "open", no_reads)
+    before = _upload_dirs()
+    response = _post(client, [("bundle.zip", archive, "application/zip")])
+    assert response.status_code == 400
+    assert "limit is 2" in response.json()["detail"]
+    assert _upload_dirs() == before
+
+
+def test_total_uncompressed_size_capped(client, monkeypatch):
+    monkeypatch.setattr(settings, "BATCH_MAX_TOTAL_MB", 1)
+    # ~1.5 MB of highly compressible "PDFs": small on the wire, over the cap once inflated
+    bomb = _zip({f"{i}.pdf": b"%PDF-1.4\n" + b"\0" * 768 * 1024 for i in range(2)})
+    assert len(bomb) < 64 * 1024
+    before = _upload_dirs()
+    response = _post(client, [("bomb.zip", bomb, "application/zip")])
+    assert response.status_code == 413
+    assert _upload_dirs() == before
+
+
+def test_oversized_and_corrupt_members_skipped(client, monkeypatch, pdf):
+    monkeypatch.setattr(settings, "MAX_UPLOAD_MB", 1)
+    archive = bytearray(_zip({"big.pdf": b"%PDF-1.4\n" + b"\0" * (2 * 1024 * 1024), "ok.pdf": pdf}))
+    corrupt = _zip({"broken.pdf": pdf * 2})
+    # Flip bytes inside the compressed data of the only member
+    corrupt = corrupt[:200] + bytes(b ^ 0xFF for b in corrupt[200:260]) + corrupt[260:]
+    response = _post(client, [
+        ("bundle.zip", bytes(archive), "application/zip"),
+        ("broken.zip", corrupt, "application/zip"),
+    ])
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert len(body["job_ids"]) == 1
+    assert sorted(body["skipped"]) == ["broken.zip/broken.pdf", "bundle.zip/big.pdf"]
@@ -0,0 +1,73 @@
+"""Uploads are committed before their tasks are published, so a worker always finds the jobs."""
+
+import os
+import uuid
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.broker import broker
+from app.config import settings
+from app.models import Batch, Job
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "packages", "shared", "fixtures", "synthetic_syllabus.pdf",
+)
+
+
+@pytest.fixture(scope="module")
+def pdf():
+    with open(FIXTURE, "rb") as f:
+        return f.read()
+
+
+@pytest.fixture()
+def committed():
+    """Look rows up on a separate connection, which only sees committed data (like a worker)."""
+    engine = create_engine(settings.DATABASE_URL_SYNC)
+    Session = sessionmaker(bind=engine)
+
+    def lookup(model, ids):
+        with Session() as session:
+            return session.query(model).filter(model.id.in_(ids)).all()
+
+    yield lookup
+    engine.dispose()
+
+
+def test_single_upload_committed_before_send_task(client, monkeypatch, committed, pdf):
+    sent = []
+
+    async def send_task(name, args=None, kwargs=None, **options):
+        jobs = committed(Job, [uuid.UUID(args[0])])
+        sent.append((name, [job.status for job in jobs]))
+        return True
+
+    monkeypatch.setattr(broker, "send_task", send_task)
+    response = client.post("/api/upload", files={"file": ("s.pdf", pdf, "application/pdf")})
+    assert response.status_code == 200, response.text
+    assert sent == [("app.tasks.process_job", ["queued"])]
+    assert response.json()["status"] == "queued"
+
+
+def test_batch_committed_before_send_group(client, monkeypatch, committed, pdf):
+    seen = {}
+
+    async def send_group(name, args_list, **options):
+        job_ids = [uuid.UUID(job_id) for args in args_list for job_id in args[0]]
+        seen["jobs"] = committed(Job, job_ids)
+        seen["batches"] = {job.batch_id for job in seen["jobs"]}
+        seen["batch_rows"] = committed(Batch, list(seen["batches"]))
+        return True
+
+    monkeypatch.setattr(broker, "send_group", send_group)
+    response = client.post("/api/upload/batch", files=[
+        ("files", ("a.pdf", pdf, "application/pdf")),
+        ("files", ("b.pdf", pdf, "application/pdf")),
+    ])
+    assert response.status_code == 200, response.text
+    body = response.json()
+    assert sorted(str(job.id) for job in seen["jobs"]) == sorted(body["job_ids"])
+    assert seen["batches"] == {uuid.UUID(body["batch_id"])}
+    assert len(seen["batch_rows"]) == 1
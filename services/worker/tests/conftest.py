@@ -0,0 +1,22 @@
+"""Worker test setup: a throwaway SQLite database and eager (in-process) Celery."""
+
+import os
+import sys
+import tempfile
+
+_tmp = tempfile.mkdtemp(prefix="syllascribe-worker-tests-")
+os.environ.setdefault("DATABASE_URL_SYNC", f"sqlite:///{_tmp}/worker.db")
+os.environ.setdefault("REDIS_URL", "memory://")
+os.environ.setdefault("BATCH_RETRY_SECONDS", "0")
+
+_here = os.path.dirname(os.path.abspath(__file__))
+for path in (os.path.join(_here, ".."), os.path.join(_here, "..", "..", "..", "packages", "shared")):
+    path = os.path.abspath(path)
+    if path not in sys.path:
+        sys.path.insert(0, path)
+
+from worker_app.celery_app import celery_app  # noqa: E402
+
+celery_app.conf.task_always_eager = True
+celery_app.conf.task_eager_propagates = False
+celery_app.conf.result_backend = "cache+memory://"
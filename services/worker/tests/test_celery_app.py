@@ -0,0 +1,35 @@
+"""Tests for the per-process worker hooks: engine replacement, warm-up, first-task timing."""
+
+from shared.metrics import FIRST_TASK_DURATION, WARMUP_DURATION
+from worker_app import celery_app as worker_celery, tasks
+
+
+def test_process_init_replaces_engine_and_warms_up(monkeypatch):
+    monkeypatch.delenv("WORKER_WARMUP", raising=False)
+    inherited = tasks._engine
+    before = WARMUP_DURATION.count(step="find")
+
+    worker_celery._init_worker_process()
+
+    assert tasks._engine is not inherited
+    assert tasks._SessionLocal.kw["bind"] is tasks._engine
+    assert worker_celery._process_state["warm"] is True
+    assert WARMUP_DURATION.count(step="find") == before + 1
+
+
+def test_warm_up_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("WORKER_WARMUP", "false")
+    worker_celery._init_worker_process()
+    assert worker_celery._process_state["warm"] is False
+
+
+def test_first_task_is_recorded_once(monkeypatch):
+    monkeypatch.setenv("WORKER_WARMUP", "false")
+    worker_celery._init_worker_process()
+    before = FIRST_TASK_DURATION.count(task="process_job", warm="false")
+
+    for _ in range(2):
+        worker_celery._time_first_task()
+        worker_celery._record_first_task(task=tasks.process_job)
+
+    assert FIRST_TASK_DURATION.count(task="process_job", warm="false") == before + 1
@@ -0,0 +1,247 @@
+"""Tests for the stage task chain: checkpointed stages resume on retry."""
+
+import os
+import shutil
+import uuid
+
+import pytest
+from sqlalchemy import event
+
+from shared import progress
+from shared.extraction import text_extractor
+from worker_app import tasks
+from worker_app.stage_store import find_stage
+
+from app.database import Base
+from app.models import Event, Job
+
+FIXTURE = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "packages", "shared", "fixtures", "synthetic_syllabus.pdf",
+)
+
+
+@pytest.fixture()
+def job(tmp_path):
+    Base.metadata.create_all(tasks._engine)
+    job_dir = tmp_path / "upload"
+    job_dir.mkdir()
+    file_path = str(job_dir / "syllabus.pdf")
+    shutil.copy(FIXTURE, file_path)
+
+    session = tasks._SessionLocal()
+    job = Job(id=uuid.uuid4(), status="queued", original_filename="syllabus.pdf", upload_path=file_path)
+    session.add(job)
+    session.commit()
+    yield session, job
+    session.close()
+
+
+@pytest.fixture()
+def count_extractions(monkeypatch):
+    calls = []
+    real = text_extractor.extract_text
+
+    def counting(path):
+        calls.append(path)
+        return real(path)
+
+    monkeypatch.setattr(text_extractor, "extract_text", counting)
+    return calls
+
+
+def test_persist_retry_does_not_rerun_extraction(job, count_extractions, monkeypatch):
+    session, job = job
+    real_insert = tasks._insert_events
+    attempts = []
+
+    def flaky_insert(*args):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("database went away")
+        return real_insert(*args)
+
+    monkeypatch.setattr(tasks, "_insert_events", flaky_insert)
+
+    tasks.process_job.apply(args=[str(job.id)])
+
+    session.expire_all()
+    assert len(attempts) == 2
+    assert len(count_extractions) == 1
+    assert session.get(Job, job.id).status in ("ready", "needs_review")
+    assert session.query(Event).filter(Event.job_id == job.id).count() > 0
+    # Checkpoints are removed once the events are committed
+    assert find_stage(os.path.dirname(job.upload_path), "pages") is None
+    assert find_stage(os.path.dirname(job.upload_path), "assembled") is None
+
+
+def test_rerun_resumes_from_checkpoints(job, count_extractions):
+    session, job = job
+    handoff = tasks.extract_stage.apply(args=[str(job.id)]).get()
+    assert find_stage(os.path.dirname(job.upload_path), "candidates")
+
+    # A redelivered extract task finds the assembled output and skips the work
+    again = tasks.extract_stage.apply(args=[str(job.id)]).get()
+    assert again == handoff
+    assert len(count_extractions) == 1
+
+    first = tasks.persist_stage.apply(args=[tasks.llm_stage.apply(args=[handoff]).get()]).get()
+    session.expire_all()
+    assert session.query(Event).filter(Event.job_id == job.id).count() == first["events"]
+
+
+def test_events_persisted_in_one_bulk_insert_with_status(job, monkeypatch):
+    session, job = job
+    drafts = []
+    real_insert = tasks._insert_events
+
+    def capture(session_, job_id, event_drafts):
+        drafts.extend(event_drafts)
+        return real_insert(session_, job_id, event_drafts)
+
+    monkeypatch.setattr(tasks, "_insert_events", capture)
+
+    # ORM-level executes of INSERT INTO events, and the SQL / commits on the wire
+    inserts = []
+    log = []
+
+    def on_orm_execute(state):
+        if state.is_insert and state.statement.table.name == "events":
+            inserts.append(state.parameters)
+
+    def on_cursor(conn, cursor, statement, parameters, context, executemany):
+        log.append(statement.split()[0:3])
+
+    engine = tasks._engine
+    event.listen(tasks._SessionLocal, "do_orm_execute", on_orm_execute)
+    event.listen(engine, "before_cursor_execute", on_cursor)
+    def on_commit(conn):
+        log.append("COMMIT")
+
+    event.listen(engine, "commit", on_commit)
+    try:
+        tasks.process_job.apply(args=[str(job.id)])
+    finally:
+        event.remove(tasks._SessionLocal, "do_orm_execute", on_orm_execute)
+        event.remove(engine, "before_cursor_execute", on_cursor)
+        event.remove(engine, "commit", on_commit)
+
+    assert len(drafts) > 1
+    assert len(inserts) == 1 and len(inserts[0]) == len(drafts)
+
+    # The insert and the final status update commit together
+    insert_at = next(i for i, entry in enumerate(log) if entry[:3] == ["INSERT", "INTO", "events"])
+    commit_at = log.index("COMMIT", insert_at)
+    assert ["UPDATE", "jobs", "SET"] in log[insert_at:commit_at]
+
+    session.expire_all()
+    assert session.get(Job, job.id).status in ("ready", "needs_review")
+    rows = {e.id: e for e in session.query(Event).filter(Event.job_id == job.id)}
+    assert len(rows) == len(drafts)
+    for draft in drafts:
+        row = rows[draft.id]
+        for name in (
+            "title", "description", "date", "all_day", "category", "confidence",
+            "source_page", "source_excerpt", "source_kind", "is_ambiguous",
+        ):
+            assert getattr(row, name) == getattr(draft, name), name
+
+
+def test_fast_lane_routes_extraction_and_records_cost(job, monkeypatch):
+    session, job = job
+    job.lane = "fast"
+    job.estimated_seconds = 0.3
+    session.commit()
+
+    queues = []
+    real_apply = tasks.extract_stage.apply
+
+    def capture(args=None, kwargs=None, **options):
+        queues.append(options.get("queue"))
+        return real_apply(args=args, kwargs=kwargs, **options)
+
+    monkeypatch.setattr(tasks.extract_stage, "apply", capture)
+    tasks.process_job.apply(args=[str(job.id)], kwargs={"lane": "fast"})
+
+    session.expire_all()
+    assert queues == ["extract_fast"]
+    assert session.get(Job, job.id).actual_seconds > 0
+
+
+def test_process_batch_runs_each_job_and_isolates_failures(job, tmp_path):
+    session, first = job
+    missing = Job(
+        id=uuid.uuid4(), status="queued", original_filename="gone.pdf",
+        upload_path=str(tmp_path / "gone" / "gone.pdf"),
+    )
+    session.add(missing)
+    session.commit()
+
+    result = tasks.process_batch.apply(args=[[str(missing.id), str(first.id)]]).get()
+
+    session.expire_all()
+    assert result["jobs"] == 2
+    assert result["statuses"]["failed"] == 1
+    assert session.get(Job, missing.id).status == "failed"
+    assert session.get(Job, first.id).status in ("ready", "needs_review")
+    assert session.query(Event).filter(Event.job_id == first.id).count() > 0
+
+
+def test_process_batch_retries_a_job_from_its_checkpoints(job, count_extractions, monkeypatch):
+    session, job = job
+    real_insert = tasks._insert_events
+    attempts = []
+
+    def flaky_insert(*args):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("database went away")
+        return real_insert(*args)
+
+    monkeypatch.setattr(tasks, "_insert_events", flaky_insert)
+    result = tasks.process_batch.apply(args=[[str(job.id)]]).get()
+
+    session.expire_all()
+    assert len(attempts) == 2
+    assert len(count_extractions) == 1
+    assert "failed" not in result["statuses"]
+    assert session.get(Job, job.id).status in ("ready", "needs_review")
+    assert session.query(Event).filter(Event.job_id == job.id).count() > 0
+
+
+def test_process_batch_clears_checkpoints_of_a_failed_job(job, count_extractions, monkeypatch):
+    session, job = job
+    attempts = []
+
+    def broken_insert(*args):
+        attempts.append(1)
+        raise RuntimeError("database went away")
+
+    monkeypatch.setattr(tasks, "_insert_events", broken_insert)
+    result = tasks.process_batch.apply(args=[[str(job.id)]]).get()
+
+    session.expire_all()
+    assert len(attempts) == tasks.persist_stage.max_retries + 1
+    assert len(count_extractions) == 1
+    assert result["statuses"] == {"failed": 1}
+    assert session.get(Job, job.id).status == "failed"
+    job_dir = os.path.dirname(job.upload_path)
+    assert [stage for stage in ("pages", "candidates", "assembled") if find_stage(job_dir, stage)] == []
+
+
+def test_progress_events_follow_the_pipeline(job, monkeypatch):
+    session, job = job
+    published = []
+
+    class Recorder(progress.ProgressPublisher):
+        def publish(self, job_id, stage, status="processing", **detail):
+            published.append((stage, status, detail))
+
+    monkeypatch.setattr(progress, "_publisher", Recorder())
+    tasks.process_job.apply(args=[str(job.id)])
+
+    stages = [stage for stage, _, _ in published]
+    assert stages == ["extracting", "pages", "candidates", "assembled", "done"]
+    pages, candidates = published[1][2], published[2][2]
+    assert pages["pages"] > 0 and candidates["candidates"] > 0
+    session.expire_all()
+    assert published[-1][1] == session.get(Job, job.id).status
@@ -1,9 +1,21 @@
 """Celery application configuration."""
 
+import logging
 import os
 import sys
+import tempfile
+import time
 
 from celery import Celery
+from celery.signals import (
+    task_postrun,
+    task_prerun,
+    worker_init,
+    worker_process_init,
+    worker_process_shutdown,
+)
+
+logger = logging.getLogger(__name__)
 
 REDIS_URL = os.environ.get("REDIS_URL", "redis://localhost:6379/0")
 if "host:6379" in REDIS_URL and "railway.internal" not in REDIS_URL:
@@ -14,6 +26,9 @@ if "host:6379" in REDIS_URL and "railway.internal" not in REDIS_URL:
     )
     sys.exit(1)
 
+# Small jobs (by upload-time cost estimate) extract here instead of "extract"
+FAST_EXTRACT_QUEUE = "extract_fast"
+
 celery_app = Celery(
     "syllascribe_worker",
     broker=REDIS_URL,
@@ -29,7 +44,100 @@ celery_app.conf.update(
     task_track_started=True,
     task_acks_late=True,
     worker_prefetch_multiplier=1,
+    # Pipeline stages run on separate queues so each pool can be sized for its work:
+    # CPU-bound OCR on prefork, network-bound LLM calls on a threads pool.
+    # process_job (the API entry point) stays on the default "celery" queue.
+    task_routes={
+        "app.tasks.extract_stage": {"queue": "extract"},
+        "app.tasks.llm_stage": {"queue": "llm"},
+        "app.tasks.persist_stage": {"queue": "persist"},
+    },
 )
 
 # Auto-discover tasks from worker_app so "app" is free for API's app.models
 celery_app.autodiscover_tasks(["worker_app"])
+
+
+@worker_init.connect
+def _start_metrics_server(**kwargs):
+    """Serve pipeline metrics from all pool processes on WORKER_METRICS_PORT, if set."""
+    port = os.environ.get("WORKER_METRICS_PORT")
+    if not port:
+        return
+    # Set before the pool forks so every child writes to the same directory
+    metrics_dir = os.environ.setdefault(
+        "METRICS_DIR", os.path.join(tempfile.gettempdir(), "syllascribe-metrics")
+    )
+    from shared.metrics import clear_textfiles, serve_textfiles
+
+    clear_textfiles(metrics_dir)
+    serve_textfiles(metrics_dir, int(port))
+
+
+# ── Per-process setup ────────────────────────────────────────────────────────
+
+# First-task timing for this process; "warm" records whether warm_up() ran
+_process_state: dict = {"warm": False, "first_task_start": None, "first_task_done": False}
+
+
+@worker_process_init.connect
+def _init_worker_process(**kwargs):
+    """Fresh DB engine per pool child, then preload extraction (unless WORKER_WARMUP=false)."""
+    from .tasks import init_process_engine
+
+    init_process_engine()
+    _process_state.update(warm=False, first_task_start=None, first_task_done=False)
+    if os.environ.get("WORKER_WARMUP", "true").lower() == "false":
+        return
+
+    from shared.extraction.warmup import warm_up
+    from shared.metrics import WARMUP_DURATION
+
+    try:
+        timings = warm_up()
+    except Exception:
+        logger.exception("Worker warm-up failed; the first task will load modules itself")
+        return
+    for step, seconds in timings.items():
+        WARMUP_DURATION.observe(seconds, step=step)
+    _process_state["warm"] = True
+    logger.info(
+        "Worker process %d warmed up in %.0f ms (%s)",
+        os.getpid(),
+        sum(timings.values()) * 1000,
+        ", ".join(f"{step} {seconds * 1000:.0f} ms" for step, seconds in timings.items()),
+    )
+
+
+@worker_process_shutdown.connect
+def _shutdown_worker_process(**kwargs):
+    from .tasks import dispose_engine
+
+    dispose_engine()
+
+
+@task_prerun.connect
+def _time_first_task(**kwargs):
+    if not _process_state["first_task_done"] and _process_state["first_task_start"] is None:
+        _process_state["first_task_start"] = time.perf_counter()
+
+
+@task_postrun.connect
+def _record_first_task(task=None, **kwargs):
+    """Report how long this process's first task took, labelled cold or warm."""
+    start = _process_state["first_task_start"]
+    if _process_state["first_task_done"] or start is None:
+        return
+    _process_state["first_task_done"] = True
+    elapsed = time.perf_counter() - start
+    name = task.name.rsplit(".", 1)[-1] if task is not None else "unknown"
+    warm = "true" if _process_state["warm"] else "false"
+
+    from shared.metrics import FIRST_TASK_DURATION
+
+    from .tasks import _export_metrics
+
+    FIRST_TASK_DURATION.observe(elapsed, task=name, warm=warm)
+    logger.info("First task in process %d: %s took %.0f ms (warm=%s)", os.getpid(), name, elapsed * 1000, warm)
+    # The task already exported its metrics; include this observation too
+    _export_metrics()
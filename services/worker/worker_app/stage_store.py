@@ -0,0 +1,49 @@
+"""Intermediate pipeline results handed between stage tasks by reference.
+
+Stage outputs are written as JSON files in the job's upload directory (a volume
+every worker pool already shares to read the upload), and only the file path
+travels through the broker. The files double as checkpoints: a retried stage
+finds the outputs of completed steps and resumes after them.
+"""
+
+from __future__ import annotations
+
+import glob
+import json
+import os
+import tempfile
+from typing import Optional
+
+_SUFFIX = ".stage.json"
+
+
+def save_stage(job_dir: str, stage: str, payload: dict) -> str:
+    """Atomically write a stage's output to <job_dir>/<stage>.stage.json; returns its path."""
+    os.makedirs(job_dir, exist_ok=True)
+    path = os.path.join(job_dir, f"{stage}{_SUFFIX}")
+    fd, tmp = tempfile.mkstemp(dir=job_dir, suffix=".tmp")
+    with os.fdopen(fd, "w", encoding="utf-8") as f:
+        json.dump(payload, f, separators=(",", ":"))
+    os.replace(tmp, path)
+    return path
+
+
+def find_stage(job_dir: str, stage: str) -> Optional[str]:
+    """Path of a stage output (checkpoint) saved for this job, or None."""
+    path = os.path.join(job_dir, f"{stage}{_SUFFIX}")
+    return path if os.path.isfile(path) else None
+
+
+def load_stage(ref: str) -> dict:
+    """Read a stage output by the path save_stage returned."""
+    with open(ref, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def clear_stages(job_dir: str) -> None:
+    """Remove every stage output of a job."""
+    for path in glob.glob(os.path.join(job_dir, f"*{_SUFFIX}")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
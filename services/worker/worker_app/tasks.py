@@ -1,16 +1,34 @@
-"""Celery task: process_job — the main extraction pipeline."""
+"""Celery tasks: process_job and the extraction pipeline stages.
+
+process_job starts a chain of stage tasks, each routed to its own queue so the
+pools can be sized independently (see celery_app.task_routes):
+
+    extract_stage (queue "extract"): extract text, find dates, assemble events
+    llm_stage     (queue "llm"):     optional LLM classification
+    persist_stage (queue "persist"): insert events, set final job status
+
+Stages hand off by reference: each writes its output with stage_store and
+passes only {"job_id", "ref"} to the next task. The same files are checkpoints:
+a retried or redelivered stage resumes from the furthest completed step
+(pages -> candidates -> assembled -> classified), and persist_stage removes
+them once the job's events are committed.
+"""
 
 from __future__ import annotations
 
 import os
 import sys
+import time
 import uuid
 import traceback
+from typing import Optional
 
-from sqlalchemy import create_engine
+from celery import chain
+from sqlalchemy import create_engine, insert
 from sqlalchemy.orm import Session, sessionmaker
 
-from .celery_app import celery_app
+from .celery_app import FAST_EXTRACT_QUEUE, celery_app
+from .stage_store import clear_stages, find_stage, load_stage, save_stage
 
 # Database setup (sync, since Celery tasks are synchronous).
 # Accept DATABASE_URL or DATABASE_URL_SYNC so Railway Add Reference → Postgres (DATABASE_URL) autofills.
@@ -25,10 +43,44 @@ if DATABASE_URL_SYNC and "@host:" in DATABASE_URL_SYNC:
         file=sys.stderr,
     )
     sys.exit(1)
-_engine = create_engine(DATABASE_URL_SYNC)
+DB_POOL_SIZE = int(os.environ.get("DB_POOL_SIZE", "5"))
+DB_MAX_OVERFLOW = int(os.environ.get("DB_MAX_OVERFLOW", "5"))
+# Pause before process_batch retries a failed job in-process (stage tasks wait 30 s between retries)
+BATCH_RETRY_SECONDS = float(os.environ.get("BATCH_RETRY_SECONDS", "5"))
+
+
+def _create_engine():
+    """Engine with explicit pool sizing (SQLite keeps SQLAlchemy's default pool)."""
+    if DATABASE_URL_SYNC.startswith("sqlite"):
+        return create_engine(DATABASE_URL_SYNC)
+    return create_engine(
+        DATABASE_URL_SYNC,
+        pool_size=DB_POOL_SIZE,
+        max_overflow=DB_MAX_OVERFLOW,
+        pool_pre_ping=True,
+    )
+
+
+# Built at import for the parent and eager/solo runs; prefork children replace it
+# in init_process_engine() so no pooled connection is shared across a fork.
+_engine = _create_engine()
 _SessionLocal = sessionmaker(bind=_engine)
 
 
+def init_process_engine() -> None:
+    """Give this (forked) process its own engine, dropping inherited connections."""
+    global _engine
+    # close=False: leave the parent's sockets alone, just stop using them here
+    _engine.dispose(close=False)
+    _engine = _create_engine()
+    _SessionLocal.configure(bind=_engine)
+
+
+def dispose_engine() -> None:
+    """Close this process's pooled connections (worker process shutdown)."""
+    _engine.dispose()
+
+
 # API's app.models: worker package is worker_app so "app" is free for the API
 _worker_app_dir = os.path.dirname(os.path.abspath(__file__))
 _api_services_dir = os.path.abspath(os.path.join(_worker_app_dir, "..", "..", "api"))
@@ -36,175 +88,415 @@ if _api_services_dir not in sys.path:
     sys.path.insert(0, _api_services_dir)
 from app.models import Job, Event  # noqa: E402
 
+FAST_LANE = "fast"
+
+
+@celery_app.task(name="app.tasks.process_job")
+def process_job(job_id: str, lane: Optional[str] = None) -> dict:
+    """Start the extraction pipeline for a syllabus upload.
 
-@celery_app.task(name="app.tasks.process_job", bind=True, max_retries=2)
-def process_job(self, job_id: str) -> dict:
-    """Main extraction pipeline for a syllabus upload.
+    Steps (one task per queue):
+    A) Load job, set status=processing                        — extract
+    B) Extract text from uploaded file                        — extract
+    C) Find date candidates using regex rules                 — extract
+    D) Assemble events with deterministic classification      — extract
+    E) (Optional) LLM classification                          — llm
+    F) Persist events to DB                                   — persist
+    G) Set final job status                                   — persist
 
-    Steps:
-    A) Load job, set status=processing
-    B) Extract text from uploaded file
-    C) Find date candidates using regex rules
-    D) Assemble events with deterministic classification
-    E) (Optional) LLM classification
-    F) Persist events to DB
-    G) Set final job status
+    lane is the upload's cost estimate: "fast" jobs extract on the "extract_fast"
+    queue so small documents don't wait behind large scanned PDFs.
     """
+    extract = extract_stage.s(job_id)
+    if lane == FAST_LANE:
+        extract = extract.set(queue=FAST_EXTRACT_QUEUE)
+    result = chain(extract, llm_stage.s(), persist_stage.s()).apply_async()
+    return {"job_id": job_id, "lane": lane, "pipeline": result.id}
+
+
+@celery_app.task(name="app.tasks.process_batch")
+def process_batch(job_ids: list[str]) -> dict:
+    """Run the whole pipeline for several jobs of a batch upload, one after another.
+
+    Batch uploads dispatch a group of these (BATCH_TASK_SIZE jobs each) instead of
+    one chain per job: the stages are called in-process, so the jobs share this
+    process's warm modules, compiled rules, DB pool and LLM client, and skip the
+    per-stage broker round trips. A failing job does not stop the rest.
+    """
+    statuses: dict[str, int] = {}
+    for job_id in job_ids:
+        status = _run_batch_job(job_id)
+        statuses[status] = statuses.get(status, 0) + 1
+    return {"jobs": len(job_ids), "statuses": statuses}
+
+
+def _run_batch_job(job_id: str) -> str:
+    """Run one job's stages in-process with the stage tasks' retry budget; returns its status.
+
+    Called directly, a stage's self.retry just re-raises, so the retries happen
+    here: each attempt resumes from the checkpoints the failed one left. Once the
+    job has failed for good, its checkpoints are removed.
+    """
+    max_retries = extract_stage.max_retries
+    for attempt in range(max_retries + 1):
+        try:
+            result = persist_stage(llm_stage(extract_stage(job_id)))
+            return result.get("status") or ("failed" if result.get("error") else "unknown")
+        except Exception as exc:
+            print(f"Batch job {job_id} failed (attempt {attempt + 1} of {max_retries + 1}): {exc}")
+            if attempt < max_retries and BATCH_RETRY_SECONDS > 0:
+                time.sleep(BATCH_RETRY_SECONDS)
+    # The stage that raised has already marked the job failed
+    _clear_job_stages(job_id)
+    return "failed"
+
+
+@celery_app.task(name="app.tasks.extract_stage", bind=True, max_retries=2)
+def extract_stage(self, job_id: str) -> dict:
+    """Steps A-D; hands off the candidates and assembled drafts.
+
+    Extracted pages and found candidates are checkpointed as they complete, so a
+    retry resumes after the last finished step instead of redoing OCR.
+    """
+    from shared.metrics import PipelineRun
+    from shared.schemas import Candidate, PageText
+
     session: Session = _SessionLocal()
+    run = PipelineRun()
 
     try:
         # A) Load job
         job = session.query(Job).filter(Job.id == uuid.UUID(job_id)).first()
         if job is None:
-            return {"error": f"Job {job_id} not found"}
+            return {"job_id": job_id, "done": True, "error": f"Job {job_id} not found"}
 
         job.status = "processing"
         session.commit()
-
-        # B) Extract text
-        from shared.extraction.text_extractor import extract_text
+        run = PipelineRun(job.original_filename)
+        _progress(job_id, "extracting")
 
         file_path = job.upload_path
-        if not os.path.exists(file_path):
-            raise FileNotFoundError(f"Upload file not found: {file_path}")
+        job_dir = os.path.dirname(file_path)
+
+        # Resume from the furthest checkpoint an earlier attempt left behind
+        assembled_ref = find_stage(job_dir, "assembled")
+        if assembled_ref:
+            return {"job_id": job_id, "ref": assembled_ref}
+
+        candidates_ref = find_stage(job_dir, "candidates")
+        if candidates_ref:
+            checkpoint = load_stage(candidates_ref)
+            run.source_kind = checkpoint["source_kind"]
+            candidates = [Candidate.model_validate(c) for c in checkpoint["candidates"]]
+            stage_ms = checkpoint["stage_ms"]
+        else:
+            pages_ref = find_stage(job_dir, "pages")
+            if pages_ref:
+                checkpoint = load_stage(pages_ref)
+                pages = [PageText.model_validate(p) for p in checkpoint["pages"]]
+                run.source_kind = checkpoint["source_kind"]
+                stage_ms = checkpoint["stage_ms"]
+            else:
+                # B) Extract text
+                from shared.extraction.text_extractor import extract_text
+
+                if not os.path.exists(file_path):
+                    raise FileNotFoundError(f"Upload file not found: {file_path}")
+
+                with run.stage("extract"):
+                    pages = extract_text(file_path)
+                    run.set_pages(pages)
+                if not pages:
+                    raise ValueError("No text could be extracted from the uploaded file.")
+                _progress(job_id, "pages", pages=len(pages), ocr_pages=sum(1 for p in pages if p.source_kind == "ocr"))
+                stage_ms = run.summary()
+                save_stage(job_dir, "pages", {
+                    "job_id": job_id,
+                    "source_kind": run.source_kind,
+                    "pages": [p.model_dump(mode="json") for p in pages],
+                    "stage_ms": stage_ms,
+                })
+
+            # C) Find date candidates
+            from shared.extraction.date_finder import find_date_candidates
+
+            with run.stage("find"):
+                candidates = find_date_candidates(pages, filename=job.original_filename)
+            run.count("candidates", len(candidates))
+            _progress(job_id, "candidates", candidates=len(candidates))
+            if not candidates:
+                # No dates found — set to needs_review with a note
+                job.status = "needs_review"
+                job.error_message = "No dates were found in the document. The file may be scanned or contain no schedule information."
+                job.actual_seconds = _total_seconds({**stage_ms, **run.summary()})
+                session.commit()
+                _observe_cost(job)
+                clear_stages(job_dir)
+                _progress(job_id, "done", job.status, events=0)
+                return {"job_id": job_id, "done": True, "events": 0, "status": "needs_review"}
+            stage_ms = {**stage_ms, **run.summary()}
+            save_stage(job_dir, "candidates", {
+                "job_id": job_id,
+                "source_kind": run.source_kind,
+                "candidates": [c.model_dump(mode="json") for c in candidates],
+                "stage_ms": stage_ms,
+            })
 
-        pages = extract_text(file_path)
-        if not pages:
-            raise ValueError("No text could be extracted from the uploaded file.")
+        # D) Assemble events
+        from shared.extraction.event_assembler import AssemblyMemo, assemble_events
+        from shared.extraction.rules import resolve_rule_pack
 
-        # C) Find date candidates
-        from shared.extraction.date_finder import find_date_candidates
+        with run.stage("assemble"):
+            rules = resolve_rule_pack(job.rule_pack, os.environ.get("RULE_PACK_DIR") or None)
+            assembly_memo = AssemblyMemo()
+            event_drafts = assemble_events(candidates, memo=assembly_memo, rules=rules)
+        _progress(job_id, "assembled", events=len(event_drafts))
 
-        candidates = find_date_candidates(pages, filename=job.original_filename)
-        if not candidates:
-            # No dates found — set to needs_review with a note
-            job.status = "needs_review"
-            job.error_message = "No dates were found in the document. The file may be scanned or contain no schedule information."
-            session.commit()
-            return {"job_id": job_id, "events": 0, "status": "needs_review"}
+        ref = save_stage(job_dir, "assembled", {
+            "job_id": job_id,
+            "filename": job.original_filename,
+            "source_kind": run.source_kind,
+            "candidates": [c.model_dump(mode="json") for c in candidates],
+            "drafts": [d.model_dump(mode="json") for d in event_drafts],
+            "assembly_memo": assembly_memo.stats(),
+            "stage_ms": {**stage_ms, **run.summary()},
+        })
+        return {"job_id": job_id, "ref": ref}
 
-        # D) Assemble events
-        from shared.extraction.event_assembler import assemble_events
+    except Exception as exc:
+        session.rollback()
+        _mark_failed(session, job_id, exc)
+        raise self.retry(exc=exc, countdown=30) if self.request.retries < self.max_retries else exc
 
-        event_drafts = assemble_events(candidates)
+    finally:
+        session.close()
+        _export_metrics()
+
+
+@celery_app.task(name="app.tasks.llm_stage", bind=True, max_retries=2)
+def llm_stage(self, handoff: dict) -> dict:
+    """Step E: optional LLM classification of low-confidence/ambiguous/"other" drafts."""
+    if handoff.get("done"):
+        return handoff
+
+    from shared.metrics import PipelineRun
+    from shared.schemas import Candidate, EventDraft
+
+    job_id = handoff["job_id"]
+    try:
+        classified_ref = find_stage(os.path.dirname(handoff["ref"]), "classified")
+        if classified_ref:
+            return {"job_id": job_id, "ref": classified_ref}
 
-        # E) Optional LLM classification
+        state = load_stage(handoff["ref"])
         use_llm = os.environ.get("USE_LLM_CLASSIFIER", "false").lower() == "true"
         llm_api_key = os.environ.get("LLM_API_KEY", "")
-        if use_llm and llm_api_key:
-            try:
-                from shared.extraction.llm_classifier import classify_with_llm_sync
+        llm_provider = os.environ.get("LLM_PROVIDER", "openai")
+        # The "local" provider is an offline stub and needs no key
+        if not (use_llm and (llm_api_key or llm_provider == "local")):
+            return handoff
+
+        run = PipelineRun(state["filename"])
+        run.source_kind = state["source_kind"]
+        candidates = [Candidate.model_validate(c) for c in state["candidates"]]
+        event_drafts = [EventDraft.model_validate(d) for d in state["drafts"]]
+        try:
+            from shared.extraction.llm_classifier import (
+                classify_routed,
+                llm_options_from_env,
+                llm_routing_threshold_from_env,
+            )
 
-                llm_provider = os.environ.get("LLM_PROVIDER", "openai")
-                classifications = classify_with_llm_sync(
-                    candidates=candidates,
+            with run.stage("llm"):
+                llm_routing = classify_routed(
+                    candidates,
+                    event_drafts,
                     provider=llm_provider,
                     api_key=llm_api_key,
+                    threshold=llm_routing_threshold_from_env(),
+                    **llm_options_from_env(),
                 )
-                event_drafts = _apply_llm_classifications(event_drafts, classifications)
-            except Exception as llm_err:
-                # LLM failure is non-fatal — continue with deterministic results
-                print(f"LLM classification failed (non-fatal): {llm_err}")
-
-        # F) Persist events
-        has_ambiguous = False
-        has_low_confidence = False
-
-        for draft in event_drafts:
-            event = Event(
-                id=draft.id,
-                job_id=uuid.UUID(job_id),
-                title=draft.title,
-                description=draft.description,
-                date=draft.date,
-                all_day=draft.all_day,
-                category=draft.category,
-                confidence=draft.confidence,
-                source_page=draft.source_page,
-                source_excerpt=draft.source_excerpt,
-                source_kind=draft.source_kind,
-                is_ambiguous=draft.is_ambiguous,
+            run.count("llm_routed", llm_routing["routed"])
+            _progress(job_id, "llm", routed=llm_routing["routed"], skipped=llm_routing["skipped"])
+            print(
+                f"LLM routing for job {job_id}: {llm_routing['routed']} routed, "
+                f"{llm_routing['skipped']} skipped"
             )
-            session.add(event)
+        except Exception as llm_err:
+            # LLM failure is non-fatal — continue with deterministic results
+            print(f"LLM classification failed (non-fatal): {llm_err}")
+            return handoff
 
-            if draft.is_ambiguous:
-                has_ambiguous = True
-            if draft.confidence < 0.6:
-                has_low_confidence = True
+        state["drafts"] = [d.model_dump(mode="json") for d in event_drafts]
+        state["llm_routing"] = llm_routing
+        state["stage_ms"] = {**state["stage_ms"], **run.summary()}
+        ref = save_stage(os.path.dirname(handoff["ref"]), "classified", state)
+        return {"job_id": job_id, "ref": ref}
 
-        # G) Set final status
-        if has_ambiguous or has_low_confidence:
-            job.status = "needs_review"
-        else:
-            job.status = "ready"
+    except Exception as exc:
+        _mark_failed(None, job_id, exc)
+        raise self.retry(exc=exc, countdown=30) if self.request.retries < self.max_retries else exc
 
-        job.error_message = None
-        session.commit()
+    finally:
+        _export_metrics()
+
+
+@celery_app.task(name="app.tasks.persist_stage", bind=True, max_retries=2)
+def persist_stage(self, handoff: dict) -> dict:
+    """Steps F-G: insert events and set the final job status in one transaction."""
+    if handoff.get("done"):
+        return handoff
+
+    from shared.metrics import PipelineRun
+    from shared.schemas import EventDraft
+
+    job_id = handoff["job_id"]
+    session: Session = _SessionLocal()
+
+    try:
+        state = load_stage(handoff["ref"])
+        run = PipelineRun(state["filename"])
+        run.source_kind = state["source_kind"]
+        event_drafts = [EventDraft.model_validate(d) for d in state["drafts"]]
+
+        job = session.query(Job).filter(Job.id == uuid.UUID(job_id)).first()
+        if job is None:
+            return {"job_id": job_id, "error": f"Job {job_id} not found"}
+
+        # F) Persist events (one multi-row insert, committed with the job status)
+        with run.stage("persist"):
+            # Replace rows from an earlier attempt that committed before failing
+            session.query(Event).filter(Event.job_id == uuid.UUID(job_id)).delete(synchronize_session=False)
+            _insert_events(session, uuid.UUID(job_id), event_drafts)
+            has_ambiguous = any(draft.is_ambiguous for draft in event_drafts)
+            has_low_confidence = any(draft.confidence < 0.6 for draft in event_drafts)
+
+            # G) Set final status
+            if has_ambiguous or has_low_confidence:
+                job.status = "needs_review"
+            else:
+                job.status = "ready"
+
+            job.error_message = None
+            # Measured time for calibrating the upload-time cost estimate (persist itself is negligible)
+            job.actual_seconds = _total_seconds(state["stage_ms"])
+            session.commit()
+        run.count("events", len(event_drafts))
+        _observe_cost(job)
+        _progress(job_id, "done", job.status, events=len(event_drafts))
+        clear_stages(os.path.dirname(handoff["ref"]))
 
         return {
             "job_id": job_id,
             "events": len(event_drafts),
             "status": job.status,
+            "assembly_memo": state["assembly_memo"],
+            "llm_routing": state.get("llm_routing"),
+            "stage_ms": {**state["stage_ms"], **run.summary()},
         }
 
     except Exception as exc:
         session.rollback()
-        # Update job status to failed
-        try:
-            job = session.query(Job).filter(Job.id == uuid.UUID(job_id)).first()
-            if job:
-                job.status = "failed"
-                job.error_message = str(exc)[:1000]
-                session.commit()
-        except Exception:
-            pass
-
+        _mark_failed(session, job_id, exc)
         raise self.retry(exc=exc, countdown=30) if self.request.retries < self.max_retries else exc
 
     finally:
         session.close()
+        _export_metrics()
 
 
-def _apply_llm_classifications(
-    drafts: list,
-    classifications: list,
-) -> list:
-    """Merge LLM classifications into event drafts.
+def _mark_failed(session: Session | None, job_id: str, exc: Exception) -> None:
+    """Set job status to failed (best effort; a retry may still succeed)."""
+    own_session = session is None
+    session = session or _SessionLocal()
+    try:
+        job = session.query(Job).filter(Job.id == uuid.UUID(job_id)).first()
+        if job:
+            job.status = "failed"
+            job.error_message = str(exc)[:1000]
+            session.commit()
+            _progress(job_id, "failed", "failed", error=job.error_message)
+    except Exception:
+        pass
+    finally:
+        if own_session:
+            session.close()
+
 
-    Hard constraints:
-    - Cannot change date
-    - Cannot add new events
+def _clear_job_stages(job_id: str) -> None:
+    """Remove a job's stage checkpoints (best effort)."""
+    session = _SessionLocal()
+    try:
+        job = session.query(Job).filter(Job.id == uuid.UUID(job_id)).first()
+        if job is not None and job.upload_path:
+            clear_stages(os.path.dirname(job.upload_path))
+    except Exception:
+        pass
+    finally:
+        session.close()
+
+
+def _progress(job_id: str, stage: str, status: str = "processing", **detail) -> None:
+    """Publish a progress event for the job's SSE stream (best effort)."""
+    from shared.progress import get_publisher
+
+    get_publisher().publish(job_id, stage, status, **detail)
+
+
+def _insert_events(session: Session, job_id: uuid.UUID, drafts: list) -> None:
+    """Insert event drafts as one bulk INSERT in the session's transaction.
+
+    A list of parameter dicts makes SQLAlchemy use executemany with
+    insertmanyvalues (batched multi-row VALUES on Postgres and SQLite) instead
+    of flushing one ORM object at a time through the unit of work.
     """
-    from shared.schemas import LLMClassification
-
-    # Index classifications by candidate_index
-    cls_map = {}
-    for c in classifications:
-        if isinstance(c, LLMClassification):
-            cls_map[c.candidate_index] = c
-        elif isinstance(c, dict):
-            cls_map[c.get("candidate_index", -1)] = c
-
-    for i, draft in enumerate(drafts):
-        if i in cls_map:
-            cls = cls_map[i]
-            if isinstance(cls, dict):
-                title = cls.get("title")
-                category = cls.get("category")
-                description = cls.get("description")
-                adj = cls.get("confidence_adjustment", 0.0)
-            else:
-                title = cls.title
-                category = cls.category
-                description = cls.description
-                adj = cls.confidence_adjustment
-
-            if title:
-                draft.title = title
-            if category:
-                draft.category = category
-            if description:
-                draft.description = description
-            draft.confidence = round(max(0.10, min(0.99, draft.confidence + adj)), 2)
-
-    return drafts
+    if not drafts:
+        return
+    session.execute(
+        insert(Event),
+        [
+            {
+                "id": draft.id,
+                "job_id": job_id,
+                "title": draft.title,
+                "description": draft.description,
+                "date": draft.date,
+                "all_day": draft.all_day,
+                "category": draft.category,
+                "confidence": draft.confidence,
+                "source_page": draft.source_page,
+                "source_excerpt": draft.source_excerpt,
+                "source_kind": draft.source_kind,
+                "is_ambiguous": draft.is_ambiguous,
+            }
+            for draft in drafts
+        ],
+    )
+
+
+def _total_seconds(stage_ms: dict) -> float:
+    return round(sum(stage_ms.values()) / 1000, 2)
+
+
+def _observe_cost(job: Job) -> None:
+    """Record the job's estimated and measured cost for lane calibration."""
+    from shared.metrics import JOB_COST
+
+    lane = job.lane or "unknown"
+    if job.estimated_seconds is not None:
+        JOB_COST.observe(job.estimated_seconds, lane=lane, kind="estimated")
+    if job.actual_seconds is not None:
+        JOB_COST.observe(job.actual_seconds, lane=lane, kind="actual")
+
+
+def _export_metrics() -> None:
+    """Write this process's metrics for scraping when METRICS_DIR is set (non-fatal)."""
+    metrics_dir = os.environ.get("METRICS_DIR")
+    if not metrics_dir:
+        return
+    try:
+        from shared.metrics import write_textfile
+
+        write_textfile(metrics_dir, extra_labels={"worker": str(os.getpid())})
+    except Exception as exc:
+        print(f"Metrics export failed (non-fatal): {exc}")